@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark of a checking on a generated website.
+
+Usage: python benchmarks/crawl.py --help
+"""
+
+from argparse import ArgumentParser
+import logging
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.site import Site  # noqa: E402
+from blc.async_checker import AsyncChecker  # noqa: E402
+from blc.checker import Checker  # noqa: E402
+from blc.sharded_checker import ShardedChecker  # noqa: E402
+from blc.extractor import EXTRACTORS  # noqa: E402
+from blc.timing import Metrics  # noqa: E402
+
+
+def serve(site: Site, address: multiprocessing.Queue) -> None:
+    """Run the website in its own process."""
+    server = site.server()
+    address.put(server.server_address)
+    server.serve_forever()
+
+
+def peak_rss() -> float:
+    """Get the peak of memory used by the process in MiB."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # NB: The size is in bytes on macOS and in KiB elsewhere
+    return rss / 1048576 if sys.platform == 'darwin' else rss / 1024
+
+
+def main(args: list) -> None:
+    """Run the benchmark."""
+    parser = ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--pages', type=int, default=500,
+                        help='number of webpages of the website')
+    parser.add_argument('--fanout', type=int, default=10,
+                        help='number of links of each webpage')
+    parser.add_argument('--broken', type=float, default=0.05,
+                        help='share of broken links')
+    parser.add_argument('--latency', type=float, default=0.005,
+                        help='time to answer a request in seconds')
+    parser.add_argument('--size', type=int, default=10000,
+                        help='size of each webpage in bytes')
+    parser.add_argument('--engine', choices=['serial', 'async', 'sharded'],
+                        default='serial')
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--processes', type=int, default=None,
+                        help='number of worker processes (sharded engine)')
+    parser.add_argument('--extractor', choices=list(EXTRACTORS),
+                        default='regex')
+    args = parser.parse_args(args)
+
+    logging.disable(logging.CRITICAL)
+
+    # We start the website
+    site = Site(args.pages, args.fanout, args.broken, args.latency, args.size)
+    address = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=serve, args=(site, address), daemon=True)
+    server.start()
+    host = 'http://%s:%s/' % address.get()
+
+    options = {}
+    checker_class = Checker
+    if args.engine == 'async':
+        checker_class = AsyncChecker
+        options['concurrency'] = args.concurrency
+    elif args.engine == 'sharded':
+        checker_class = ShardedChecker
+        options['concurrency'] = args.concurrency
+        options['processes'] = args.processes
+
+    # We measure each phase of the checking
+    metrics = Metrics()
+    checker = checker_class(
+        host, delay=0, max_per_host=args.concurrency,
+        extractor=args.extractor, metrics=metrics, **options)
+
+    start = time.perf_counter()
+    checker.run()
+    duration = time.perf_counter() - start
+
+    server.terminate()
+
+    broken = sum(1 for i in checker.urls.values() if not i['result'][0])
+    print(
+        f'Website:  {site.pages} webpages, {site.fanout} links per webpage,'
+        f' {site.size} bytes, {site.latency * 1000:g} ms of latency\n'
+        f'Checker:  {args.engine} engine, {args.extractor} extractor\n'
+        f'URLs:     {len(checker.urls)} checked, {broken} broken\n'
+        f'Duration: {duration:.2f} s, {len(checker.urls) / duration:.1f}'
+        ' URLs/s\n'
+        f'Memory:   {peak_rss():.1f} MiB at peak\n'
+        f'Phases:\n{metrics.report()}'
+    )
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the extractors of link URLs.
+
+Usage: python benchmarks/extractor.py [number of copies] [number of rounds]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from blc.extractor import EXTRACTORS  # noqa: E402
+
+path = os.path.join(os.path.dirname(__file__), '..', 'tests')
+
+
+def extract(extractor, data: str) -> list:
+    """Extract the URLs of a source."""
+    extractor = extractor()
+    extractor.feed(data)
+    extractor.close()
+    return extractor.urls
+
+
+def main(copies: int = 200, rounds: int = 5) -> None:
+    """Compare the extractors on the webpages of the tests."""
+    data = ''
+    for name in ['data.html', 'data2.html', 'data.rss']:
+        with open(os.path.join(path, name), 'r') as f:
+            data += f.read()
+    # We simulate a big webpage
+    data *= copies
+
+    print(f'Source of {len(data) / 1024:.0f} KiB, best of {rounds} rounds')
+    for name, extractor in EXTRACTORS.items():
+        duration = min(timeit.repeat(
+            lambda: extract(extractor, data), number=1, repeat=rounds))
+        print(
+            f'{name:>8}: {duration * 1000:8.2f} ms'
+            f' {len(data) / 1048576 / duration:8.2f} MiB/s'
+            f' {len(extract(extractor, data)):8} URLs'
+        )
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:3]])
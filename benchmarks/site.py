@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic website for the benchmarks.
+
+Usage: python benchmarks/site.py host port [pages] [fanout] [broken]
+    [latency] [size]
+"""
+
+from http.server import BaseHTTPRequestHandler
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.server import ThreadingSimpleServer  # noqa: E402
+
+# Represent the words used to fill the webpages
+WORDS = [
+    ''.join(random.Random(i).choices('abcdefghijklmnopqrstuvwxyz', k=6))
+    for i in range(2048)
+]
+
+
+class Site:
+    """
+    Represent a generated website.
+
+    The webpage n links to the webpages n * fanout + 1 to
+    n * fanout + fanout, so all the webpages are reachable from the home.
+
+    :pages represent the number of webpages
+    :fanout represent the number of links of each webpage
+    :broken represent the share of broken links
+    :latency represent the time to answer a request in seconds
+    :size represent the size of each webpage in bytes
+    """
+
+    def __init__(self, pages: int = 500, fanout: int = 10,
+                 broken: float = 0.05, latency: float = 0.005,
+                 size: int = 10000):
+        """Init the website."""
+        self.pages = max(1, pages)
+        self.fanout = fanout
+        self.broken = broken
+        self.latency = latency
+        self.size = size
+
+    def links(self, n: int) -> list:
+        """Get the links of the webpage n."""
+        rand = random.Random(n)
+        links = []
+        for i in range(self.fanout):
+            if rand.random() < self.broken:
+                links.append(f'/missing/{n}-{i}')
+            else:
+                links.append(f'/page/{(n * self.fanout + i + 1) % self.pages}')
+        return links
+
+    def page(self, n: int) -> bytes:
+        """Get the content of the webpage n."""
+        rand = random.Random(-n - 1)
+        body = ''.join(
+            f'<li><a href="{link}">{link}</a></li>\n'
+            for link in self.links(n))
+
+        # Each webpage has his own text, else they would be similar
+        words = []
+        length = len(body)
+        while length < self.size:
+            word = rand.choice(WORDS)
+            words.append(word)
+            length += len(word) + 1
+
+        return (
+            '<!DOCTYPE html>\n<html><head>'
+            f'<title>Page {n}</title></head><body>\n'
+            f'<ul>\n{body}</ul>\n<p>{" ".join(words)}</p>\n'
+            '</body></html>\n'
+        ).encode()
+
+    def handler(self) -> type:
+        """Get the request handler of the website."""
+        site = self
+
+        class SiteServer(BaseHTTPRequestHandler):
+            """Define the behavior of the server."""
+
+            def send_page(self, with_body: bool) -> None:
+                """Send a webpage or an error."""
+                time.sleep(site.latency)
+
+                data = None
+                if self.path == '/':
+                    data = site.page(0)
+                elif self.path.startswith('/page/'):
+                    n = self.path[len('/page/'):]
+                    if n.isdigit() and int(n) < site.pages:
+                        data = site.page(int(n))
+
+                if data is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-type", "text/html")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                if with_body:
+                    self.wfile.write(data)
+
+            def do_GET(self):
+                """Send a webpage."""
+                self.send_page(True)
+
+            def do_HEAD(self):
+                """Send the headers of a webpage."""
+                self.send_page(False)
+
+            def log_message(self, format, *args):
+                """Don't log the requests."""
+                pass
+
+        return SiteServer
+
+    def server(self, host: str = 'localhost', port: int = 0):
+        """Get a server of the website, a free port is used by default."""
+        return ThreadingSimpleServer((host, port), self.handler())
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Host and Port required")
+        sys.exit(1)
+
+    site = Site(*[
+        cast(value) for cast, value in zip(
+            [int, int, float, float, int], sys.argv[3:])
+    ])
+    server = site.server(sys.argv[1], int(sys.argv[2]))
+    print("Server started http://%s:%s" % server.server_address)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+    server.server_close()
+    print("Server stopped.")
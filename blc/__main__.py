@@ -4,12 +4,30 @@
 
 
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from .checker import Checker
+from .async_checker import AsyncChecker
+from .sharded_checker import ShardedChecker
+from .extractor import EXTRACTORS
+from .cache import CrawlCache, ResultCache
+from .renderer import Renderer
+from .sink import SINKS
+from .checkpoint import Checkpoint
+from .session import DNSCache, new_session
+from .retry import RetryPolicy
+from .timing import Metrics, Profiler
+from .canonical import Canonicalizer
+from .budget import CrawlBudget
+from .trap import TrapDetector
 from .notifier import Notifier
 from configparser import ConfigParser
+from urllib.parse import quote
+import collections
+import importlib
+import os
 import sys
 import logging
-# import threading
+import threading
 import coloredlogs
 
 
@@ -21,6 +39,69 @@ logging.basicConfig(
 )
 
 
+def build_report(checker: Checker, sink) -> str:
+    """
+    Build the report of a website.
+
+    :checker represent the checker of the website
+    :sink represent the stream of the results
+    """
+    target = checker.host
+    msg = f"--------------\nReport of {target}\n--------------"
+    # We warn that some URLs were not checked
+    if checker.crawl_budget and checker.crawl_budget.partial:
+        msg += f"\n{checker.crawl_budget.report(checker.unchecked())}\n"
+    if checker.traps.suspects:
+        msg += (
+            "\nSuspected traps, not checked:\n"
+            f"{checker.traps.report()}\n"
+        )
+    if sink.counts[target]:
+        for info in sink.broken[target]:
+            # The parents and the spellings found after the checking
+            # of the URL are in the checker
+            record = checker.urls[info['url']]
+            msg += (
+                "\n"
+                f"URL:        {info['url']}\n"
+                f"Parent URL: {record['parent']}\n"
+                f"Real URL:   {info['real_url']}\n"
+            )
+            if record['aliases']:
+                msg += f"Aliases:    {' '.join(record['aliases'])}\n"
+            msg += (
+                f"Check time: {round(info['check_time'] or 0, 4)}"
+                " seconds\n"
+                f"Result:     {info['status']} -> {info['reason']}\n"
+            )
+            if info['attempts']:
+                msg += f"Retries:    {info['attempts']}\n"
+        msg += (
+            f"\nThats it. {len(sink.broken[target])} errors"
+            f" in {sink.counts[target]} links found"
+            f" ({sink.flaky[target]} flaky).\n"
+            "--------------\n\n"
+        )
+    else:
+        pass
+    return msg
+
+
+def build_attachment(checker: Checker, sink) -> tuple:
+    """
+    Build the file of the broken links of a website.
+
+    :checker represent the checker of the website
+    :sink represent the stream of the results
+    :return the filename, the content and the type of the file
+    """
+    return (
+        quote(checker.host, safe='') + '.' + sink.EXTENSION,
+        sink.dumps(sink.broken[checker.host]),
+        sink.MIMETYPE,
+    )
+
+
 def main(args):
     """Do something."""
     # parse values from a configuration file if provided and use those as the
@@ -41,6 +122,58 @@ def main(args):
         "smtp_server": None,
         "recipient": None,
         "browser_sleep": None,
+        "engine": "serial",
+        "concurrency": None,
+        "processes": None,
+        "max_per_host": None,
+        "extractor": "regex",
+        "similarity": None,
+        "cache_dir": None,
+        "cache_ttl": None,
+        "cache_size": None,
+        "parallel": None,
+        "max_requests": None,
+        "browser_pages": None,
+        "render_pattern": None,
+        "render_empty": False,
+        "max_parents": None,
+        "output": None,
+        "output_format": None,
+        "checkpoint_dir": None,
+        "resume": False,
+        "max_download_size": None,
+        "pool_hosts": None,
+        "pool_size": None,
+        "pool_block": False,
+        "connect_timeout": None,
+        "read_timeout": None,
+        "dns_ttl": None,
+        "retries": None,
+        "retry_backoff": None,
+        "retry_budget": None,
+        "robots": False,
+        "sitemap": False,
+        "timings": False,
+        "profile": None,
+        "metrics_hook": None,
+        "allow_params": None,
+        "deny_params": None,
+        "sort_params": False,
+        "ignore_case": False,
+        "ignore_trailing_slash": False,
+        "internal_origins": None,
+        "max_depth": None,
+        "max_pages": None,
+        "max_bytes": None,
+        "max_time": None,
+        "max_url_length": None,
+        "max_repeats": None,
+        "max_query_variants": None,
+        "max_template_urls": None,
+        "per_target": False,
+        "target_recipient": None,
+        "attach": False,
+        "smtp_pool": None,
     }
 
     if not config_args.debug:
@@ -70,7 +203,8 @@ def main(args):
         parser.add_argument('host', type=str,
                             help='Eg: http://example.com')
     parser.add_argument('-d', '--delay', type=float,
-                        help='It represent the delay between each request')
+                        help='It represent the delay between each request'
+                             ' on a same host')
     parser.add_argument('-s', '--sender', type=str,
                         help='It represent the email used to send the report')
     parser.add_argument('-p', '--password', type=str,
@@ -80,11 +214,176 @@ def main(args):
                              ' used to send the report')
     parser.add_argument('-r', '--recipient', type=str,
                         help='It represent the email where send the report')
+    parser.add_argument('--target-recipient', type=str, action='append',
+                        help='It represent the email where send the report'
+                             ' of a website (Eg: http://example.com=a@b.c)')
+    parser.add_argument('--per-target', action='store_true',
+                        help='Send the report of each website as soon as'
+                             ' his checking is finished')
+    parser.add_argument('--attach', action='store_true',
+                        help='Attach the broken links to the report'
+                             ' (in the output format)')
+    parser.add_argument('--smtp-pool', type=int,
+                        help='It represent the number of SMTP connections'
+                             ' used to send the reports')
     parser.add_argument('-n', '--deep-scan', action='store_true',
                         help='Enable the deep scan')
     parser.add_argument('-b', '--browser_sleep', type=float,
                         help='Enable browser extension '
                         '(if params used) and set his sleep time')
+    parser.add_argument('-e', '--engine', type=str,
+                        choices=['serial', 'async', 'sharded'],
+                        help='It represent the engine used to check the URLs')
+    parser.add_argument('-j', '--concurrency', type=int,
+                        help='It represent the maximum number of requests'
+                             ' in flight (async and sharded engines only)')
+    parser.add_argument('--processes', type=int,
+                        help='It represent the number of worker processes'
+                             ' (sharded engine only)')
+    parser.add_argument('--max-per-host', type=int,
+                        help='It represent the maximum number of requests'
+                             ' in flight on a same host')
+    parser.add_argument('-x', '--extractor', type=str,
+                        choices=list(EXTRACTORS),
+                        help='It represent the method used to find'
+                             ' the URLs inside a webpage')
+    parser.add_argument('--similarity', type=float,
+                        help='It represent the similarity (between 0 and 1)'
+                             ' from which a webpage is skipped as'
+                             ' near-duplicate of a webpage already seen')
+    parser.add_argument('--cache-dir', type=str,
+                        help='It represent the directory where the webpages'
+                             ' checked are kept for the next runs')
+    parser.add_argument('--cache-ttl', type=float,
+                        help='It represent the lifetime in seconds'
+                             ' of the result of a foreign URL')
+    parser.add_argument('--cache-size', type=int,
+                        help='It represent the maximum number of results'
+                             ' of foreign URLs kept in memory')
+    parser.add_argument('-P', '--parallel', type=int,
+                        help='It represent the number of hosts'
+                             ' checked at the same time')
+    parser.add_argument('--max-requests', type=int,
+                        help='It represent the maximum number of requests'
+                             ' in flight for all the hosts')
+    parser.add_argument('--browser-pages', type=int,
+                        help='It represent the number of webpages'
+                             ' rendered at the same time by the browser'
+                             ' (with the async or sharded engine)')
+    parser.add_argument('--render-pattern', type=str,
+                        help='Render only the URLs who match this regex')
+    parser.add_argument('--render-empty', action='store_true',
+                        help='Render only the webpages without URL'
+                             ' (or matching the render pattern)')
+    parser.add_argument('--max-parents', type=int,
+                        help='It represent the maximum number of parent URLs'
+                             ' kept for each URL (all by default)')
+    parser.add_argument('-o', '--output', type=str,
+                        help='It represent the file where each URL checked'
+                             ' is written at once (- for the stdout,'
+                             ' the report is then written to the stderr)')
+    parser.add_argument('--output-format', type=str,
+                        choices=list(SINKS),
+                        help='It represent the format of the output'
+                             ' (by default, in function of the extension)')
+    parser.add_argument('--checkpoint-dir', type=str,
+                        help='It represent the directory where the'
+                             ' progression of each host is saved')
+    parser.add_argument('--resume', action='store_true',
+                        help='Resume the checking saved inside the'
+                             ' checkpoint directory')
+    parser.add_argument('--max-download-size', type=int,
+                        help='It represent the maximum number of bytes'
+                             ' read of a webpage (1 MiB by default)')
+    parser.add_argument('--pool-hosts', type=int,
+                        help='It represent the number of hosts whose'
+                             ' connections are kept alive, each host has'
+                             ' his own pool')
+    parser.add_argument('--pool-size', type=int,
+                        help='It represent the number of connections'
+                             ' kept alive by host, not in total')
+    parser.add_argument('--pool-block', action='store_true',
+                        help='Wait a free connection of the pool of the host'
+                             ' instead of opening a connection who will be'
+                             ' closed (the limit is by host)')
+    parser.add_argument('--connect-timeout', type=float,
+                        help='It represent the maximum time in seconds'
+                             ' to open a connection')
+    parser.add_argument('--read-timeout', type=float,
+                        help='It represent the maximum time in seconds'
+                             ' to wait the server between two bytes')
+    parser.add_argument('--dns-ttl', type=float,
+                        help='It represent the time in seconds during which'
+                             ' the address of a host is kept (0 to disable)')
+    parser.add_argument('--retries', type=int,
+                        help='It represent the maximum number of retries'
+                             ' of an URL after a transient error')
+    parser.add_argument('--retry-backoff', type=float,
+                        help='It represent the delay in seconds before'
+                             ' the first retry, doubled at each retry')
+    parser.add_argument('--retry-budget', type=int,
+                        help='It represent the maximum number of retries'
+                             ' for all the hosts')
+    parser.add_argument('--robots', action='store_true',
+                        help='Respect the disallow rules and the crawl-delay'
+                             ' of the robots.txt of each host')
+    parser.add_argument('--sitemap', action='store_true',
+                        help='Add the URLs of the sitemaps of each host'
+                             ' before the crawling')
+    parser.add_argument('--timings', action='store_true',
+                        help='Add the histogram of the time of each phase'
+                             ' of the checking to the report')
+    parser.add_argument('--profile', type=str,
+                        help='It represent the file where the statistics'
+                             ' of cProfile are written (one checking'
+                             ' profiled at a time)')
+    parser.add_argument('--metrics-hook', type=str, action='append',
+                        help='It represent a function (module:function)'
+                             ' called with the timings of each URL')
+    parser.add_argument('--allow-params', type=str,
+                        help='It represent the query parameters kept,'
+                             ' separated by a comma (Eg: page,id)')
+    parser.add_argument('--deny-params', type=str,
+                        help='It represent the query parameters removed,'
+                             ' separated by a comma (Eg: utm_*,fbclid)')
+    parser.add_argument('--sort-params', action='store_true',
+                        help='Sort the query parameters to compare'
+                             ' the URLs')
+    parser.add_argument('--ignore-case', action='store_true',
+                        help='Ignore the case of the path to compare'
+                             ' the URLs')
+    parser.add_argument('--ignore-trailing-slash', action='store_true',
+                        help='Ignore the slash at the end of the path'
+                             ' to compare the URLs')
+    parser.add_argument('--internal-origins', type=str,
+                        help='It represent the other origins of the website'
+                             ' whose the webpages are checked too, separated'
+                             ' by a comma (Eg: cdn.example.com,*.example.com)')
+    parser.add_argument('--max-depth', type=int,
+                        help='It represent the maximum number of links'
+                             ' followed from the website to an URL')
+    parser.add_argument('--max-pages', type=int,
+                        help='It represent the maximum number of URLs'
+                             ' checked by host')
+    parser.add_argument('--max-bytes', type=int,
+                        help='It represent the maximum number of bytes'
+                             ' downloaded by website')
+    parser.add_argument('--max-time', type=float,
+                        help='It represent the maximum duration in seconds'
+                             ' of the checking of a website')
+    parser.add_argument('--max-url-length', type=int,
+                        help='It represent the maximum length of an URL,'
+                             ' beyond the URL is a trap (0 to disable)')
+    parser.add_argument('--max-repeats', type=int,
+                        help='It represent the maximum number of times'
+                             ' a segment appears in a path (0 to disable)')
+    parser.add_argument('--max-query-variants', type=int,
+                        help='It represent the maximum number of queries'
+                             ' checked for a same path (0 to disable)')
+    parser.add_argument('--max-template-urls', type=int,
+                        help='It represent the maximum number of URLs'
+                             ' checked for a same path whose the numbers'
+                             ' are replaced (disabled by default)')
     args = parser.parse_args()
 
     # We verify the dependency
@@ -94,87 +393,306 @@ def main(args):
             and not (args.sender and args.password
                      and args.smtp_server and args.recipient)):
         parser.error('bad configuration of the notifier')
+    elif args.resume and not args.checkpoint_dir:
+        parser.error('the checkpoint directory is required to resume')
+    elif ((args.per_target or args.target_recipient)
+            and not args.smtp_server):
+        parser.error('the notifier is required to send the reports')
     else:
         pass
 
-    report = {}
-    # checker_threads = []
-    conn = None
+    # The reports are sent to the recipient, except the websites
+    # who have their own recipient
+    recipients = {}
+    for item in args.target_recipient or []:
+        target, sep, recipient = item.rpartition('=')
+        if not sep or not target or not recipient:
+            parser.error('bad recipient of a website: %s' % item)
+        recipients[target] = recipient
+
+    # We initialize the notifier, the reports are sent in background
+    notifier = None
+    if args.smtp_server:
+        notifier = Notifier(
+            smtp_server=args.smtp_server,
+            username=args.sender,
+            password=args.password,
+            pool_size=args.smtp_pool or 2,
+        )
+
+    # We give the timings of each URL to the hooks
+    metrics = Metrics()
+    for hook in args.metrics_hook or []:
+        module, _, name = hook.partition(':')
+        try:
+            metrics.subscribe(getattr(importlib.import_module(module), name))
+        except (ImportError, AttributeError, ValueError) as err:
+            parser.error('bad metrics hook %s: %s' % (hook, err))
+
+    # We compare the URLs by their canonical form
+    canonicalizer = Canonicalizer(
+        allow_params=(
+            args.allow_params.split(',') if args.allow_params else None),
+        deny_params=(
+            args.deny_params.split(',') if args.deny_params else None),
+        sort_params=args.sort_params,
+        ignore_case=args.ignore_case,
+        ignore_slash=args.ignore_trailing_slash,
+    )
+
+    # We profile the checking of the URLs
+    profiler = Profiler(args.profile) if args.profile else None
+
+    checkers = []
+
+    # Timeouts of the connection and of the reading
+    timeout = (
+        args.connect_timeout if args.connect_timeout is not None else 2,
+        args.read_timeout if args.read_timeout is not None else 2,
+    )
+
+    # We share the browser between the checkers
+    renderer = None
+    if args.browser_sleep is not None:
+        renderer = Renderer(sleep=args.browser_sleep, timeout=timeout[1],
+                            pages=args.browser_pages or 2)
+
+    # We share a budget of requests between the checkers
+    max_requests = args.max_requests or 20
+    budget = threading.BoundedSemaphore(max_requests)
+
+    # We share the connections between the checkers
+    conn = new_session(
+        pool_hosts=args.pool_hosts or max_requests,
+        pool_size=args.pool_size or max(10, args.max_per_host or 4),
+        pool_block=args.pool_block,
+    )
+
+    # We resolve each host once
+    dns_ttl = args.dns_ttl if args.dns_ttl is not None else 300
+    dns_cache = None
+    if dns_ttl > 0:
+        dns_cache = DNSCache(ttl=dns_ttl)
+        dns_cache.install()
+
+    # We share the budget of retries between the checkers
+    retries = args.retries if args.retries is not None else 2
+    retry = None
+    if retries > 0:
+        retry = RetryPolicy(
+            max_retries=retries,
+            backoff=(
+                args.retry_backoff if args.retry_backoff is not None
+                else 0.5),
+            budget=(
+                args.retry_budget if args.retry_budget is not None
+                else 100),
+        )
+
+    # We share the caches between the checkers
+    cache = CrawlCache(args.cache_dir) if args.cache_dir else None
+    results = ResultCache(
+        ttl=args.cache_ttl if args.cache_ttl is not None else 86400,
+        max_size=args.cache_size or 10000,
+        directory=args.cache_dir,
+    )
+
+    # We write the results while the checking
+    output_format = args.output_format or (
+        'csv' if args.output and args.output.endswith('.csv') else 'jsonl')
+    try:
+        sink = SINKS[output_format](args.output)
+    except OSError as err:
+        print(err)
+        sys.exit(1)
 
     for target in args.host.split(','):
+        # We save the progression of the checker
+        checkpoint = None
+        if args.checkpoint_dir:
+            os.makedirs(args.checkpoint_dir, exist_ok=True)
+            checkpoint = Checkpoint(
+                os.path.join(args.checkpoint_dir,
+                             quote(target, safe='') + '.jsonl'),
+                resume=args.resume)
+
+        # We limit the crawling of the website
+        crawl_budget = None
+        if (args.max_depth is not None or args.max_pages
+                or args.max_bytes or args.max_time):
+            crawl_budget = CrawlBudget(
+                max_depth=args.max_depth,
+                max_pages=args.max_pages,
+                max_bytes=args.max_bytes,
+                max_time=args.max_time,
+            )
+
+        # We detect the crawler traps of the website
+        trap_detector = TrapDetector(
+            max_length=(
+                args.max_url_length
+                if args.max_url_length is not None else 2048),
+            max_repeats=(
+                args.max_repeats if args.max_repeats is not None else 3),
+            max_queries=(
+                args.max_query_variants
+                if args.max_query_variants is not None else 100),
+            max_template=args.max_template_urls or 0,
+        )
+
         # We initialize the checker
-        checker = Checker(
+        options = {}
+        if args.engine == 'async':
+            checker_class = AsyncChecker
+            options['concurrency'] = args.concurrency or 10
+        elif args.engine == 'sharded':
+            checker_class = ShardedChecker
+            options['concurrency'] = args.concurrency or 10
+            options['processes'] = args.processes
+            options['dns_ttl'] = dns_ttl if dns_cache else None
+        else:
+            checker_class = Checker
+
+        checker = checker_class(
             target,
             delay=args.delay if args.delay is not None else 1.0,
             deep_scan=args.deep_scan,
             browser_sleep=args.browser_sleep,
+            max_per_host=args.max_per_host or 4,
+            extractor=args.extractor,
+            similarity=(
+                args.similarity if args.similarity is not None else 0.9),
+            cache=cache,
+            results=results,
+            budget=budget,
+            conn=conn,
+            timeout=timeout,
+            retry=retry,
+            metrics=metrics,
+            profiler=profiler,
+            canonicalizer=canonicalizer,
+            internal_origins=(
+                args.internal_origins.split(',')
+                if args.internal_origins else None),
+            crawl_budget=crawl_budget,
+            trap_detector=trap_detector,
+            renderer=renderer,
+            render_pattern=args.render_pattern,
+            render_empty=args.render_empty,
+            max_parents=args.max_parents,
+            sink=sink,
+            checkpoint=checkpoint,
+            max_download_size=args.max_download_size or 1048576,
+            **options,
         )
-        if conn:
-            checker.conn = conn
-        else:
-            conn = checker.conn
-        # We config the shared dict
-        report[target] = checker.urls
+        if args.resume:
+            checker.resume()
+        if args.robots or args.sitemap:
+            checker.seed(robots=args.robots, sitemap=args.sitemap)
+        checkers.append(checker)
 
-        # t = threading.Thread(target=checker.run)
-        # checker_threads.append(t)
-        # t.daemon = True
+    # Will represent the sendings of the reports
+    sendings = []
 
-        checker.run()
+    # We start the checkers
+    with ThreadPoolExecutor(args.parallel or 4) as executor:
+        futures = {}
+        for checker in checkers:
+            logging.info('Checking of %s' % checker.host)
+            futures[executor.submit(checker.run)] = checker
 
-    # We initialize the notifier
-    notifier = Notifier(
-        smtp_server=args.smtp_server,
-        username=args.sender,
-        password=args.password,
-    )
+        # We wait for the completion
+        for future in as_completed(futures):
+            checker = futures[future]
+            try:
+                future.result()
+            except Exception:
+                logging.exception('Checking of %s failed' % checker.host)
 
-    # We start the checkers
-    # for thread in checker_threads:
-    #    logging.info('Checking of %s' % args.host)
-    #    thread.start()
-
-    # We wait for the completion
-    # [thread.join() for thread in checker_threads]
-
-    # We build the report
-    msg = 'Hello, the report of the broken link checker is ready.\n'
-    for target in report:
-        msg += f"--------------\nReport of {target}\n--------------"
-        if report[target]:
-            acc = 0
-            for url, info in report[target].items():
-                if not info['result'][0]:
-                    msg += (
-                        "\n"
-                        f"URL:        {url}\n"
-                        f"Parent URL: {info['parent']}\n"
-                        f"Real URL:   {info['url']}\n"
-                        f"Check time: {round(info['check_time'], 4)} seconds\n"
-                        f"Result:     {info['result'][1]} ->"
-                        f" {info['result'][2]}\n"
-                    )
-                    acc += 1
-                else:
-                    pass
-            msg += (
-                f"\nThats it. {acc} errors in {len(report[target])}"
-                " links found.\n"
-                "--------------\n\n"
-            )
+            # We notify the team of the website at once
+            if args.per_target:
+                recipient = recipients.get(checker.host, args.recipient)
+                logging.info('Sending of the report of %s to %s...'
+                             % (checker.host, recipient))
+                sendings.append(notifier.submit(
+                    recipient=recipient,
+                    subject=f'Broken links found on {checker.host}',
+                    body=(
+                        'Hello, the report of the broken link checker'
+                        ' is ready.\n' + build_report(checker, sink)),
+                    attachments=(
+                        [build_attachment(checker, sink)]
+                        if args.attach else None),
+                ))
+
+    if cache:
+        cache.close()
+    results.close()
+    if renderer:
+        renderer.close()
+    sink.close()
+    if profiler:
+        profiler.dump()
+
+    # The workers of the sharded checkers have their own pools
+    pool_stats = collections.Counter(conn.adapters['http://'].stats())
+    for checker in checkers:
+        if isinstance(checker, ShardedChecker):
+            pool_stats.update(checker.pool_stats)
+    logging.debug(
+        'Pool of connections: %(hosts)i hosts, %(connections)i connections'
+        ' opened for %(requests)i requests, %(idle)i idle'
+        % pool_stats)
+    if dns_cache:
+        logging.debug(
+            'DNS cache: %(hosts)i hosts, %(hits)i hits, %(misses)i misses'
+            % dns_cache.stats())
+        dns_cache.uninstall()
+    for checker in checkers:
+        if checker.checkpoint:
+            checker.checkpoint.close()
+
+    # We send the reports of the websites without their own recipient
+    # together, the other reports alone
+    batches = {}
+    if not args.per_target:
+        for checker in checkers:
+            recipient = recipients.get(checker.host, args.recipient)
+            batches.setdefault(recipient, []).append(checker)
+
+    for recipient, batch in batches.items():
+        # We build the report
+        msg = 'Hello, the report of the broken link checker is ready.\n'
+        for checker in batch:
+            msg += build_report(checker, sink)
+
+        if args.timings:
+            msg += f"Timings of the phases:\n{metrics.report()}\n"
+
+        # We verify if the email notifier is configured
+        if notifier:
+            # We notify the admin
+            logging.info('Sending of the report to %s...' % recipient)
+            sendings.append(notifier.submit(
+                subject='Broken links found',
+                body=msg,
+                recipient=recipient,
+                attachments=(
+                    [build_attachment(checker, sink) for checker in batch]
+                    if args.attach else None),
+            ))
         else:
-            pass
+            # NB: The stdout can be the stream of the results
+            print(msg, file=sys.stderr if args.output == '-' else sys.stdout)
 
-    # We verify if the email notifier is configured
-    if args.smtp_server:
-        # We notify the admin
-        logging.info('Sending of the report to %s...' % args.recipient)
-        notifier.send(
-            subject='Broken links found',
-            body=msg or "No broken url found\n",
-            recipient=args.recipient)
-    else:
-        print(msg)
+    if notifier:
+        # We wait the sending of the reports
+        notifier.close()
+
+        # The errors are logged by the notifier, a report not sent
+        # must be seen by the scheduler of the checking
+        if any(future.exception() for future in sendings):
+            sys.exit(1)
 
 
 if __name__ == '__main__':
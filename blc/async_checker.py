@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Asynchronous checker module."""
+
+from concurrent.futures import ThreadPoolExecutor
+from .checker import Checker
+import asyncio
+
+
+class AsyncChecker(Checker):
+    """
+    Check if an broken URL is present inside a website.
+
+    Unlike the Checker, several URLs are checked at the same time,
+    the scheduler keeps the delay and the limit of requests of each host.
+    The result is stored in the same way inside the attribute urls.
+
+    :concurrency represent the maximum number of requests in flight
+    """
+
+    def __init__(self, host: str, concurrency: int = 10, **kwargs):
+        """Init the checker."""
+        super().__init__(host, **kwargs)
+
+        # Maximum number of requests in flight
+        self.concurrency = max(1, concurrency)
+
+    def next_url(self) -> str:
+        """Get the next URL whose the host is ready to be requested."""
+        # The URLs on hold have the priority
+        url = self.scheduler.unpark()
+        if url:
+            return url
+
+        while self.frontier:
+            url = self.frontier.pop()
+            if url is None:
+                # The URLs to check again wait their time
+                break
+            elif self.from_cache(url):
+                self.task_done(url)
+            elif self.scheduler.wait_time(url) == 0:
+                return url
+            else:
+                # The host is busy, we put the URL on hold
+                self.scheduler.park(url)
+        return None
+
+    async def crawl(self) -> None:
+        """Check all the URLs with a bounded number of requests in flight."""
+        loop = asyncio.get_running_loop()
+        pending = {}
+
+        with ThreadPoolExecutor(self.concurrency) as executor:
+            # We check while we have an URL unchecked and some budget,
+            # or an URL in checking
+            while (((self.frontier or self.scheduler.has_waiting())
+                    and not self.exhausted()) or pending):
+                while (len(pending) < self.concurrency
+                       and not self.exhausted()):
+                    url = self.next_url()
+                    if url is None:
+                        break
+                    self.scheduler.acquire(url)
+                    future = loop.run_in_executor(executor, self.visit, url)
+                    pending[future] = url
+
+                # We wait either the end of a request, the turn
+                # of a host on hold or the time of an URL to check again
+                timeout = None
+                if len(pending) < self.concurrency:
+                    times = [
+                        i for i in (self.scheduler.next_time(),
+                                    self.frontier.next_time())
+                        if i is not None
+                    ]
+                    timeout = min(times) if times else None
+                if not pending:
+                    await asyncio.sleep(timeout or 0)
+                    continue
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED)
+
+                for future in done:
+                    url = pending.pop(future)
+                    self.scheduler.release(url)
+                    self.task_done(url)
+                    # We raise the errors got during the checking
+                    future.result()
+
+    def run(self) -> None:
+        """Run the checker."""
+        asyncio.run(self.crawl())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Budget module."""
+
+from urllib.parse import urlsplit
+import collections
+import threading
+import time
+
+
+class CrawlBudget:
+    """
+    Limit the crawling of a website.
+
+    The depth and the number of pages by host are verified before
+    an URL is added, the URLs beyond are ignored. The bytes downloaded
+    and the duration are verified before each checking, the crawling
+    stops once one of them is spent. In both cases the report
+    of the website is partial. A checking resumed counts again
+    the pages already found, but the bytes and the duration
+    are spent by each run.
+
+    :max_depth represent the maximum number of links followed
+        from the website to an URL
+    :max_pages represent the maximum number of URLs checked by host
+    :max_bytes represent the maximum number of bytes downloaded
+    :max_time represent the maximum duration of the crawling in seconds
+    """
+
+    # Represent the description of each limit
+    LIMITS = {
+        'depth': 'maximum depth',
+        'pages': 'maximum number of pages by host',
+        'bytes': 'maximum number of bytes downloaded',
+        'time': 'maximum duration',
+    }
+
+    def __init__(self, max_depth: int = None, max_pages: int = None,
+                 max_bytes: int = None, max_time: float = None):
+        """Init the budget."""
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.max_time = max_time
+
+        # Will represent the consumption of the budget
+        self.pages = collections.Counter()
+        self.bytes = 0
+        self.start_time = None
+
+        # Will represent the number of URLs ignored by limit
+        # and the limit who stopped the crawling
+        self.skipped = collections.Counter()
+        self.stopped = None
+
+        # Will represent the limit of each URL refused
+        self.rejected = {}
+
+        self.lock = threading.Lock()
+
+    @property
+    def partial(self) -> bool:
+        """Verify if some URLs were not checked because of the budget."""
+        return bool(self.stopped or self.skipped)
+
+    def refuse(self, url: str, depth: int) -> str:
+        """
+        Verify if an URL is beyond the budget.
+
+        An URL refused is counted once, even if found again,
+        and no more once found at a smaller depth.
+
+        :url represent the URL to add
+        :depth represent the depth of the URL
+        :return the limit reached, None if the URL can be added
+        """
+        limit = None
+        if self.max_depth is not None and depth > self.max_depth:
+            limit = 'depth'
+        elif self.max_pages is not None:
+            host = urlsplit(url).netloc
+            with self.lock:
+                if self.pages[host] >= self.max_pages:
+                    limit = 'pages'
+
+        with self.lock:
+            previous = self.rejected.get(url)
+            if limit == previous:
+                return limit
+            elif previous:
+                del self.rejected[url]
+                self.skipped[previous] -= 1
+                if not self.skipped[previous]:
+                    del self.skipped[previous]
+            if limit:
+                self.rejected[url] = limit
+                self.skipped[limit] += 1
+        return limit
+
+    def admit(self, url: str) -> None:
+        """
+        Count an URL added.
+
+        :url represent the URL added
+        """
+        if self.max_pages is not None:
+            with self.lock:
+                self.pages[urlsplit(url).netloc] += 1
+
+    def add_bytes(self, size: int) -> None:
+        """
+        Count the bytes downloaded.
+
+        :size represent the number of bytes
+        """
+        with self.lock:
+            self.bytes += size
+
+    def spent(self) -> str:
+        """
+        Verify if the crawling must stop.
+
+        The duration is counted from the first call.
+
+        :return the limit reached, None if the crawling can continue
+        """
+        with self.lock:
+            if self.stopped:
+                return self.stopped
+
+            now = time.monotonic()
+            if self.start_time is None:
+                self.start_time = now
+
+            if self.max_bytes is not None and self.bytes >= self.max_bytes:
+                self.stopped = 'bytes'
+            elif (self.max_time is not None
+                    and now - self.start_time >= self.max_time):
+                self.stopped = 'time'
+            return self.stopped
+
+    def report(self, unchecked: int = 0) -> str:
+        """
+        Explain why a report is partial.
+
+        :unchecked represent the number of URLs found but not checked
+        """
+        reasons = []
+        if self.stopped:
+            reasons.append(
+                f'crawling stopped at the {self.LIMITS[self.stopped]},'
+                f' {unchecked} URLs found not checked')
+        for limit, count in self.skipped.items():
+            reasons.append(
+                f'{count} URLs ignored beyond the {self.LIMITS[limit]}')
+        return 'Partial report: ' + '; '.join(reasons) + '.'
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Cache module."""
+
+import collections
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+
+class Database:
+    """
+    Represent a SQLite database shared by the threads of the checkers.
+
+    :directory represent the directory of the database
+    :commit_step represent the number of changes between two commits
+    """
+
+    FILENAME = None
+    SCHEMA = None
+
+    def __init__(self, directory: str, commit_step: int = 100):
+        """Init the database."""
+        self.logging = logging.getLogger('cache')
+        self.logging.setLevel(logging.DEBUG)
+
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, self.FILENAME)
+        self.logging.debug('We open the database %s' % self.path)
+
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute(self.SCHEMA)
+        self.db.commit()
+
+        self.commit_step = commit_step
+        self.nb_changes = 0
+        self.lock = threading.Lock()
+
+    def write(self, query: str, params: tuple) -> None:
+        """
+        Execute a change, the commit is done by batch.
+
+        :query represent the SQL query
+        :params represent the parameters of the query
+        """
+        with self.lock:
+            self.db.execute(query, params)
+            self.nb_changes += 1
+            if self.nb_changes >= self.commit_step:
+                self.db.commit()
+                self.nb_changes = 0
+
+    def read(self, query: str, params: tuple) -> tuple:
+        """
+        Get the first row of a query.
+
+        :query represent the SQL query
+        :params represent the parameters of the query
+        """
+        with self.lock:
+            return self.db.execute(query, params).fetchone()
+
+    def close(self) -> None:
+        """Save the changes and close the database."""
+        with self.lock:
+            self.db.commit()
+            self.db.close()
+
+
+class CrawlCache(Database):
+    """
+    Keep the webpages checked between two runs.
+
+    For each webpage, the validators (ETag and Last-Modified),
+    the status and the URLs found are saved inside a SQLite database.
+    The next run asks the webpage only if it was modified,
+    else the URLs found are reused without download it again.
+
+    :directory represent the directory of the database
+    :commit_step represent the number of webpages saved between two commits
+    """
+
+    FILENAME = 'crawl.sqlite'
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS pages ('
+        ' url TEXT PRIMARY KEY,'
+        ' real_url TEXT,'
+        ' base_url TEXT,'
+        ' etag TEXT,'
+        ' last_modified TEXT,'
+        ' status INTEGER,'
+        ' reason TEXT,'
+        ' outlinks TEXT,'
+        ' checked_at REAL'
+        ')'
+    )
+
+    def get(self, url: str) -> dict:
+        """
+        Get the webpage saved of an URL.
+
+        :url represent the URL requested
+        """
+        row = self.read(
+            'SELECT real_url, base_url, etag, last_modified, status,'
+            ' reason, outlinks FROM pages WHERE url = ?', (url,)
+        )
+
+        if row is None:
+            return None
+
+        return {
+            'url': row[0],
+            'base_url': row[1],
+            'etag': row[2],
+            'last_modified': row[3],
+            'status': row[4],
+            'reason': row[5],
+            'outlinks': json.loads(row[6]),
+        }
+
+    @staticmethod
+    def validators(page: dict) -> dict:
+        """
+        Get the headers of a conditional request.
+
+        :page represent the webpage saved
+        """
+        headers = {}
+        if page and page['etag']:
+            headers['If-None-Match'] = page['etag']
+        if page and page['last_modified']:
+            headers['If-Modified-Since'] = page['last_modified']
+        return headers
+
+    def set(self, url: str, response, base_url: str, outlinks: list) -> None:
+        """
+        Save a webpage.
+
+        :url represent the URL requested
+        :response represent the http response of the webpage
+        :base_url represent the URL used to build the absolute URLs
+        :outlinks represent the URLs as found inside the webpage
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+
+        # Without validators, the webpage can't be asked conditionally
+        if not (etag or last_modified):
+            return
+
+        self.write(
+            'INSERT OR REPLACE INTO pages'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (url, response.url, base_url, etag, last_modified,
+             response.status_code, response.reason,
+             json.dumps(outlinks), time.time())
+        )
+
+
+class ResultCache:
+    """
+    Keep the result of the foreign URLs checked.
+
+    The results are shared by all the checkers, a result is reused
+    during his lifetime. The most recently used results are kept
+    in memory, and all inside a SQLite database if a directory is given.
+
+    :ttl represent the lifetime of a result in seconds
+    :max_size represent the maximum number of results kept in memory
+    :directory represent the directory of the database
+    """
+
+    def __init__(self, ttl: float = 86400, max_size: int = 10000,
+                 directory: str = None):
+        """Init the cache."""
+        self.ttl = ttl
+        self.max_size = max(1, max_size)
+
+        # Will represent the results by URL, the last used at the end
+        self.results = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+        self.db = ResultDatabase(directory) if directory else None
+
+    def get(self, url: str) -> tuple:
+        """
+        Get the result of an URL if still valid.
+
+        :url represent the URL checked
+        """
+        expiry = time.time() - self.ttl
+
+        with self.lock:
+            if url in self.results:
+                checked_at, result = self.results[url]
+                if checked_at > expiry:
+                    self.results.move_to_end(url)
+                    return result
+                del self.results[url]
+
+        if self.db:
+            row = self.db.get(url, expiry)
+            if row:
+                self.keep(url, *row)
+                return row[1]
+
+        return None
+
+    def set(self, url: str, result: tuple) -> None:
+        """
+        Save the result of an URL.
+
+        :url represent the URL checked
+        :result represent the result of the checking
+        """
+        checked_at = time.time()
+        self.keep(url, checked_at, result)
+        if self.db:
+            self.db.set(url, checked_at, result)
+
+    def keep(self, url: str, checked_at: float, result: tuple) -> None:
+        """Keep a result in memory."""
+        with self.lock:
+            self.results[url] = checked_at, result
+            self.results.move_to_end(url)
+
+            # We remove the least recently used results
+            while len(self.results) > self.max_size:
+                self.results.popitem(last=False)
+
+    def close(self) -> None:
+        """Save the results."""
+        if self.db:
+            self.db.close()
+
+
+class ResultDatabase(Database):
+    """
+    Keep the result of the foreign URLs checked between two runs.
+
+    :directory represent the directory of the database
+    """
+
+    FILENAME = 'results.sqlite'
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS results ('
+        ' url TEXT PRIMARY KEY,'
+        ' ok INTEGER,'
+        ' status INTEGER,'
+        ' reason TEXT,'
+        ' checked_at REAL'
+        ')'
+    )
+
+    def get(self, url: str, expiry: float) -> tuple:
+        """
+        Get the result of an URL checked after a date.
+
+        :url represent the URL checked
+        :expiry represent the date before which a result is expired
+        """
+        row = self.read(
+            'SELECT checked_at, ok, status, reason FROM results'
+            ' WHERE url = ? AND checked_at > ?', (url, expiry)
+        )
+        if row is None:
+            return None
+        return row[0], (bool(row[1]), row[2], row[3])
+
+    def set(self, url: str, checked_at: float, result: tuple) -> None:
+        """
+        Save the result of an URL.
+
+        :url represent the URL checked
+        :checked_at represent the date of the checking
+        :result represent the result of the checking
+        """
+        self.write(
+            'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+            (url, int(result[0]), result[1], result[2], checked_at)
+        )
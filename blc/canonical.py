@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Canonical module."""
+
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
+import fnmatch
+import functools
+import re
+
+
+class Canonicalizer:
+    """
+    Build the canonical form of the URLs.
+
+    The URLs with the same canonical form are checked once.
+    The scheme and the host are lowercased, the default port, the empty
+    path and the fragment are removed. The other changes are optional.
+
+    :allow_params represent the names of the query parameters kept,
+        all by default (shell-style wildcards are allowed)
+    :deny_params represent the names of the query parameters removed
+    :sort_params sort the query parameters by name
+    :ignore_case lowercase the path, for the case-insensitive servers
+    :ignore_slash remove the slash at the end of the path
+    :cache_size represent the number of canonical forms kept
+
+    The canonicalizer is pickled by his options, without his cache,
+    to be given to the worker processes.
+    """
+
+    # Represent the default port of each scheme
+    DEFAULT_PORTS = {
+        'http': '80',
+        'https': '443',
+    }
+
+    # Regex to find the port of a host
+    REGEX_PORT = re.compile(r':(\d*)$')
+
+    def __init__(self, allow_params: list = None, deny_params: list = None,
+                 sort_params: bool = False, ignore_case: bool = False,
+                 ignore_slash: bool = False, cache_size: int = 65536):
+        """Init the canonicalizer."""
+        self.options = {
+            'allow_params': allow_params, 'deny_params': deny_params,
+            'sort_params': sort_params, 'ignore_case': ignore_case,
+            'ignore_slash': ignore_slash, 'cache_size': cache_size,
+        }
+        self.allow_params = self.compile(allow_params)
+        self.deny_params = self.compile(deny_params)
+        self.sort_params = sort_params
+        self.ignore_case = ignore_case
+        self.ignore_slash = ignore_slash
+
+        # The same URLs are found in many webpages
+        self.canonicalize = functools.lru_cache(cache_size)(self.canonicalize)
+
+    def __reduce__(self) -> tuple:
+        """Build the same canonicalizer in another process."""
+        return functools.partial(Canonicalizer, **self.options), ()
+
+    @staticmethod
+    def compile(patterns: list):
+        """
+        Build a regex matching the names of parameters.
+
+        :patterns represent the names, with shell-style wildcards
+        :return None without name
+        """
+        if not patterns:
+            return None
+        return re.compile('|'.join(fnmatch.translate(i) for i in patterns))
+
+    def canonicalize(self, url: str) -> str:
+        """
+        Get the canonical form of an URL.
+
+        :url represent an absolute URL,
+            the other URLs are returned unchanged
+        """
+        try:
+            scheme, netloc, path, query, _ = urlsplit(url)
+        except ValueError:
+            return url
+
+        scheme = scheme.lower()
+        if scheme not in self.DEFAULT_PORTS or not netloc:
+            return url
+
+        # NB: The user information is case-sensitive
+        userinfo, at, host = netloc.rpartition('@')
+        host = host.lower()
+        match = self.REGEX_PORT.search(host)
+        if match and match.group(1) in ('', self.DEFAULT_PORTS[scheme]):
+            host = host[:match.start()]
+
+        if self.ignore_case:
+            path = path.lower()
+        if self.ignore_slash and len(path) > 1:
+            path = path.rstrip('/') or '/'
+
+        if query and (self.allow_params or self.deny_params
+                      or self.sort_params):
+            query = self.filter_query(query)
+
+        return urlunsplit(
+            (scheme, userinfo + at + host, path or '/', query, ''))
+
+    def filter_query(self, query: str) -> str:
+        """
+        Remove and sort the parameters of a query.
+
+        The parameters kept are not encoded again.
+
+        :query represent the query of an URL
+        """
+        params = []
+        for param in query.split('&'):
+            if not param:
+                continue
+            name = unquote_plus(param.partition('=')[0])
+            if self.allow_params and not self.allow_params.match(name):
+                continue
+            elif self.deny_params and self.deny_params.match(name):
+                continue
+            params.append((name, param))
+
+        if self.sort_params:
+            # NB: The order of the values of a same parameter is kept
+            params.sort(key=lambda i: i[0])
+        return '&'.join(i[1] for i in params)
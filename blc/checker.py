@@ -2,14 +2,35 @@
 # -*- coding: utf-8 -*-
 """Checker module."""
 
+from .scheduler import Scheduler
+from .frontier import Frontier
+from .store import URLStore
+from .extractor import EXTRACTORS, RegexExtractor
+from .fingerprint import SimHashIndex
+from .cache import CrawlCache, ResultCache
+from .renderer import Renderer
+from .sink import Sink
+from .checkpoint import Checkpoint
+from .session import new_session
+from .retry import RetryPolicy
+from .seeder import Seeder
+from .timing import Metrics, Profiler
+from .canonical import Canonicalizer
+from .origin import OriginMatcher
+from .budget import CrawlBudget
+from .trap import TrapDetector
+from . import timing
 import requests
 import requests_html
-from urllib.parse import urljoin
+import urllib3
+from contextlib import nullcontext
+from urllib.parse import urldefrag, urljoin
+import codecs
+import itertools
 import time
 import logging
 import re
-import difflib
-import html
+import threading
 
 # We change the log level for requests’s logger
 logging.getLogger("requests_html").setLevel(logging.WARNING)
@@ -20,13 +41,86 @@ class Checker:
     Check if an broken URL is present inside a website.
 
     :host represent the website to check
-    :delay represent the delay between each request
+    :delay represent the delay between each request on a same host
     :deep_scan enable the check of foreign url
         just verify the availability of these URL
+    :max_per_host represent the maximum number of requests in flight
+        on a same host
+    :extractor represent the name of the extractor of the link URLs
+    :similarity represent the similarity from which a webpage
+        is skipped as near-duplicate of a webpage already seen
+    :cache represent the cache of the webpages checked in the previous runs
+    :results represent the cache of the foreign URLs checked,
+        shared between the checkers
+    :budget represent the number of requests in flight allowed,
+        shared between the checkers
+    :renderer represent the browser who executes the js script,
+        shared between the checkers; the checker waits each rendering,
+        use the AsyncChecker to check other URLs meanwhile
+    :render_pattern represent a regex of the URLs to render,
+        by default all the webpages are rendered
+    :render_empty enable the rendering of the webpages without URL
+    :max_parents represent the maximum number of parents kept by URL,
+        all by default
+    :sink represent the stream where each URL checked is written,
+        shared between the checkers
+    :checkpoint represent the journal of the progression,
+        used to resume an interrupted checking
+    :max_download_size represent the maximum number of bytes
+        read of a webpage
+    :conn represent the http session, shared between the checkers
+    :timeout represent the timeout of the requests in seconds,
+        or a tuple (connect timeout, read timeout)
+    :retry represent the policy of the retries of the transient errors,
+        shared between the checkers
+    :metrics represent the timings of the phases of the checking,
+        shared between the checkers
+    :profiler represent the profiler of the checking,
+        shared between the checkers
+    :canonicalizer represent the builder of the canonical form of the URLs,
+        the URLs are deduplicated by their canonical form, but requested
+        as first found
+    :internal_origins represent the other origins of the website,
+        like cdn.example.com or *.example.com, whose the webpages
+        are downloaded and analyzed
+    :crawl_budget represent the limits of the crawling of the website
+    :trap_detector represent the detector of the crawler traps,
+        whose the URLs of the website are not checked
     """
 
+    # Status codes of the hosts who refuse the method HEAD
+    HEAD_ERRORS = (400, 403, 405, 501)
+
+    # Errors while reading the content of a webpage,
+    # reported like the errors of the request to be retried
+    READ_TIMEOUTS = (urllib3.exceptions.ReadTimeoutError,
+                     requests.exceptions.ReadTimeout)
+    READ_ERRORS = (urllib3.exceptions.ProtocolError,
+                   requests.exceptions.ConnectionError)
+
+    # Phases of the analysis of a webpage while his download
+    ANALYSIS_PHASES = ('extract', 'fingerprint')
+
+    # Number of parents from which an URL is the most valuable
+    # of his depth
+    MAX_POPULARITY = 8
+
     def __init__(self, host: str, delay: int = 1, deep_scan: bool = False,
-                 browser_sleep: float = None):
+                 browser_sleep: float = None, max_per_host: int = 4,
+                 extractor: str = 'regex', similarity: float = 0.9,
+                 cache: CrawlCache = None, results: ResultCache = None,
+                 budget: threading.Semaphore = None,
+                 renderer: Renderer = None, render_pattern: str = None,
+                 render_empty: bool = False, max_parents: int = None,
+                 sink: Sink = None, checkpoint: Checkpoint = None,
+                 max_download_size: int = 1048576,
+                 conn: requests.Session = None, timeout: float = 2,
+                 retry: RetryPolicy = None, metrics: Metrics = None,
+                 profiler: Profiler = None,
+                 canonicalizer: Canonicalizer = None,
+                 internal_origins: list = None,
+                 crawl_budget: CrawlBudget = None,
+                 trap_detector: TrapDetector = None):
         """Init the checker."""
         # We config the logger
         self.logging = logging.getLogger(f'checker({host})')
@@ -34,54 +128,95 @@ class Checker:
         self.logging.debug('We initialize the checker for %s' % host)
 
         # We config the connection
-        self.conn = requests_html.HTMLSession()
-        self.conn.headers.update({
-            "User-Agent": "BrokenLinkChecker/1.0",
-        })
-        self.timeout = 2
+        self.conn = conn or new_session()
+        self.timeout = timeout
         self.browser_sleep = browser_sleep
-        self.max_download_size = 1048576  # 1MB
+        self.max_download_size = max_download_size
+        self.chunk_size = 65536
+
+        # Protect the shared state when several URLs are checked at once
+        self.lock = threading.Lock()
+
+        # We config the browser
+        if browser_sleep is not None and renderer is None:
+            renderer = Renderer(
+                sleep=browser_sleep,
+                timeout=timeout[-1] if isinstance(timeout, tuple) else timeout)
+        self.renderer = renderer
+        self.render_pattern = (
+            re.compile(render_pattern) if render_pattern else None)
+        self.render_empty = render_empty
+
+        # Will represent the method used to check the URLs by host,
+        # HEAD or GET for the hosts who refuse HEAD
+        self.methods = {}
+
+        # Policy of the retries
+        self.retry = retry
+
+        # Number of requests in flight allowed for all the checkers
+        self.budget = budget
 
         self.host = host
 
-        # Delay between each request
+        # Origins of the website
+        self.origins = OriginMatcher(host, internal_origins)
+
+        # Delay between each request on a same host
         self.delay = delay
+        self.scheduler = Scheduler(delay=delay, max_per_host=max_per_host)
 
         # Shallow scan of foreign url
         self.deep_scan = deep_scan
 
+        # Cache of the webpages checked in the previous runs
+        self.cache = cache
+
+        # Cache of the foreign URLs checked
+        self.results = results
+
+        # Stream of the results
+        self.sink = sink
+
+        # Journal of the progression
+        self.checkpoint = checkpoint
+
+        # Timings of the phases and profiler of the checking
+        self.metrics = metrics
+        self.profiler = profiler
+
+        # Canonical form of the URLs
+        self.canonicalizer = canonicalizer or Canonicalizer()
+        self.canonical = self.canonicalizer.canonicalize
+
+        # Detector of the crawler traps
+        self.traps = trap_detector or TrapDetector()
+
+        # Limits of the crawling
+        self.crawl_budget = crawl_budget
+        if crawl_budget:
+            crawl_budget.admit(self.canonical(host))
+
         # Will represent the list of checked URL
-        self.urls = {
-            host: {
-                'parent': [],
-                'url': None,
-                'result': None,
-                'check_time': None
-
-            }
-        }
-
-        # Will represent the previous webpage content
-        self.prev_data = ''
-
-        # Represent a regex to find all link URLs inside an text source
-        self.REGEX_TEXT_URL = re.compile(
-            r"href=[\'\"](.*?)[\'\"]"
-            r"|href=(.*?)[ |>]"
-            r"|<link>(.*?)</link>"
-            r"|<url>(.*?)</url>"
-            r"|src=[\'\"](.*?)[\'\"]"
-            r"|src=(.*?)[ |>]"
-            # Ref: http://www.regexguru.com/2008/11/
-            #   detecting-urls-in-a-block-of-text/
-            r"|\b(https?://[-A-Z0-9+&@#/%?=~_|!:,.;]*[A-Z0-9+&@#/%=~_|])",
-            re.IGNORECASE
-        )
+        self.urls = URLStore(max_parents=max_parents)
+        key = self.canonical(host)
+        self.urls.add(key, target=host if host != key else None)
 
-        self.REGEX_CLEAN_URL = re.compile(
-            r"[-A-Z0-9+&@#/%?=~_|!:,.;]*",
-            re.IGNORECASE
-        )
+        # Will represent the list of URL to check,
+        # the shallow and the most linked URLs first
+        self.frontier = Frontier()
+        self.frontier.push(key)
+
+        # Number of URLs checked between two logs of the progression
+        self.progress_step = 100
+
+        # Will represent the fingerprints of the webpages already seen
+        self.fingerprints = SimHashIndex(threshold=similarity)
+
+        # Represent the extractor of the link URLs inside an text source
+        self.extractor = EXTRACTORS[extractor]
+        self.REGEX_TEXT_URL = RegexExtractor.REGEX_TEXT_URL
+        self.REGEX_CLEAN_URL = RegexExtractor.REGEX_CLEAN_URL
 
         # Regex to verify the content type
         self.REGEX_CONTENT_TYPE = re.compile(
@@ -90,202 +225,684 @@ class Checker:
             re.IGNORECASE
         )
 
-    def is_same_host(self, url):
+        # Regex to find the URLs of the contents without URL
+        self.REGEX_BINARY_URL = re.compile(
+            r"\.(png|jpe?g|gif|webp|avif|svg|ico|bmp|tiff?"
+            r"|pdf|zip|gz|tgz|bz2|xz|7z|rar|tar|exe|dmg|iso|apk"
+            r"|mp3|mp4|m4a|ogg|wav|webm|avi|mov|mkv"
+            r"|woff2?|ttf|otf|eot|css|js|docx?|xlsx?|pptx?)$",
+            re.IGNORECASE
+        )
+
+        # Regex to find the charset of a webpage
+        self.REGEX_CHARSET = re.compile(
+            r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+        self.REGEX_META_CHARSET = re.compile(
+            rb"<meta[^>]+charset=[\"']?([\w.:-]+)"
+            rb"|<\?xml[^>]+encoding=[\"']([\w.:-]+)",
+            re.IGNORECASE
+        )
+
+    def is_same_host(self, url: str) -> bool:
         """
-        Verify if the url belongs the host.
+        Verify if the url belongs the host or an internal origin.
 
         :url the url to verify
         """
-        host = requests.utils.urlparse(self.host)
-        url = requests.utils.urlparse(url)
-
-        if not url.scheme:
-            return True
-        elif (
-            url.scheme == host.scheme
-                and url.netloc == host.netloc
-                and url.port == host.port):
-            return True
-        else:
-            return False
+        return self.origins.match(url)
 
     def check(self, url: str) -> requests_html.HTMLResponse:
         """
         Verify if a link is broken of not.
 
-        :url represent the URL to check
+        :url represent the URL to check, in his canonical form
         """
         # We verify the URL is already checked
-        if self.urls[url]['result']:
+        record = self.urls.record(url)
+        if record.result:
             return None
 
-        self.logging.info('Checking of %s...' % url)
+        # We request the URL as found, the canonical form is only his key
+        target = record.target or url
+        self.logging.info('Checking of %s...' % target)
 
         # We make a connection
+        page = None
+        same_host = self.is_same_host(url)
+        webpage = same_host and not self.is_binary(target)
         try:
-            if self.is_same_host(url):
-                response = self.conn.get(url, timeout=self.timeout,
-                                         stream=True)
-            else:
-                response = self.conn.head(url, timeout=self.timeout)
+            # We wait until the headers of the response
+            with timing.Measure('ttfb', exclude=timing.CONNECTION_PHASES):
+                if webpage:
+                    # We ask the webpage only if modified since the last run
+                    if self.cache:
+                        page = self.cache.get(url)
+                    response = self.conn.get(
+                        target, timeout=self.timeout, stream=True,
+                        headers=CrawlCache.validators(page))
+                else:
+                    response = self.probe(target)
         except requests.exceptions.ReadTimeout:
-            self.urls[url]['result'] = False, None, "Timeout!"
+            record.result = False, None, "Timeout!"
         except requests.exceptions.ConnectionError:
-            self.urls[url]['result'] = False, None, "Connection aborted!"
+            record.result = False, None, "Connection aborted!"
         except requests.exceptions.TooManyRedirects:
-            self.urls[url]['result'] = False, None, "Too many redirection!"
+            record.result = False, None, "Too many redirection!"
         else:
+            # We slow down if the host ask it
+            self.scheduler.observe(url, response)
+
+            # We reuse the URLs found in the last run if not modified
+            if response.status_code == 304 and page:
+                self.logging.debug('%s not modified since the last run' % url)
+                response.close()
+                record.result = True, page['status'], page['reason']
+                self.add_links(page['outlinks'], page['url'],
+                               page['base_url'])
+                return None
+
             # We verify the response status
             # 2xx stand for request was successfully completed
-            if response.ok:
-                self.urls[url]['result'] = (
-                    True, response.status_code, response.reason)
-                return response if self.is_same_host(url) else None
-            else:
-                self.urls[url]['result'] = (
-                    False, response.status_code, response.reason)
+            record.result = (
+                response.ok, response.status_code, response.reason)
+
+            # We share the result of the foreign URL, except a transient error
+            if (self.results and not same_host
+                    and not RetryPolicy.is_transient(record.result)):
+                self.results.set(url, record.result)
 
+            if not response.ok:
                 self.logging.warning(
                     '%s maybe broken because status code: %i' %
                     (url, response.status_code)
                 )
-                return None
+            elif not webpage:
+                pass
+            elif self.REGEX_CONTENT_TYPE.match(
+                    response.headers.get('Content-Type', '')):
+                return response
+            else:
+                # We don't download a content who can't be analyzed
+                self.logging.debug(
+                    '%s not downloaded because Content-Type %s' %
+                    (url, response.headers.get('Content-Type')))
+
+            response.close()
+            return None
+
+    def is_binary(self, url: str) -> bool:
+        """
+        Verify if the extension of an URL is of a content without URL.
+
+        :url represent the URL to verify
+        """
+        return bool(self.REGEX_BINARY_URL.search(
+            requests.utils.urlparse(url).path))
 
-    def update_list(self, response: requests_html.HTMLResponse) -> None:
+    def probe(self, url: str) -> requests.Response:
+        """
+        Request an URL without download his content.
+
+        The method HEAD is used if the host supports it, else GET
+        of the first byte only. The method is remembered by host.
+
+        :url represent the URL to request
+        """
+        netloc = requests.utils.urlparse(url).netloc
+        method = self.methods.get(netloc)
+
+        if method != 'GET':
+            response = self.conn.head(url, timeout=self.timeout)
+            if response.status_code not in self.HEAD_ERRORS:
+                self.methods.setdefault(netloc, 'HEAD')
+                return response
+            self.logging.debug(
+                '%s refuses HEAD with status code: %i' %
+                (url, response.status_code))
+
+        response = self.conn.get(url, timeout=self.timeout, stream=True,
+                                 headers={'Range': 'bytes=0-0'})
+        response.close()
+
+        # An empty content can't be requested by range
+        if response.status_code == 416:
+            response = self.conn.get(url, timeout=self.timeout, stream=True)
+            response.close()
+
+        # HEAD is refused by the host but not GET
+        if method is None and response.ok:
+            self.methods[netloc] = 'GET'
+        return response
+
+    def update_list(self, response: requests_html.HTMLResponse,
+                    url: str = None) -> None:
         """
         Update the list of URL to checked
          in function of the URL get in a webpage.
 
         :response represent the http response who contains the data to analyze
+        :url represent the URL requested, if different of the response URL
         """
-        # We verify if the content is a webpage
-        if self.REGEX_CONTENT_TYPE.match(response.headers['Content-Type']):
-            self.logging.debug('Getting of the webpage...')
-            data = None
-
-            # We execute the js script
-            if self.browser_sleep is not None:
-                try:
-                    # We wait to load the js and in case of connection latency
-                    response.html.render(
-                        timeout=self.timeout,
-                        sleep=self.browser_sleep)
-                    data = response.html.html
-                except (AttributeError, requests_html.etree.ParserError):
-                    pass
-                except requests_html.pyppeteer.errors.TimeoutError:
-                    pass
-
-            if data is None:
-                # we read fixed bytes by precaution
-                response.raw.decode_content = True
-                data = response.raw.read(self.max_download_size)
-                self.logging.debug('Decoding of data...')
-                data = data.decode()
-
-            # We verify if we are not already got this content
-            #   in the previous request
-            if (difflib.SequenceMatcher(None, data, self.prev_data)
-                    .ratio() > 0.9):
+        try:
+            # We verify if the content is a webpage
+            if self.REGEX_CONTENT_TYPE.match(response.headers['Content-Type']):
+                self.logging.debug('Getting of the webpage...')
+                extractor, fingerprint = self.download(response)
+
+                # We execute the js script
+                if self.need_render(response.url, extractor):
+                    with timing.Measure('render'):
+                        rendered = self.renderer.render(response.url)
+                    if rendered is not None:
+                        with timing.Measure('extract'):
+                            extractor = self.extract(rendered)
+                        with timing.Measure('fingerprint'):
+                            fingerprint = self.fingerprints.fingerprint(
+                                rendered)
+
+                # We verify if we are not already got this content
+                #   in a previous request
+                with timing.Measure('fingerprint'):
+                    if self.seen_content(response.url, fingerprint):
+                        return
+
+                # The relative URLs are relative to the tag <base> if present
+                base_url = (
+                    urljoin(response.url, extractor.base)
+                    if extractor.base else response.url)
+
+                # We verify if the canonical URL of the webpage is not
+                #   already found
+                if extractor.canonical and self.seen_canonical(
+                        response.url, urljoin(base_url, extractor.canonical)):
+                    self.logging.warning(
+                        '%s skipped because his canonical URL %s'
+                        ' is already found.'
+                        % (response.url, extractor.canonical)
+                    )
+                    return
+
+                # We keep each URL once
+                links = list(dict.fromkeys(extractor.urls))
+                self.add_links(links, response.url, base_url)
+
+                if self.cache:
+                    self.cache.set(
+                        url or response.url, response, base_url, links)
+            else:
                 self.logging.warning(
-                    response.url + ''
-                    ' skipped because content similar'
-                    ' at +90% with the previous URL.'
+                    '%s ignored because Content-Type %s' %
+                    (response.url, response.headers['Content-Type'])
                 )
-                return
-            else:
-                self.prev_data = data
-
-            self.logging.debug('Getting of the URLs...')
-
-            # Some url can be escape by the browser
-            data = html.unescape(data)
-
-            # We build a list of cleaned links
-            urls = [
-                self.REGEX_CLEAN_URL.findall(ii)[0]
-                for i in self.REGEX_TEXT_URL.findall(data)
-                if i for ii in i if ii
-            ]
-
-            # In this step, we have two possibilities
-            # 1. The URL belongs to the HOST
-            # 1.1. The URL is absolute
-            # 1.2. The URL is relative
-            # 2. The URL don't belongs to the HOST
-            for url in urls:
-
-                origin_url = url
-
-                # 1.1 and 1.2
-                if self.is_same_host(url):
-                    # 1.2
-                    if not requests.utils.parse_url(url).scheme:
-                        # We verify if the URL is different of the parent
-                        if not url.startswith('#') and not url.startswith('?'):
-                            # We build the absolute URL
-                            url = urljoin(response.url, url)
-                        else:
-                            # Since this URL is relative
-                            # maybe it is not different of the parent
-                            # Eg: /home and /home#
-                            continue
-                    else:
-                        # 1.1
-                        pass
-                # 2
-                elif self.deep_scan:
-                    data = requests.utils.urlparse(url)
-                    # Just the HTTP and HTTPS scheme will be allowed
-                    if data.scheme in ['http', 'https']:
-                        pass
+        finally:
+            # We close the connection, even if the webpage is skipped
+            response.close()
+
+    def read(self, response: requests_html.HTMLResponse, url: str) -> None:
+        """
+        Analyze a webpage, the errors of his download are his result.
+
+        :response represent the http response of the webpage
+        :url represent the URL requested
+        """
+        record = self.urls.record(url)
+        try:
+            self.update_list(response, url)
+        except self.READ_TIMEOUTS:
+            record.result = False, None, "Timeout!"
+        except self.READ_ERRORS:
+            record.result = False, None, "Connection aborted!"
+        else:
+            return
+        self.logging.warning(
+            '%s maybe broken because %s while his download'
+            % (url, record.result[2]))
+
+    def download(self, response: requests_html.HTMLResponse) -> tuple:
+        """
+        Read a webpage chunk by chunk.
+
+        Each chunk is decoded, then given to the extractor and to
+        the fingerprint, so the webpage is never copied whole.
+
+        :response represent the http response of the webpage
+        :return the extractor and the fingerprint of the webpage
+        """
+        extractor = self.extractor()
+        hasher = self.fingerprints.hasher()
+        decoder = None
+
+        # NB: The time of the download excludes the analysis of the chunks
+        download = timing.Measure('download', exclude=self.ANALYSIS_PHASES)
+        extract = timing.Measure('extract')
+        fingerprint = timing.Measure('fingerprint')
+
+        # we read fixed bytes by precaution
+        response.raw.decode_content = True
+        size = 0
+        with download:
+            while size < self.max_download_size:
+                chunk = response.raw.read(
+                    min(self.chunk_size, self.max_download_size - size))
+                if not chunk:
+                    break
+                size += len(chunk)
+
+                if decoder is None:
+                    charset = self.get_charset(
+                        response.headers['Content-Type'], chunk)
+                    self.logging.debug('Decoding of data as %s...' % charset)
+                    decoder = codecs.getincrementaldecoder(charset)('replace')
+
+                data = decoder.decode(chunk)
+                with extract:
+                    extractor.feed(data)
+                with fingerprint:
+                    hasher.update(data)
+
+            if decoder:
+                data = decoder.decode(b'', final=True)
+                with extract:
+                    extractor.feed(data)
+                with fingerprint:
+                    hasher.update(data)
+            with extract:
+                extractor.close()
+
+        self.count_bytes(size)
+        return extractor, hasher.digest()
+
+    def get_charset(self, content_type: str, data: bytes) -> str:
+        """
+        Get the encoding of a webpage.
+
+        :content_type represent the Content-Type of the webpage
+        :data represent the start of the webpage
+        :return the charset of the Content-Type, else the charset
+            of the tag <meta> or of the XML declaration, else UTF-8
+        """
+        match = (
+            self.REGEX_CHARSET.search(content_type)
+            or self.REGEX_META_CHARSET.search(data[:4096]))
+        if match:
+            charset = match.group(1) or match.group(2)
+            if isinstance(charset, bytes):
+                charset = charset.decode('ascii')
+            try:
+                return codecs.lookup(charset).name
+            except LookupError:
+                self.logging.warning('Unknown charset %s' % charset)
+        return 'utf-8'
+
+    def extract(self, data: str):
+        """
+        Extract the URLs of a webpage.
+
+        :data represent the content of the webpage
+        """
+        extractor = self.extractor()
+        extractor.feed(data)
+        extractor.close()
+        return extractor
+
+    def need_render(self, url: str, extractor) -> bool:
+        """
+        Verify if the js script of a webpage must be executed.
+
+        :url represent the URL of the webpage
+        :extractor represent the URLs found in the webpage without js
+        """
+        if self.renderer is None:
+            return False
+        elif not (self.render_pattern or self.render_empty):
+            return True
+        elif self.render_pattern and self.render_pattern.search(url):
+            return True
+        else:
+            return self.render_empty and not extractor.urls
+
+    def priority(self, url: str) -> float:
+        """
+        Get the rank of an URL to check, the smallest first.
+
+        The shallow URLs are checked first, then for a same depth
+        the URLs found in the most webpages.
+
+        :url represent an URL of the store
+        """
+        record = self.urls.record(url)
+        popularity = min(record.parent_count(), self.MAX_POPULARITY)
+        return record.depth - popularity / (self.MAX_POPULARITY + 1)
+
+    def exhausted(self) -> bool:
+        """Verify if the crawling must stop because of his budget."""
+        if not self.crawl_budget:
+            return False
+
+        stopped = self.crawl_budget.stopped
+        limit = self.crawl_budget.spent()
+        if limit and not stopped:
+            self.logging.warning(
+                'Crawling stopped because the %s is reached'
+                % CrawlBudget.LIMITS[limit])
+        return bool(limit)
+
+    def unchecked(self) -> int:
+        """Get the number of URLs found but not checked."""
+        return sum(
+            1 for url in self.urls if self.urls.record(url).result is None)
+
+    def count_bytes(self, size: int) -> None:
+        """
+        Count the bytes of a webpage downloaded.
+
+        :size represent the number of bytes
+        """
+        if self.crawl_budget:
+            self.crawl_budget.add_bytes(size)
+
+    def seen_content(self, url: str, fingerprint: int) -> bool:
+        """
+        Verify if a webpage is similar to a webpage already seen.
+
+        The fingerprint of a new content is indexed and saved
+        in the checkpoint.
+
+        :url represent the URL of the webpage
+        :fingerprint represent the fingerprint of the webpage
+        """
+        similarity = self.fingerprints.seen_fingerprint(fingerprint)
+        if similarity is not None:
+            self.logging.warning(
+                '%s skipped because content similar'
+                ' at %i%% with a previous URL.' % (url, similarity * 100))
+            return True
+        elif fingerprint is not None and self.checkpoint:
+            self.checkpoint.fingerprint(fingerprint)
+        return False
+
+    def seen_canonical(self, url: str, canonical: str) -> bool:
+        """
+        Verify if a webpage is a duplicate of an URL already found.
+
+        :url represent the URL of the webpage
+        :canonical represent the absolute URL given as canonical
+            by the webpage
+        """
+        key = self.canonical(canonical)
+        with self.lock:
+            return key != self.canonical(url) and key in self.urls
+
+    def add_links(self, links: list, parent: str, base_url: str) -> None:
+        """
+        Add the URLs found inside a webpage to the list of URL to check.
+
+        :links represent the URLs as found in the webpage
+        :parent represent the URL of the webpage
+        :base_url represent the URL used to build the absolute URLs
+        """
+        # In this step, we have two possibilities
+        # 1. The URL belongs to the HOST
+        # 1.1. The URL is absolute
+        # 1.2. The URL is relative
+        # 2. The URL don't belongs to the HOST
+        # The webpage is known by his canonical form
+        parent = self.canonical(parent)
+
+        for url in links:
+
+            origin_url = url
+            # The protocol-relative URLs are absolute
+            if url.startswith('//'):
+                url = urljoin(base_url, url)
+
+            # 1.1 and 1.2
+            # NB: We compare the absolute URLs by their canonical form
+            if self.is_same_host(self.canonical(url)):
+                # 1.2
+                if not requests.utils.parse_url(url).scheme:
+                    # We verify if the URL is different of the parent
+                    if not url.startswith('#') and not url.startswith('?'):
+                        # We build the absolute URL
+                        url = urljoin(base_url, url)
                     else:
+                        # Since this URL is relative
+                        # maybe it is not different of the parent
+                        # Eg: /home and /home#
                         continue
                 else:
-                    continue
-
-                # Except if the deep_scan is enable
-                # At this point, the URL belongs to the HOST
-                # We verify that the URL is neither already added nor checked
-                if url in self.urls:
-                    if (url != response.url
-                            and response.url not in self.urls[url]['parent']):
-                        self.urls[url]['parent'].append(response.url)
-                elif url != response.url:
-                    self.logging.debug('Add the URL %s' % url)
-                    self.urls[url] = {
-                        'parent': [response.url],
-                        'url': origin_url,
-                        'result': None,
-                        'check_time': None
-
-                    }
+                    # 1.1
+                    pass
+            # 2
+            elif self.deep_scan:
+                # Just the HTTP and HTTPS scheme will be allowed
+                if requests.utils.urlparse(url).scheme in ['http', 'https']:
+                    pass
                 else:
                     continue
+            else:
+                continue
 
-            # We close the connection
-            response.close()
-        else:
-            self.logging.warning(
-                '%s ignored because Content-Type %s' %
-                (response.url, response.headers['Content-Type'])
-            )
+            # Except if the deep_scan is enable
+            # At this point, the URL belongs to the HOST
+            self.add_url(url, parent, origin_url)
+
+    def add_url(self, url: str, parent: str, origin_url: str) -> bool:
+        """
+        Add an URL to the list of URL to check.
+
+        :url represent the absolute URL to add
+        :parent represent the URL of the webpage who contains this URL
+        :origin_url represent the URL as found in the webpage
+        :return True if the URL was not yet in the list
+        """
+        # The URL is added by his canonical form, but requested as found
+        target = urldefrag(url)[0]
+        url = self.canonical(url)
+        if target == url:
+            target = None
+
+        with self.lock:
+            # We verify that the URL is neither already added nor checked
+            if url in self.urls:
+                # We keep each parent and each spelling of the URL
+                new_parent = (
+                    url != parent and self.urls.add_parent(url, parent))
+                new_alias = self.urls.add_alias(url, origin_url)
+                if (new_parent or new_alias) and self.checkpoint:
+                    self.checkpoint.add(
+                        url, parent, origin_url if new_alias else None)
+                # An URL found in more webpages is checked sooner
+                if new_parent:
+                    self.frontier.prioritize(url, self.priority(url))
+                return False
+            elif not self.scheduler.allowed(target or url):
+                self.logging.debug('%s disallowed by robots.txt' % url)
+                return False
+            elif url == parent:
+                return False
+            # NB: The budget is verified before the counters of the traps
+            elif self.crawl_budget and self.crawl_budget.refuse(
+                    url, self.urls.child_depth(parent)):
+                self.logging.debug('%s beyond the budget' % url)
+                return False
+            # NB: The foreign URLs are only requested, never crawled
+            elif self.is_same_host(url) and self.traps.detect(url, parent):
+                return False
+            else:
+                self.logging.debug('Add the URL %s' % url)
+                if self.crawl_budget:
+                    self.crawl_budget.admit(url)
+                self.urls.add(url, origin_url, parent, target)
+                self.frontier.push(url, self.priority(url))
+                if self.checkpoint:
+                    self.checkpoint.add(url, parent, origin_url, target)
+                return True
+
+    def from_cache(self, url: str) -> bool:
+        """
+        Get the result of a foreign URL already checked.
+
+        :url represent the URL to check
+        :return True if the result was found
+        """
+        if not self.results or self.is_same_host(url):
+            return False
+
+        result = self.results.get(url)
+        if result is None:
+            return False
+
+        self.logging.debug('%s already checked' % url)
+        record = self.urls.record(url)
+        record.result = result
+        record.check_time = 0
+        return True
+
+    def visit(self, url: str) -> None:
+        """
+        Check an URL and collect the URLs of his webpage.
+
+        :url represent the URL to visit
+        """
+        record = self.urls.record(url)
+        timing.start()
+        try:
+            with self.profiler or nullcontext():
+                # We respect the budget shared with the other checkers
+                if self.budget:
+                    with timing.Measure('wait'):
+                        self.budget.acquire()
+                try:
+                    record.check_time = time.time()
+                    response = self.check(url)
+                    if response:
+                        self.read(response, url)
+                    record.check_time = (
+                        time.time() - record.check_time)
+                finally:
+                    if self.budget:
+                        self.budget.release()
+        finally:
+            record.timings = timing.stop()
+
+    def task_done(self, url: str) -> None:
+        """
+        Notify the end of the checking of an URL.
+
+        :url represent the URL checked
+        """
+        record = self.urls.record(url)
+
+        # We check again later an URL with a transient error
+        if self.retry:
+            delay = self.retry.retry(record.result, record.attempts)
+            if delay is not None:
+                self.logging.info(
+                    '%s will be checked again in %.1f seconds because %s' %
+                    (url, delay, record.result[2]))
+                record.attempts += 1
+                record.result = None
+                self.frontier.defer(url, delay)
+                return
+
+        self.frontier.task_done(url)
+
+        if self.checkpoint:
+            self.checkpoint.done(url, record.result, record.check_time)
+
+        if self.sink:
+            self.sink.write(self.host, url, self.urls[url])
+
+        if self.metrics:
+            self.metrics.add(self.host, url, record.timings)
+
+        if not self.frontier.done % self.progress_step:
+            self.logging.info(
+                'Progression: %(queued)i queued, %(in_flight)i in flight,'
+                ' %(done)i done' % self.frontier.stats())
+
+    def resume(self) -> None:
+        """Restore the progression saved in the checkpoint."""
+        done = []
+        for event in self.checkpoint.events():
+            if event[0] == 'a':
+                url, parent, origin_url = event[1:4]
+                target = event[4] if len(event) > 4 else None
+                if not self.urls.add(url, origin_url, parent, target):
+                    self.urls.add_parent(url, parent)
+                    self.urls.add_alias(url, origin_url)
+            elif event[0] == 'd':
+                url, ok, status, reason, check_time = event[1:]
+                record = self.urls.record(url)
+                if record.result is None:
+                    done.append(url)
+                record.result = ok, status, reason
+                record.check_time = check_time
+            elif event[0] == 'f':
+                self.fingerprints.add(event[1])
+
+        # The URLs restored are counted by the budget and the traps,
+        # except the website, already counted
+        for url in itertools.islice(self.urls, 1, None):
+            if self.crawl_budget:
+                self.crawl_budget.admit(url)
+            if self.is_same_host(url):
+                self.traps.count(url)
+
+        # Only the URLs without result will be checked
+        self.frontier = Frontier()
+        for url in self.urls:
+            if self.urls.record(url).result is None:
+                self.frontier.push(url, self.priority(url))
+        self.frontier.done = len(done)
+
+        if self.sink:
+            for url in done:
+                self.sink.write(self.host, url, self.urls[url])
+
+        self.logging.info(
+            'Resumption with %i URLs checked and %i to check'
+            % (len(done), len(self.frontier)))
+
+    def seed(self, robots: bool = True, sitemap: bool = True) -> None:
+        """
+        Fill the list of URL to check before the crawling.
+
+        :robots apply the disallow rules and the crawl-delay
+            of the robots.txt of the host
+        :sitemap add the URLs of the sitemaps of the host
+        """
+        seeder = Seeder(self.conn, timeout=self.timeout)
+        rules = seeder.robots(self.host)
+        if rules and robots:
+            self.scheduler.set_robots(self.host, rules)
+
+        if sitemap:
+            count = len(self.urls)
+            for url, sitemap_url in seeder.urls(self.host, rules):
+                self.add_links([url], sitemap_url, sitemap_url)
+            self.logging.info(
+                '%i URLs found in the sitemaps' % (len(self.urls) - count))
 
     def run(self) -> None:
         """Run the checker."""
-        # We check while we have an URL unchecked
-        while 1:
-            url_to_check = [u for u in self.urls if not self.urls[u]['result']]
-
-            if not url_to_check:
-                break
-
-            while url_to_check:
-                url = url_to_check.pop(0)
-                self.urls[url]['check_time'] = time.time()
-                response = self.check(url)
-                if response:
-                    self.update_list(response)
-                self.urls[url]['check_time'] = (
-                    time.time() - self.urls[url]['check_time'])
-                time.sleep(self.delay)
+        # We check while we have an URL unchecked and some budget
+        while self.frontier and not self.exhausted():
+            url = self.frontier.pop()
+            if url is None:
+                # We wait the time of the URLs to check again
+                time.sleep(self.frontier.next_time() or 0)
+                continue
+            elif self.from_cache(url):
+                self.task_done(url)
+                continue
+
+            # We wait the turn of the host
+            time.sleep(self.scheduler.wait_time(url) or 0)
+            self.scheduler.acquire(url)
+            try:
+                self.visit(url)
+            finally:
+                self.scheduler.release(url)
+                self.task_done(url)
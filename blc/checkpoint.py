@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Checkpoint module."""
+
+import json
+import logging
+import os
+import threading
+import time
+
+
+class Checkpoint:
+    """
+    Journal of the progression of a checker.
+
+    Each change is appended as a JSON array on its own line,
+    the file is never rewritten:
+
+    - ['a', url, parent, origin_url] when an URL or a parent is found,
+      followed by the URL requested if different of the canonical form
+    - ['d', url, ok, status, reason, check_time] when an URL is checked
+    - ['f', fingerprint] when the content of a webpage is new
+
+    The changes are written by batch, at least every interval.
+    A line truncated by an interruption is removed at the resumption.
+
+    :path represent the file of the journal
+    :resume keep the journal of the previous run, else it is cleared
+    :flush_step represent the number of changes between two writings
+    :interval represent the maximum time in seconds between two writings
+    """
+
+    def __init__(self, path: str, resume: bool = False,
+                 flush_step: int = 100, interval: float = 5):
+        """Init the checkpoint."""
+        self.logging = logging.getLogger('checkpoint')
+        self.logging.setLevel(logging.DEBUG)
+
+        self.path = path
+        self.flush_step = flush_step
+        self.interval = interval
+
+        if resume and os.path.exists(path):
+            self.repair()
+        self.file = open(path, 'a' if resume else 'w', encoding='utf-8')
+
+        self.buffer = []
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+
+    def repair(self) -> None:
+        """Remove the last line if it is incomplete."""
+        with open(self.path, 'rb+') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if not size:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b'\n':
+                return
+
+            # We search the end of the last complete line
+            position = size
+            while position > 0:
+                step = min(4096, position)
+                position -= step
+                f.seek(position)
+                index = f.read(step).rfind(b'\n')
+                if index >= 0:
+                    position += index + 1
+                    break
+            self.logging.warning(
+                'The last line of %s was incomplete' % self.path)
+            f.truncate(position)
+
+    def events(self):
+        """Iterate on the changes of the journal."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    self.logging.warning(
+                        'Line ignored inside %s: %s' % (self.path, line))
+
+    def add(self, url: str, parent: str, origin_url: str,
+            target: str = None) -> None:
+        """
+        Save an URL found.
+
+        :url represent the absolute URL, in his canonical form
+        :parent represent the URL of the webpage who contains this URL
+        :origin_url represent the URL as found in the webpage
+        :target represent the absolute URL requested,
+            if different of the canonical form
+        """
+        if target is None:
+            self.write(['a', url, parent, origin_url])
+        else:
+            self.write(['a', url, parent, origin_url, target])
+
+    def fingerprint(self, fingerprint: int) -> None:
+        """
+        Save the fingerprint of a new content.
+
+        :fingerprint represent the SimHash of the webpage
+        """
+        self.write(['f', fingerprint])
+
+    def done(self, url: str, result: tuple, check_time: float) -> None:
+        """
+        Save the result of an URL.
+
+        :url represent the URL checked
+        :result represent the result of the checking
+        :check_time represent the time of the checking
+        """
+        if result is None:
+            # Without result, the URL will be checked again
+            return
+        self.write(['d', url, *result, check_time])
+
+    def write(self, event: list) -> None:
+        """Add a change to the journal."""
+        with self.lock:
+            self.buffer.append(json.dumps(event))
+            if (len(self.buffer) >= self.flush_step
+                    or time.monotonic() - self.last_flush >= self.interval):
+                self.flush()
+
+    def flush(self) -> None:
+        """Write the changes waiting, the lock must be held."""
+        if self.buffer:
+            self.file.write('\n'.join(self.buffer) + '\n')
+            self.file.flush()
+            self.buffer.clear()
+        self.last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Write the changes waiting and close the journal."""
+        with self.lock:
+            self.flush()
+            self.file.close()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Extractor module."""
+
+from html.parser import HTMLParser
+from lxml import etree
+import html
+import re
+
+
+class RegexExtractor:
+    """
+    Extract the link URLs of a text source with regex.
+
+    The source can be given by part, each part is analyzed until
+    his last tag opened, all the URLs look like inside the text are found.
+    The URL of the tag <base> is the base of the relative URLs,
+    not a link.
+    """
+
+    # Represent a regex to find all link URLs inside an text source
+    REGEX_TEXT_URL = re.compile(
+        r"href=[\'\"](.*?)[\'\"]"
+        r"|href=(.*?)[ |>]"
+        r"|<link>(.*?)</link>"
+        r"|<url>(.*?)</url>"
+        r"|<loc>(.*?)</loc>"
+        r"|src=[\'\"](.*?)[\'\"]"
+        r"|src=(.*?)[ |>]"
+        # Ref: http://www.regexguru.com/2008/11/
+        #   detecting-urls-in-a-block-of-text/
+        r"|\b(https?://[-A-Z0-9+&@#/%?=~_|!:,.;]*[A-Z0-9+&@#/%=~_|])",
+        re.IGNORECASE
+    )
+
+    REGEX_CLEAN_URL = re.compile(
+        r"[-A-Z0-9+&@#/%?=~_|!:,.;]*",
+        re.IGNORECASE
+    )
+
+    # Represent a regex to find the canonical URL of a webpage
+    REGEX_CANONICAL = re.compile(
+        r"<link\b[^>]*\brel=[\'\"]?canonical\b[^>]*>",
+        re.IGNORECASE
+    )
+    # Represent a regex to find the tag <base>
+    REGEX_BASE = re.compile(r"<base\b[^>]*>", re.IGNORECASE)
+
+    REGEX_HREF = re.compile(
+        r"href=[\'\"]?([^\'\"\s>]+)",
+        re.IGNORECASE
+    )
+
+    def __init__(self):
+        """Init the extractor."""
+        self.chunks = []
+
+        # Will represent the URLs found
+        self.urls = []
+
+        # Will represent the URL of the tag <base>
+        self.base = None
+
+        # Will represent the URL of the tag <link rel="canonical">
+        self.canonical = None
+
+    def feed(self, data: str) -> None:
+        """
+        Give a part of the source to analyze.
+
+        :data represent the part of the source
+        """
+        # An URL can continue in the next part, but not beyond a tag,
+        # so we stop at the last tag opened (not closing)
+        end = data.rfind('<')
+        while end > 0 and data.startswith('</', end):
+            end = data.rfind('<', 0, end)
+        if end <= 0:
+            self.chunks.append(data)
+            return
+
+        self.chunks.append(data[:end])
+        self.analyze(''.join(self.chunks))
+        self.chunks = [data[end:]]
+
+    def close(self) -> None:
+        """Analyze the end of the source."""
+        self.analyze(''.join(self.chunks))
+        self.chunks = []
+
+    def analyze(self, data: str) -> None:
+        """
+        Get the URLs of a part of the source.
+
+        :data represent the part of the source
+        """
+        # Some url can be escape by the browser
+        data = html.unescape(data)
+
+        if self.canonical is None:
+            match = self.REGEX_CANONICAL.search(data)
+            match = match and self.REGEX_HREF.search(match.group(0))
+            if match:
+                self.canonical = match.group(1)
+
+        # We keep the first tag <base>, who is not a link
+        if self.base is None:
+            match = self.REGEX_BASE.search(data)
+            match = match and self.REGEX_HREF.search(match.group(0))
+            if match:
+                self.base = match.group(1)
+        data = self.REGEX_BASE.sub('', data)
+
+        # We build a list of cleaned links
+        self.urls.extend(
+            self.REGEX_CLEAN_URL.findall(ii)[0]
+            for i in self.REGEX_TEXT_URL.findall(data)
+            if i for ii in i if ii
+        )
+
+
+class TagExtractor:
+    """
+    Extract the link URLs of the tags of a source.
+
+    Only the URLs of the attributes href, src and srcset, and of
+    the content of the tags <link>, <url> and <loc> are found,
+    the text and the scripts are ignored.
+    The tag <link rel="canonical"> gives the canonical URL.
+    """
+
+    # Attributes who contain an URL
+    URL_ATTRS = ('href', 'src')
+
+    # Tags whose the content is an URL (RSS, Atom and sitemap)
+    URL_TAGS = ('link', 'url', 'loc')
+
+    def __init__(self):
+        """Init the extractor."""
+        # Will represent the URLs found
+        self.urls = []
+
+        # Will represent the URL of the tag <base>
+        self.base = None
+
+        # Will represent the URL of the tag <link rel="canonical">
+        self.canonical = None
+
+    def handle_attrs(self, tag: str, attrs: dict) -> None:
+        """
+        Get the URLs of the attributes of a tag.
+
+        :tag represent the name of the tag
+        :attrs represent the attributes of the tag
+        """
+        if tag == 'base':
+            if self.base is None and attrs.get('href'):
+                self.base = attrs.get('href').strip()
+            return
+        elif (tag == 'link' and self.canonical is None and attrs.get('href')
+                and 'canonical' in (attrs.get('rel') or '').lower().split()):
+            self.canonical = attrs.get('href').strip()
+
+        for name in self.URL_ATTRS:
+            value = attrs.get(name)
+            if value:
+                self.urls.append(value.strip())
+
+        srcset = attrs.get('srcset')
+        if srcset:
+            # Eg: srcset="a.png 1x, b.png 2x"
+            for candidate in srcset.split(','):
+                candidate = candidate.split()
+                if candidate:
+                    self.urls.append(candidate[0])
+
+    def handle_text(self, tag: str, attrs: dict, text: str) -> None:
+        """
+        Get the URL of the content of a tag.
+
+        :tag represent the name of the tag
+        :attrs represent the attributes of the tag
+        :text represent the content of the tag
+        """
+        # In HTML, the tag <link> has no content
+        if tag in self.URL_TAGS and not attrs.get('href') and text:
+            text = text.strip()
+            if text:
+                self.urls.append(text)
+
+
+class HTMLExtractor(TagExtractor, HTMLParser):
+    """
+    Extract the link URLs of a HTML or XML source with a tokenizer.
+
+    The source can be given by part, the URLs are found as soon as
+    their tag is complete.
+    """
+
+    def __init__(self):
+        """Init the extractor."""
+        TagExtractor.__init__(self)
+        HTMLParser.__init__(self, convert_charrefs=True)
+
+        # Will represent the tag whose we read the content
+        self.text_tag = None
+        self.text = []
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        """Get the URLs of the attributes of a tag."""
+        attrs = dict(attrs)
+        self.handle_attrs(tag, attrs)
+
+        if tag in self.URL_TAGS and not attrs.get('href'):
+            self.text_tag = tag
+            self.text = []
+
+    def handle_endtag(self, tag: str) -> None:
+        """Get the URL of the content of a tag."""
+        if tag == self.text_tag:
+            self.handle_text(tag, {}, ''.join(self.text))
+            self.text_tag = None
+
+    def handle_data(self, data: str) -> None:
+        """Read the content of a tag."""
+        if self.text_tag:
+            self.text.append(data)
+
+    def unknown_decl(self, data: str) -> None:
+        """Read the content of a CDATA section."""
+        if self.text_tag and data.startswith('CDATA['):
+            self.text.append(data[6:])
+
+
+class LxmlExtractor(TagExtractor):
+    """
+    Extract the link URLs of a HTML or XML source with the lxml parser.
+
+    The source can be given by part, the URLs are found as soon as
+    their tag is complete. It is the fastest extractor.
+    """
+
+    # Represent the start of the XML sources
+    XML_STARTS = ('<?xml', '<rss', '<feed', '<urlset', '<sitemapindex')
+
+    def __init__(self):
+        """Init the extractor."""
+        super().__init__()
+        self.parser = None
+
+    def feed(self, data: str) -> None:
+        """
+        Give a part of the source to analyze.
+
+        :data represent the part of the source
+        """
+        if self.parser is None:
+            # In HTML, the tag <link> has no content,
+            # so the XML sources (RSS, sitemap) need their own parser
+            if data.lstrip().startswith(self.XML_STARTS):
+                self.parser = etree.XMLPullParser(
+                    events=('end',), recover=True)
+            else:
+                self.parser = etree.HTMLPullParser(events=('end',))
+
+        self.parser.feed(data)
+        self.read_events()
+
+    def close(self) -> None:
+        """Analyze the end of the source."""
+        if self.parser is None:
+            return
+
+        try:
+            self.parser.close()
+        except etree.XMLSyntaxError:
+            # Empty or invalid source
+            pass
+        self.read_events()
+
+    def read_events(self) -> None:
+        """Get the URLs of the tags already parsed."""
+        for _, element in self.parser.read_events():
+            tag = element.tag
+            # We ignore the comments and the processing instructions
+            if not isinstance(tag, str):
+                continue
+            elif '}' in tag:
+                # We remove the XML namespace
+                tag = tag.rsplit('}', 1)[1]
+
+            # NB: An element gives his attributes like a dict
+            if element.attrib:
+                self.handle_attrs(tag, element)
+            if element.text:
+                self.handle_text(tag, element, element.text)
+
+            # We free the memory, the children are already parsed
+            element.clear(keep_tail=True)
+
+
+# Represent the extractors available
+EXTRACTORS = {
+    'regex': RegexExtractor,
+    'html': HTMLExtractor,
+    'lxml': LxmlExtractor,
+}
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Fingerprint module."""
+
+from array import array
+from itertools import repeat
+import collections
+import operator
+import re
+import threading
+
+
+# Number of bits of the counter of each bit of a fingerprint
+LANE = 32
+
+# Represent the counters incremented by each value of a byte,
+# for each position of the byte inside a fingerprint
+SPREAD = [
+    [
+        sum(
+            1 << (LANE * (8 * i + bit))
+            for bit in range(8) if value >> bit & 1)
+        for value in range(256)
+    ]
+    for i in range(8)
+]
+
+
+def popcount(value: int) -> int:
+    """Get the number of bits set of an integer."""
+    return bin(value).count('1')
+
+
+class SimHashIndex:
+    """
+    Detect the near-duplicate webpages.
+
+    Each webpage is summarized by a SimHash of 64 bits computed on
+    his shingles (sequences of words). Two webpages are similar when
+    their fingerprints differ by few bits, the index finds them
+    in a roughly constant time.
+
+    :threshold represent the similarity from which two webpages
+        are near-duplicates, 1 for the identical webpages only
+    :shingle_size represent the number of words of a shingle
+    """
+
+    BITS = 64
+
+    def __init__(self, threshold: float = 0.9, shingle_size: int = 4):
+        """Init the index."""
+        self.threshold = threshold
+        self.shingle_size = max(1, shingle_size)
+
+        # Maximum number of different bits between two similar webpages
+        self.distance = min(
+            self.BITS - 1, max(0, int((1 - threshold) * self.BITS)))
+
+        # Two fingerprints with at most n different bits have at least
+        # one of n + 1 blocks in common (pigeonhole principle)
+        nb_blocks = self.distance + 1
+        self.blocks = []
+        start = 0
+        for i in range(nb_blocks):
+            size = (
+                self.BITS // nb_blocks
+                + (1 if i < self.BITS % nb_blocks else 0))
+            self.blocks.append((start, (1 << size) - 1))
+            start += size
+
+        # Will represent the fingerprints indexed by block
+        self.tables = [{} for _ in self.blocks]
+
+        self.lock = threading.Lock()
+
+    def fingerprint(self, data: str) -> int:
+        """
+        Compute the SimHash of a text.
+
+        :data represent the text to summarize
+        :return None if the text has no word
+        """
+        hasher = self.hasher()
+        hasher.update(data)
+        return hasher.digest()
+
+    def hasher(self) -> 'SimHash':
+        """Get a SimHash computed part by part."""
+        return SimHash(self.shingle_size)
+
+    def keys(self, fingerprint: int) -> list:
+        """Get the blocks of a fingerprint."""
+        return [
+            (fingerprint >> start) & mask
+            for start, mask in self.blocks
+        ]
+
+    def find(self, fingerprint: int) -> int:
+        """
+        Find a fingerprint similar in the index.
+
+        :fingerprint represent the fingerprint to search
+        """
+        for table, key in zip(self.tables, self.keys(fingerprint)):
+            for candidate in table.get(key, ()):
+                if popcount(candidate ^ fingerprint) <= self.distance:
+                    return candidate
+        return None
+
+    def add(self, fingerprint: int) -> None:
+        """
+        Add a fingerprint inside the index.
+
+        :fingerprint represent the fingerprint to add
+        """
+        for table, key in zip(self.tables, self.keys(fingerprint)):
+            table.setdefault(key, []).append(fingerprint)
+
+    def similarity(self, a: int, b: int) -> float:
+        """Get the similarity between two fingerprints."""
+        return 1 - popcount(a ^ b) / self.BITS
+
+    def seen(self, data: str) -> float:
+        """
+        Verify if a similar text was already seen, else index it.
+
+        :data represent the text to verify
+        :return the similarity with the text already seen or None
+        """
+        return self.seen_fingerprint(self.fingerprint(data))
+
+    def seen_fingerprint(self, fingerprint: int) -> float:
+        """
+        Verify if a similar fingerprint was already seen, else index it.
+
+        :fingerprint represent the fingerprint to verify
+        :return the similarity with the fingerprint already seen or None
+        """
+        if fingerprint is None:
+            return None
+
+        with self.lock:
+            similar = self.find(fingerprint)
+            if similar is None:
+                self.add(fingerprint)
+                return None
+        return self.similarity(fingerprint, similar)
+
+
+class SimHash:
+    """
+    Compute the SimHash of a text given part by part.
+
+    The words cut between two parts and the last words of a part
+    are kept to build the shingles of the next part.
+
+    :shingle_size represent the number of words of a shingle
+    """
+
+    BITS = 64
+    MASK = (1 << BITS) - 1
+
+    REGEX_WORD = re.compile(r"\w+")
+    REGEX_LAST_WORD = re.compile(r"\w*$")
+
+    def __init__(self, shingle_size: int = 4):
+        """Init the SimHash."""
+        self.shingle_size = max(1, shingle_size)
+
+        # Will represent the end of the text not yet hashed
+        self.rest = ''
+        self.words = []
+
+        # Will represent the counters of the bits of all the hashes
+        self.total = 0
+        self.nb_hashes = 0
+
+    def update(self, data: str) -> None:
+        """
+        Hash a part of the text.
+
+        :data represent the part of the text
+        """
+        data = self.rest + data
+        # The last word can continue in the next part
+        end = self.REGEX_LAST_WORD.search(data).start()
+        self.rest = data[end:]
+        self.hash(self.REGEX_WORD.findall(data[:end].lower()))
+
+    def hash(self, words: list) -> None:
+        """Count the bits of the hashes of the shingles of new words."""
+        words = self.words + words
+        size = self.shingle_size
+        if len(words) < size:
+            self.words = words
+            return
+
+        # We hash each shingle
+        shingles = zip(*[words[i:] for i in range(size)])
+        hashes = array(
+            'Q', map(operator.and_, map(hash, shingles), repeat(self.MASK)))
+        self.words = words[len(words) - size + 1:]
+
+        # Each bit of the fingerprint is the bit the most present
+        # in the hashes, we count the bits byte by byte: each bit
+        # has his own counter of LANE bits inside a big integer
+        raw = hashes.tobytes()
+        for i, spread in enumerate(SPREAD):
+            self.total += sum(
+                spread[value] * count
+                for value, count in collections.Counter(
+                    raw[i::hashes.itemsize]).items()
+            )
+        self.nb_hashes += len(hashes)
+
+    def digest(self) -> int:
+        """
+        Get the SimHash of the text.
+
+        :return None if the text has no word
+        """
+        self.hash(self.REGEX_WORD.findall(self.rest.lower()))
+        self.rest = ''
+
+        # A short text is summarized by one shingle
+        if not self.nb_hashes and self.words:
+            self.shingle_size = len(self.words)
+            self.hash([])
+        if not self.nb_hashes:
+            return None
+
+        mask = (1 << LANE) - 1
+        return sum(
+            1 << i for i in range(self.BITS)
+            if (self.total >> (LANE * i) & mask) * 2 > self.nb_hashes)
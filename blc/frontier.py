@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Frontier module."""
+
+import heapq
+import itertools
+import threading
+import time
+
+
+class Frontier:
+    """
+    Represent the URLs waiting to be checked.
+
+    Each URL is added with a priority, the URLs with the smallest
+    priority are taken first, in the order of addition for a same
+    priority. The priority of an URL waiting can be raised.
+    Only the URLs waiting are kept: the URLs already added are
+    in the store of the checker, who adds each URL once.
+    An URL can be deferred to be checked again later, it goes back
+    at the end of the queue when his time comes, so the retries
+    never block the crawling.
+    The counters permit to follow the progression of the checking:
+
+    :queued represent the number of URLs waiting to be checked
+    :deferred represent the URLs waiting their time, by time
+    :in_flight represent the number of URLs taken but not yet checked
+    :done represent the number of URLs checked
+    """
+
+    def __init__(self):
+        """Init the frontier."""
+        # NB: The entries of the heap whose the priority was raised
+        # are removed only when they are taken
+        self.queue = []
+
+        # Will represent the priority of each URL waiting
+        self.waiting = {}
+
+        self.deferred = []
+        self.counter = itertools.count()
+
+        # Will represent the largest priority given, the one of the end
+        # of the queue
+        self.last_priority = 0
+
+        self.in_flight = 0
+        self.done = 0
+
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of URLs waiting to be checked, even later."""
+        return len(self.waiting) + len(self.deferred)
+
+    def __contains__(self, url: str) -> bool:
+        """Verify if an URL is waiting to be checked."""
+        return url in self.waiting
+
+    @property
+    def queued(self) -> int:
+        """Get the number of URLs waiting to be checked."""
+        return len(self.waiting)
+
+    def push(self, url: str, priority: float = 0) -> bool:
+        """
+        Add an URL to check.
+
+        :url represent the URL to add
+        :priority represent the rank of the URL, the smallest first
+        :return True if the URL was not already waiting
+        """
+        with self.lock:
+            if url in self.waiting:
+                return False
+            self.last_priority = max(self.last_priority, priority)
+            self.enqueue(url, priority)
+            return True
+
+    def prioritize(self, url: str, priority: float) -> bool:
+        """
+        Raise the priority of an URL waiting to be checked.
+
+        :url represent the URL
+        :priority represent the new rank of the URL
+        :return True if the priority was raised
+        """
+        with self.lock:
+            if url not in self.waiting or priority >= self.waiting[url]:
+                return False
+            self.enqueue(url, priority)
+            return True
+
+    def enqueue(self, url: str, priority: float) -> None:
+        """Queue an URL with his priority, the lock must be held."""
+        self.waiting[url] = priority
+        heapq.heappush(self.queue, (priority, next(self.counter), url))
+
+    def pop(self) -> str:
+        """
+        Take the next URL to check.
+
+        :return None if no URL is ready
+        """
+        with self.lock:
+            # The deferred URLs whose the time came are queued
+            # at the end
+            now = time.monotonic()
+            while self.deferred and self.deferred[0][0] <= now:
+                self.enqueue(
+                    heapq.heappop(self.deferred)[2], self.last_priority)
+
+            while self.queue:
+                priority, _, url = heapq.heappop(self.queue)
+                # We skip the entries of the priorities raised since
+                if self.waiting.get(url) == priority:
+                    del self.waiting[url]
+                    self.in_flight += 1
+                    return url
+            return None
+
+    def task_done(self, url: str) -> None:
+        """
+        Notify the end of the checking of an URL.
+
+        :url represent the URL checked
+        """
+        with self.lock:
+            self.in_flight -= 1
+            self.done += 1
+
+    def defer(self, url: str, delay: float) -> None:
+        """
+        Check again later an URL taken.
+
+        :url represent the URL to check again
+        :delay represent the delay before the URL is queued again
+        """
+        with self.lock:
+            self.in_flight -= 1
+            heapq.heappush(self.deferred, (
+                time.monotonic() + delay, next(self.counter), url))
+
+    def next_time(self) -> float:
+        """Get the delay before a deferred URL is ready."""
+        with self.lock:
+            if not self.deferred:
+                return None
+            return max(0, self.deferred[0][0] - time.monotonic())
+
+    def stats(self) -> dict:
+        """Get the counters of the frontier."""
+        return {
+            'queued': self.queued,
+            'in_flight': self.in_flight,
+            'done': self.done,
+        }
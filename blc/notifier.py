@@ -4,19 +4,33 @@
 import smtplib
 # Here are the email package modules we'll need
 from email.message import EmailMessage
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
+import threading
 
 
 class Notifier:
     """
     Notify by email.
 
+    The messages are sent in background by a pool of threads,
+    each thread keeps his SMTP connection open between the messages,
+    so the setup of the connection (STARTTLS, login) is done once.
+
     :smtp_server represent the address of the email service provider
     :username represent the email of the sender
     :password represent the password of the sender
+    :pool_size represent the number of SMTP connections
+    :starttls enable the encryption of the connection
+    :timeout represent the timeout of the SMTP connections in seconds
     """
 
-    def __init__(self, smtp_server: str, username: str, password: str):
+    # Errors who close the SMTP connection
+    CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError)
+
+    def __init__(self, smtp_server: str, username: str, password: str,
+                 pool_size: int = 2, starttls: bool = True,
+                 timeout: float = 30):
         """Init the notifier."""
         # We config the module logger
         self.logging = logging.getLogger('notifier')
@@ -26,14 +40,28 @@ class Notifier:
         self.smtp_server = smtp_server
         self.sender = username
         self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+
+        # Will represent the queue of the messages to send
+        self.executor = ThreadPoolExecutor(
+            max(1, pool_size), thread_name_prefix='notifier')
+
+        # Will represent the connection of each thread
+        self.local = threading.local()
+        self.connections = []
+        self.lock = threading.Lock()
 
-    def send(self, recipient: str, subject: str, body: str) -> None:
+    def build(self, recipient: str, subject: str, body: str,
+              attachments: list = None) -> EmailMessage:
         """
-        Send an email.
+        Build a message.
 
         :recipient represent the email of the dest
         :subject represent the subject of the notification
         :body represent the content of the notification
+        :attachments represent the files attached,
+            as tuples (filename, content, mimetype)
         """
         self.logging.debug('We build the message')
         # Create the container email message.
@@ -43,10 +71,103 @@ class Notifier:
         msg['To'] = recipient
         msg.set_content(body)
 
-        self.logging.debug('We send the message')
-        # Send the message via our own SMTP server.
-        s = smtplib.SMTP(self.smtp_server)
-        s.starttls()
-        s.login(self.sender, self.password)
-        s.send_message(msg)
-        s.quit()
+        for filename, content, mimetype in attachments or []:
+            maintype, _, subtype = mimetype.partition('/')
+            if maintype == 'text':
+                msg.add_attachment(content, subtype=subtype,
+                                   filename=filename)
+            else:
+                if isinstance(content, str):
+                    content = content.encode('utf-8')
+                msg.add_attachment(content, maintype=maintype,
+                                   subtype=subtype, filename=filename)
+        return msg
+
+    def submit(self, recipient: str, subject: str, body: str,
+               attachments: list = None) -> Future:
+        """
+        Send an email in background.
+
+        :recipient represent the email of the dest
+        :subject represent the subject of the notification
+        :body represent the content of the notification
+        :attachments represent the files attached,
+            as tuples (filename, content, mimetype)
+        :return the future of the sending
+        """
+        msg = self.build(recipient, subject, body, attachments)
+        future = self.executor.submit(self.deliver, msg)
+        future.add_done_callback(self.log_error)
+        return future
+
+    def send(self, recipient: str, subject: str, body: str,
+             attachments: list = None) -> None:
+        """
+        Send an email and wait his sending.
+
+        :recipient represent the email of the dest
+        :subject represent the subject of the notification
+        :body represent the content of the notification
+        :attachments represent the files attached,
+            as tuples (filename, content, mimetype)
+        """
+        self.submit(recipient, subject, body, attachments).result()
+
+    def connect(self) -> smtplib.SMTP:
+        """Open a SMTP connection."""
+        self.logging.debug('We connect to %s' % self.smtp_server)
+        s = smtplib.SMTP(self.smtp_server, timeout=self.timeout)
+        if self.starttls:
+            s.starttls()
+        if self.password:
+            s.login(self.sender, self.password)
+        return s
+
+    def deliver(self, msg: EmailMessage) -> None:
+        """
+        Send a message with the connection of the current thread.
+
+        :msg represent the message
+        """
+        for attempt in range(2):
+            s = getattr(self.local, 'connection', None)
+            if s is None:
+                s = self.local.connection = self.connect()
+                with self.lock:
+                    self.connections.append(s)
+
+            self.logging.debug('We send the message')
+            try:
+                # Send the message via our own SMTP server.
+                s.send_message(msg)
+                return
+            except self.CONNECTION_ERRORS:
+                # The server closed the idle connection, we release
+                # his socket and open a new one
+                self.local.connection = None
+                with self.lock:
+                    self.connections.remove(s)
+                try:
+                    s.close()
+                except OSError:
+                    pass
+                if attempt:
+                    raise
+
+    def log_error(self, future: Future) -> None:
+        """Log the error of a sending."""
+        error = future.exception()
+        if error is not None:
+            self.logging.error('Sending of a message failed: %r' % error)
+
+    def close(self) -> None:
+        """Wait the messages queued and close the connections."""
+        self.executor.shutdown(wait=True)
+
+        with self.lock:
+            for s in self.connections:
+                try:
+                    s.quit()
+                except (smtplib.SMTPException, OSError):
+                    pass
+            self.connections.clear()
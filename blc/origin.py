@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Origin module."""
+
+from urllib.parse import urlsplit
+import functools
+
+
+class OriginMatcher:
+    """
+    Verify if the URLs belong to a website.
+
+    The origins of the website are parsed once. The target matches
+    with http and https, with and without www., the other internal
+    origins are hosts like cdn.example.com or wildcard subdomains
+    like *.example.com. The relative URLs always match.
+
+    :host represent the website
+    :internal represent the other origins of the website
+    :cache_size represent the number of URLs whose the result is kept
+    """
+
+    # Represent the default port of each scheme
+    DEFAULT_PORTS = {
+        'http': 80,
+        'https': 443,
+    }
+
+    def __init__(self, host: str, internal: list = None,
+                 cache_size: int = 65536):
+        """Init the matcher."""
+        # Will represent the hosts and the suffixes of the subdomains
+        self.hosts = set()
+        self.suffixes = []
+
+        netloc = self.netloc(host if '//' in host else '//' + host)
+        if netloc:
+            self.hosts.add(netloc)
+            # The site is the same with or without www.
+            if netloc.startswith('www.'):
+                self.hosts.add(netloc[4:])
+            else:
+                self.hosts.add('www.' + netloc)
+
+        for origin in internal or []:
+            origin = origin.strip()
+            if origin.startswith('*.'):
+                self.suffixes.append(origin[1:].lower())
+            elif origin:
+                netloc = self.netloc(
+                    origin if '//' in origin else '//' + origin)
+                if netloc:
+                    self.hosts.add(netloc)
+        self.suffixes = tuple(self.suffixes)
+
+        # The same URLs are found in many webpages
+        self.match = functools.lru_cache(cache_size)(self.match)
+
+    def netloc(self, url: str) -> str:
+        """
+        Get the host of an URL, with his port if not the default port.
+
+        :url represent the URL
+        :return None if the URL is invalid
+        """
+        try:
+            return self.join(urlsplit(url))
+        except ValueError:
+            return None
+
+    def join(self, parts) -> str:
+        """
+        Get the host of a parsed URL, with his port if not the default port.
+
+        :parts represent the parts of the URL
+        """
+        host = parts.hostname
+        port = parts.port
+        if not host:
+            return None
+        elif ':' in host:
+            # IPv6 address
+            host = '[%s]' % host
+        if port is None or port == self.DEFAULT_PORTS.get(parts.scheme):
+            return host
+        return '%s:%i' % (host, port)
+
+    def match(self, url: str) -> bool:
+        """
+        Verify if an URL belongs to the website.
+
+        :url represent the URL to verify
+        """
+        try:
+            parts = urlsplit(url)
+            if not parts.netloc:
+                # Only the relative URLs have no host
+                return not parts.scheme
+            elif parts.scheme and parts.scheme not in self.DEFAULT_PORTS:
+                return False
+            netloc = self.join(parts)
+        except ValueError:
+            return False
+
+        if netloc is None:
+            return False
+        elif netloc in self.hosts:
+            return True
+        elif not self.suffixes:
+            return False
+        # We compare the host without his port
+        return parts.hostname.endswith(self.suffixes)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Renderer module."""
+
+import asyncio
+import logging
+import pyppeteer
+import threading
+
+
+class Renderer:
+    """
+    Execute the js script of the webpages inside a shared browser.
+
+    The browser runs in his own thread with a pool of reusable pages,
+    so the other threads continue their requests while a webpage
+    is rendered. The caller of render waits the end of the rendering:
+    the serial Checker stops his crawling meanwhile, only the async and
+    sharded checkers, or several websites checked at the same time,
+    overlap the renderings with the requests.
+    The browser is launched at the first rendering.
+
+    :sleep represent the time to wait the js script after the loading
+    :timeout represent the maximum time of the loading
+    :pages represent the number of webpages rendered at the same time
+    :queue_size represent the maximum number of webpages waiting
+        to be rendered, the checkers wait beyond
+    """
+
+    def __init__(self, sleep: float = 0, timeout: float = 2,
+                 pages: int = 2, queue_size: int = None):
+        """Init the renderer."""
+        self.logging = logging.getLogger('renderer')
+        self.logging.setLevel(logging.DEBUG)
+
+        self.sleep = sleep
+        self.timeout = timeout
+        self.nb_pages = max(1, pages)
+
+        # Bounded queue of the webpages to render
+        self.queue = threading.BoundedSemaphore(
+            queue_size or 2 * self.nb_pages)
+
+        self.loop = None
+        self.thread = None
+        self.browser = None
+        self.launching = None
+        self.pages = None
+        self.broken = False
+        self.lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the thread of the browser."""
+        with self.lock:
+            if self.thread:
+                return
+            self.loop = asyncio.new_event_loop()
+            self.thread = threading.Thread(
+                target=self.loop.run_forever, name='renderer', daemon=True)
+            self.thread.start()
+
+    async def launch(self) -> None:
+        """Launch the browser and his pages."""
+        self.logging.debug('We launch the browser')
+        # NB: The signals can be handled only by the main thread
+        self.browser = await pyppeteer.launch(
+            headless=True, args=['--no-sandbox'], loop=self.loop,
+            handleSIGINT=False, handleSIGTERM=False, handleSIGHUP=False)
+
+        self.pages = asyncio.Queue()
+        for _ in range(self.nb_pages):
+            self.pages.put_nowait(await self.browser.newPage())
+
+    async def render_page(self, url: str) -> str:
+        """
+        Render a webpage with a page of the pool.
+
+        :url represent the URL of the webpage
+        """
+        # The first renderings wait the same launching
+        if self.launching is None:
+            self.launching = asyncio.ensure_future(self.launch())
+        await self.launching
+
+        page = await self.pages.get()
+        try:
+            await page.goto(url, options={'timeout': int(self.timeout * 1000)})
+            # We wait to load the js and in case of connection latency
+            await asyncio.sleep(self.sleep)
+            return await page.content()
+        finally:
+            self.pages.put_nowait(page)
+
+    def render(self, url: str) -> str:
+        """
+        Get the content of a webpage after the execution of his js script.
+
+        :url represent the URL of the webpage
+        :return None if the webpage can't be rendered
+        """
+        if self.broken:
+            return None
+
+        self.start()
+        with self.queue:
+            future = asyncio.run_coroutine_threadsafe(
+                self.render_page(url), self.loop)
+            try:
+                return future.result()
+            except Exception as err:
+                self.logging.warning(
+                    '%s not rendered because %s' % (url, repr(err)))
+                if self.browser is None:
+                    # The browser can't be launched
+                    self.broken = True
+            return None
+
+    def close(self) -> None:
+        """Close the browser and stop his thread."""
+        if not self.thread:
+            return
+
+        if self.browser:
+            asyncio.run_coroutine_threadsafe(
+                self.browser.close(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+        self.thread = None
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Retry module."""
+
+import logging
+import random
+import threading
+
+
+class RetryPolicy:
+    """
+    Decide if a failed URL must be checked again.
+
+    Only the transient errors (timeout, connection aborted, server
+    overloaded) are retried, after an exponential backoff with jitter.
+    The number of retries is limited by URL and for the whole run.
+
+    :max_retries represent the maximum number of retries of an URL
+    :backoff represent the delay before the first retry in seconds
+    :max_backoff represent the maximum delay before a retry
+    :budget represent the maximum number of retries of the run,
+        shared between the checkers
+    """
+
+    # Status codes of the transient errors
+    TRANSIENT_STATUS = (429, 500, 502, 503, 504)
+
+    # Reasons of the transient errors without status code
+    TRANSIENT_REASONS = ('Timeout!', 'Connection aborted!')
+
+    def __init__(self, max_retries: int = 2, backoff: float = 0.5,
+                 max_backoff: float = 30, budget: int = 100):
+        """Init the policy."""
+        self.logging = logging.getLogger('retry')
+        self.logging.setLevel(logging.DEBUG)
+
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.budget = budget
+
+        self.random = random.Random()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def is_transient(cls, result: tuple) -> bool:
+        """
+        Verify if the result of a checking is a transient error.
+
+        :result represent the result of the checking
+        """
+        if not result or result[0]:
+            return False
+        elif result[1] is None:
+            return result[2] in cls.TRANSIENT_REASONS
+        else:
+            return result[1] in cls.TRANSIENT_STATUS
+
+    def retry(self, result: tuple, attempts: int) -> float:
+        """
+        Get the delay before the next checking of an URL.
+
+        :result represent the result of the last checking
+        :attempts represent the number of retries already done
+        :return None if the URL must not be checked again
+        """
+        if attempts >= self.max_retries or not self.is_transient(result):
+            return None
+
+        with self.lock:
+            if self.budget <= 0:
+                return None
+            self.budget -= 1
+            if not self.budget:
+                self.logging.warning('The budget of retries is exhausted')
+
+        # Full jitter, the retries of the same errors are spread
+        delay = min(self.max_backoff, self.backoff * 2 ** attempts)
+        return self.random.uniform(0, delay)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Scheduler module."""
+
+from urllib.parse import urlparse
+from email.utils import parsedate_to_datetime
+import collections
+import threading
+import time
+
+
+class Scheduler:
+    """
+    Schedule the requests of each host.
+
+    :delay represent the minimum delay between two requests on a same host
+    :max_per_host represent the maximum number of requests in flight
+        on a same host
+    :max_backoff represent the maximum delay of a backoff
+    """
+
+    # Status code asking us to slow down
+    BACKOFF_STATUS = (429, 503)
+
+    def __init__(self, delay: float = 1, max_per_host: int = 4,
+                 max_backoff: float = 60):
+        """Init the scheduler."""
+        self.delay = delay
+        self.max_per_host = max(1, max_per_host)
+        self.max_backoff = max_backoff
+
+        # Will represent the state of each host
+        self.hosts = {}
+
+        # Will represent the hosts with URLs waiting their turn
+        self.waiting_hosts = set()
+
+        # Will represent the rules of the robots.txt by host
+        self.robots = {}
+
+        self.lock = threading.Lock()
+
+    def get_host(self, url: str) -> dict:
+        """
+        Get the state of the host of an URL.
+
+        :url represent the URL requested
+        """
+        netloc = urlparse(url).netloc
+        if netloc not in self.hosts:
+            self.hosts[netloc] = {
+                'netloc': netloc,
+                'delay': self.delay,
+                'next_time': 0,
+                'in_flight': 0,
+                'failures': 0,
+                'waiting': collections.deque(),
+            }
+        return self.hosts[netloc]
+
+    def wait_time(self, url: str) -> float:
+        """
+        Get the delay before a request to this URL can start.
+
+        :url represent the URL to request
+        :return None if the host has already too many requests in flight
+        """
+        with self.lock:
+            host = self.get_host(url)
+            if host['in_flight'] >= self.max_per_host:
+                return None
+            return max(0, host['next_time'] - time.monotonic())
+
+    def acquire(self, url: str) -> None:
+        """
+        Notify the start of a request.
+
+        :url represent the URL requested
+        """
+        with self.lock:
+            host = self.get_host(url)
+            host['in_flight'] += 1
+            host['next_time'] = max(
+                host['next_time'], time.monotonic() + host['delay'])
+
+    def release(self, url: str) -> None:
+        """
+        Notify the end of a request.
+
+        :url represent the URL requested
+        """
+        with self.lock:
+            host = self.get_host(url)
+            host['in_flight'] = max(0, host['in_flight'] - 1)
+
+    def observe(self, url: str, response) -> None:
+        """
+        Slow down the requests on a host if his response ask it.
+
+        :url represent the URL requested
+        :response represent the http response got
+        """
+        with self.lock:
+            host = self.get_host(url)
+
+            if response.status_code not in self.BACKOFF_STATUS:
+                host['failures'] = 0
+                return
+
+            host['failures'] += 1
+            backoff = self.parse_retry_after(
+                response.headers.get('Retry-After'))
+            if backoff is None:
+                # Exponential backoff
+                backoff = max(host['delay'], 1) * 2 ** (host['failures'] - 1)
+            backoff = min(backoff, self.max_backoff)
+
+            host['next_time'] = max(
+                host['next_time'], time.monotonic() + backoff)
+
+    def set_robots(self, url: str, robots) -> None:
+        """
+        Apply the rules of the robots.txt of the host of an URL.
+
+        The delay of the host is raised to his crawl-delay.
+
+        :url represent an URL of the host
+        :robots represent the rules of the robots.txt
+        """
+        with self.lock:
+            host = self.get_host(url)
+            self.robots[host['netloc']] = robots
+            if robots.crawl_delay:
+                host['delay'] = max(self.delay, robots.crawl_delay)
+
+    def allowed(self, url: str) -> bool:
+        """
+        Verify if the robots.txt of his host allows to request an URL.
+
+        :url represent the URL to request
+        """
+        if not self.robots:
+            return True
+        robots = self.robots.get(urlparse(url).netloc)
+        return robots is None or robots.allowed(url)
+
+    @staticmethod
+    def parse_retry_after(value: str) -> float:
+        """
+        Get the delay in second asked by the header Retry-After.
+
+        :value represent the value of the header
+        """
+        if not value:
+            return None
+        elif value.strip().isdigit():
+            return float(value)
+
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0, date.timestamp() - time.time())
+
+    def park(self, url: str) -> None:
+        """
+        Put an URL on hold until his host is ready.
+
+        :url represent the URL to put on hold
+        """
+        with self.lock:
+            host = self.get_host(url)
+            host['waiting'].append(url)
+            self.waiting_hosts.add(host['netloc'])
+
+    def unpark(self) -> str:
+        """Get an URL on hold whose the host is ready."""
+        now = time.monotonic()
+        with self.lock:
+            for netloc in self.waiting_hosts:
+                host = self.hosts[netloc]
+                if (host['in_flight'] < self.max_per_host
+                        and host['next_time'] <= now):
+                    url = host['waiting'].popleft()
+                    if not host['waiting']:
+                        self.waiting_hosts.discard(netloc)
+                    return url
+        return None
+
+    def next_time(self) -> float:
+        """Get the delay before an URL on hold can start."""
+        now = time.monotonic()
+        with self.lock:
+            times = [
+                max(0, self.hosts[netloc]['next_time'] - now)
+                for netloc in self.waiting_hosts
+                if self.hosts[netloc]['in_flight'] < self.max_per_host
+            ]
+        return min(times) if times else None
+
+    def has_waiting(self) -> bool:
+        """Verify if some URLs are on hold."""
+        return bool(self.waiting_hosts)
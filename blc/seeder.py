@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Seeder module."""
+
+from urllib.parse import urljoin
+from urllib.robotparser import RobotFileParser
+from lxml import etree
+import collections
+import logging
+import requests
+import zlib
+
+
+class Robots:
+    """
+    Represent the rules of the robots.txt of a host.
+
+    :text represent the content of the robots.txt
+    :user_agent represent the user agent of the checker
+    """
+
+    def __init__(self, text: str, user_agent: str):
+        """Init the rules."""
+        self.user_agent = user_agent
+        self.parser = RobotFileParser()
+        self.parser.parse(text.splitlines())
+        # NB: The parser refuses all the URLs until his modification
+        self.parser.modified()
+
+    def allowed(self, url: str) -> bool:
+        """
+        Verify if an URL can be requested.
+
+        :url represent the URL to verify
+        """
+        return self.parser.can_fetch(self.user_agent, url)
+
+    @property
+    def crawl_delay(self) -> float:
+        """Get the delay between two requests asked by the host."""
+        delay = self.parser.crawl_delay(self.user_agent)
+        return float(delay) if delay is not None else None
+
+    @property
+    def sitemaps(self) -> list:
+        """Get the URLs of the sitemaps of the host."""
+        return self.parser.site_maps() or []
+
+
+class Seeder:
+    """
+    Find the URLs of a website without crawling it.
+
+    The URLs are read in the sitemaps listed by the robots.txt,
+    else in /sitemap.xml. The sitemap index files are followed
+    and the sitemaps compressed with gzip are decompressed
+    while they are read.
+
+    :conn represent the http session
+    :timeout represent the timeout of the requests
+    :max_sitemaps represent the maximum number of sitemaps read
+    :max_size represent the maximum number of bytes read of a sitemap,
+        once decompressed
+    """
+
+    # Represent the start of a content compressed with gzip
+    GZIP_MAGIC = b'\x1f\x8b'
+
+    def __init__(self, conn: requests.Session, timeout: float = 2,
+                 max_sitemaps: int = 100, max_size: int = 52428800):
+        """Init the seeder."""
+        self.logging = logging.getLogger('seeder')
+        self.logging.setLevel(logging.DEBUG)
+
+        self.conn = conn
+        self.timeout = timeout
+        self.max_sitemaps = max_sitemaps
+        self.max_size = max_size
+        self.chunk_size = 65536
+
+    def robots(self, host: str) -> Robots:
+        """
+        Get the rules of the robots.txt of a host.
+
+        :host represent the website
+        :return None if the host has no robots.txt
+        """
+        url = urljoin(host, '/robots.txt')
+        try:
+            response = self.conn.get(url, timeout=self.timeout)
+        except requests.exceptions.RequestException as err:
+            self.logging.warning('%s unreachable: %s' % (url, err))
+            return None
+
+        if not response.ok:
+            self.logging.info(
+                '%s not found, status code: %i' % (url, response.status_code))
+            return None
+        return Robots(response.text, self.conn.headers.get('User-Agent', '*'))
+
+    def urls(self, host: str, robots: Robots = None):
+        """
+        Iterate on the URLs of the sitemaps of a website.
+
+        :host represent the website
+        :robots represent the rules of the robots.txt of the host
+        :return the URLs with the URL of their sitemap
+        """
+        queue = collections.deque(
+            robots.sitemaps if robots and robots.sitemaps
+            else [urljoin(host, '/sitemap.xml')])
+        seen = set(queue)
+
+        count = 0
+        while queue and count < self.max_sitemaps:
+            sitemap_url = queue.popleft()
+            count += 1
+
+            for tag, url in self.read(sitemap_url):
+                if tag == 'url':
+                    yield url, sitemap_url
+                elif url not in seen:
+                    # We follow the sitemaps of a sitemap index file
+                    seen.add(url)
+                    queue.append(url)
+
+        if queue:
+            self.logging.warning(
+                '%i sitemaps ignored, the limit is %i'
+                % (len(queue), self.max_sitemaps))
+
+    def read(self, url: str):
+        """
+        Iterate on the entries of a sitemap.
+
+        :url represent the URL of the sitemap
+        :return the entries as ('url', URL) for a webpage or
+            as ('sitemap', URL) for a sitemap of an index file
+        """
+        self.logging.info('Reading of the sitemap %s...' % url)
+        try:
+            response = self.conn.get(url, timeout=self.timeout, stream=True)
+        except requests.exceptions.RequestException as err:
+            self.logging.warning('%s unreachable: %s' % (url, err))
+            return
+
+        with response:
+            if not response.ok:
+                self.logging.info(
+                    '%s not found, status code: %i'
+                    % (url, response.status_code))
+                return
+
+            parser = etree.XMLPullParser(events=('end',), recover=True)
+            decompressor = None
+
+            # The encoding of the transfer is removed by urllib3,
+            # not the compression of the file
+            response.raw.decode_content = True
+            size = 0
+            try:
+                while size < self.max_size:
+                    chunk = response.raw.read(self.chunk_size)
+                    if not chunk:
+                        break
+
+                    if decompressor is None:
+                        decompressor = (
+                            zlib.decompressobj(16 + zlib.MAX_WBITS)
+                            if chunk.startswith(self.GZIP_MAGIC) else False)
+                    if decompressor:
+                        chunk = decompressor.decompress(
+                            chunk, self.max_size - size)
+                    size += len(chunk)
+
+                    parser.feed(chunk)
+                    yield from self.read_events(parser)
+
+                parser.close()
+            except (requests.exceptions.RequestException, zlib.error,
+                    etree.XMLSyntaxError) as err:
+                self.logging.warning('%s partially read: %s' % (url, err))
+            yield from self.read_events(parser)
+
+    @staticmethod
+    def read_events(parser: etree.XMLPullParser):
+        """Get the entries of the tags already parsed."""
+        for _, element in parser.read_events():
+            tag = element.tag
+            # We ignore the comments and the processing instructions
+            if not isinstance(tag, str):
+                continue
+
+            # We remove the XML namespace
+            tag = tag.rsplit('}', 1)[-1]
+            if tag in ('url', 'sitemap'):
+                # We free the memory, the entry is already read
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+            elif tag == 'loc' and element.text:
+                entry = element.getparent()
+                if entry is not None:
+                    kind = entry.tag.rsplit('}', 1)[-1]
+                    if kind in ('url', 'sitemap'):
+                        yield kind, element.text.strip()
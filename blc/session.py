@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Session module."""
+
+from . import timing
+import collections
+import socket
+import threading
+import time
+import requests
+import requests_html
+import urllib3.connection
+import urllib3.connectionpool
+import urllib3.util.connection
+
+
+class DNSCache:
+    """
+    Keep the addresses of the hosts resolved.
+
+    Once installed, the connections opened by urllib3 resolve
+    each host once during the lifetime of his addresses.
+
+    :ttl represent the lifetime of the addresses in seconds
+    :max_size represent the maximum number of hosts kept
+    """
+
+    def __init__(self, ttl: float = 300, max_size: int = 1024):
+        """Init the cache."""
+        self.ttl = ttl
+        self.max_size = max(1, max_size)
+
+        # Will represent the addresses by host, the last used at the end
+        self.addresses = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def getaddrinfo(self, host, port, *args, **kwargs) -> list:
+        """Resolve a host like socket.getaddrinfo."""
+        key = (host, port, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+
+        with self.lock:
+            if key in self.addresses:
+                expiry, addresses = self.addresses[key]
+                if expiry > now:
+                    self.addresses.move_to_end(key)
+                    self.hits += 1
+                    return addresses
+                del self.addresses[key]
+            self.misses += 1
+
+        # NB: The resolution is done without the lock
+        with timing.Measure('dns'):
+            addresses = socket.getaddrinfo(host, port, *args, **kwargs)
+
+        with self.lock:
+            self.addresses[key] = now + self.ttl, addresses
+            while len(self.addresses) > self.max_size:
+                self.addresses.popitem(last=False)
+        return addresses
+
+    def install(self) -> None:
+        """Use the cache for the connections of urllib3."""
+        urllib3.util.connection.socket = CachedSocket(self)
+
+    @staticmethod
+    def uninstall() -> None:
+        """Stop to use a cache for the connections of urllib3."""
+        urllib3.util.connection.socket = socket
+
+    def stats(self) -> dict:
+        """Get the counters of the cache."""
+        return {
+            'hosts': len(self.addresses),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+class CachedSocket:
+    """
+    Represent the module socket with a cache of the resolutions.
+
+    :cache represent the cache of the resolutions
+    """
+
+    def __init__(self, cache: DNSCache):
+        """Init the module."""
+        self.getaddrinfo = cache.getaddrinfo
+
+    def __getattr__(self, name: str):
+        """Get the other attributes of the module socket."""
+        return getattr(socket, name)
+
+
+class TimedHTTPConnection(urllib3.connection.HTTPConnection):
+    """Measure the opening of the connections."""
+
+    def _new_conn(self):
+        """Open the connection."""
+        with timing.Measure('connect', exclude=('dns',)):
+            return super()._new_conn()
+
+
+class TimedHTTPSConnection(urllib3.connection.HTTPSConnection):
+    """Measure the opening and the TLS handshake of the connections."""
+
+    def _new_conn(self):
+        """Open the connection."""
+        with timing.Measure('connect', exclude=('dns',)):
+            return super()._new_conn()
+
+    def connect(self) -> None:
+        """Open the connection and make the TLS handshake."""
+        with timing.Measure('tls', exclude=timing.CONNECTION_PHASES):
+            super().connect()
+
+
+class TimedHTTPConnectionPool(urllib3.connectionpool.HTTPConnectionPool):
+    """Represent a pool of connections measured."""
+
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(urllib3.connectionpool.HTTPSConnectionPool):
+    """Represent a pool of connections measured."""
+
+    ConnectionCls = TimedHTTPSConnection
+
+
+class PoolAdapter(requests.adapters.HTTPAdapter):
+    """
+    Keep the connections alive between the requests on a same host.
+
+    Each host has his own pool, so the limits are by host, not in total:
+    at most pool_hosts * pool_size connections are kept alive. Beyond
+    pool_hosts hosts, the pool of the host the least recently used
+    is closed.
+
+    :pool_hosts represent the number of hosts whose connections are kept
+    :pool_size represent the number of connections kept by host
+    :pool_block wait a free connection of the host instead of opening
+        a connection who will be thrown away, it limits the connections
+        in use by host
+    """
+
+    def __init__(self, pool_hosts: int = 10, pool_size: int = 10,
+                 pool_block: bool = False):
+        """Init the adapter."""
+        super().__init__(pool_connections=pool_hosts, pool_maxsize=pool_size,
+                         pool_block=pool_block)
+
+        # Settings of the pools, to build the same adapter in a worker
+        self.settings = {
+            'pool_hosts': pool_hosts,
+            'pool_size': pool_size,
+            'pool_block': pool_block,
+        }
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        """Init the pools, with connections measured."""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+    def stats(self) -> dict:
+        """Get the counters of the pools of connections."""
+        pools = [
+            pool for pool in map(
+                self.poolmanager.pools.get, self.poolmanager.pools.keys())
+            if pool is not None
+        ]
+        return {
+            'hosts': len(pools),
+            'connections': sum(i.num_connections for i in pools),
+            'requests': sum(i.num_requests for i in pools),
+            # NB: The free places of a pool are filled with None
+            'idle': sum(
+                1 for i in pools if i.pool
+                for conn in list(i.pool.queue) if conn),
+        }
+
+
+def new_session(pool_hosts: int = 10, pool_size: int = 10,
+                pool_block: bool = False,
+                headers: dict = None) -> requests_html.HTMLSession:
+    """
+    Build a session of the checkers.
+
+    :pool_hosts represent the number of hosts whose connections are kept
+    :pool_size represent the number of connections kept by host
+    :pool_block wait a free connection of the host instead of opening
+        a connection who will be thrown away
+    :headers represent the headers sent with each request
+    """
+    session = requests_html.HTMLSession()
+    session.headers.update({
+        "User-Agent": "BrokenLinkChecker/1.0",
+    })
+    session.headers.update(headers or {})
+
+    adapter = PoolAdapter(pool_hosts, pool_size, pool_block)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def session_settings(session: requests.Session) -> dict:
+    """
+    Get the settings of a session, to build the same session elsewhere.
+
+    :session represent a session built by new_session
+    :return the arguments of new_session
+    """
+    adapter = session.get_adapter('http://')
+    settings = dict(getattr(adapter, 'settings', {}))
+    settings['headers'] = dict(session.headers)
+    return settings
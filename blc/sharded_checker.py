@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Sharded checker module."""
+
+from .async_checker import AsyncChecker
+from .cache import CrawlCache
+from .checker import Checker
+from .fingerprint import SimHashIndex
+from .retry import RetryPolicy
+from .scheduler import Scheduler
+from .session import DNSCache, new_session, session_settings
+from .store import URLStore
+from .timing import Profiler
+import collections
+import logging
+import multiprocessing
+import os
+import queue
+import random
+import threading
+import time
+import zlib
+
+# Protect the environment while the workers are started
+ENV_LOCK = threading.Lock()
+
+
+class ShardedChecker(AsyncChecker):
+    """
+    Check if an broken URL is present inside a website.
+
+    Unlike the AsyncChecker, the URLs are checked by several processes,
+    each URL is given to a worker in function of his hash.
+    The checker stays the coordinator: he schedules the requests,
+    removes the duplicates and merges the results inside the attribute
+    urls, like a checking done by one process.
+
+    :processes represent the number of worker processes
+    :concurrency represent the maximum number of requests in flight
+    :dns_ttl represent the lifetime of the addresses resolved
+        by the workers, without cache by default
+    """
+
+    # Options of the checker given to the workers
+    WORKER_OPTIONS = ('deep_scan', 'browser_sleep', 'extractor',
+                      'render_pattern', 'render_empty', 'max_download_size',
+                      'timeout', 'internal_origins', 'canonicalizer')
+
+    def __init__(self, host: str, processes: int = None,
+                 concurrency: int = 10, dns_ttl: float = None, **kwargs):
+        """Init the checker."""
+        super().__init__(host, concurrency=concurrency, **kwargs)
+
+        self.processes = max(1, processes or os.cpu_count() or 1)
+
+        # Options of the workers, the browser is launched by each worker
+        self.options = {
+            key: value for key, value in kwargs.items()
+            if key in self.WORKER_OPTIONS
+        }
+        if self.cache:
+            self.options['cache_dir'] = os.path.dirname(self.cache.path)
+        if self.profiler:
+            self.options['profile'] = self.profiler.path
+
+        # The session can't be sent to the workers, they build
+        # the same session
+        self.options['session'] = session_settings(self.conn)
+        if dns_ttl:
+            self.options['dns_ttl'] = dns_ttl
+
+        # Will represent the counters of the pools of the workers
+        self.pool_stats = collections.Counter()
+
+        # NB: The fingerprints are computed by the workers,
+        # so they must share the same hash function
+        self.hash_seed = random.randrange(1, 2 ** 32)
+
+        self.workers = []
+        self.tasks = []
+        self.results_queue = None
+
+    def shard(self, url: str) -> int:
+        """Get the worker of an URL."""
+        return zlib.crc32(url.encode()) % self.processes
+
+    def start(self) -> None:
+        """Start the workers."""
+        context = multiprocessing.get_context('spawn')
+        self.results_queue = context.Queue()
+
+        with ENV_LOCK:
+            hash_seed = os.environ.get('PYTHONHASHSEED')
+            os.environ['PYTHONHASHSEED'] = str(self.hash_seed)
+            try:
+                for _ in range(self.processes):
+                    tasks = context.Queue()
+                    worker = context.Process(
+                        target=work,
+                        args=(self.host, self.options, tasks,
+                              self.results_queue),
+                        daemon=True)
+                    worker.start()
+                    self.tasks.append(tasks)
+                    self.workers.append(worker)
+            finally:
+                if hash_seed is None:
+                    del os.environ['PYTHONHASHSEED']
+                else:
+                    os.environ['PYTHONHASHSEED'] = hash_seed
+
+        self.logging.debug('%i workers started' % self.processes)
+
+    def stop(self) -> None:
+        """Stop the workers."""
+        for tasks in self.tasks:
+            tasks.put(None)
+
+        # Each worker sends the counters of his pools before he stops,
+        # after the checkings not merged in case of error
+        stopped = 0
+        while stopped < len(self.workers):
+            try:
+                message = self.results_queue.get(timeout=5)
+            except queue.Empty:
+                break
+            if message[0] == 'stats':
+                self.pool_stats.update(message[1])
+                stopped += 1
+
+        for worker in self.workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        self.workers = []
+        self.tasks = []
+
+    def merge(self, message: tuple) -> str:
+        """
+        Merge the checking of an URL done by a worker.
+
+        :message represent the checking of the worker
+        :return the URL checked
+        """
+        (url, result, check_time, timings, size, found, fingerprint,
+         canonical, observed, error) = message
+
+        if error:
+            self.logging.error('Checking of %s failed: %s' % (url, error))
+
+        record = self.urls.record(url)
+        record.result = result
+        record.check_time = check_time
+        record.timings = timings
+        self.count_bytes(size)
+
+        # We slow down if the host ask it
+        if observed:
+            self.scheduler.observe(url, Observed(*observed))
+
+        # We share the result of the foreign URL
+        if (self.results and result and not self.is_same_host(url)
+                and not RetryPolicy.is_transient(result)):
+            self.results.set(url, result)
+
+        # We verify if we are not already got this content
+        #   in a previous request
+        if fingerprint is not None and self.seen_content(url, fingerprint):
+            return url
+
+        # We verify if the canonical URL of the webpage is not
+        #   already found
+        if canonical and self.seen_canonical(url, canonical):
+            self.logging.warning(
+                '%s skipped because his canonical URL %s'
+                ' is already found.' % (url, canonical)
+            )
+            return url
+
+        for link in found:
+            self.add_url(*link)
+        return url
+
+    def dispatch(self) -> str:
+        """
+        Give the next URL ready to his worker.
+
+        :return None if no URL is ready
+        """
+        # We respect the budget shared with the other checkers
+        if self.budget and not self.budget.acquire(blocking=False):
+            return None
+
+        url = self.next_url()
+        if url is None:
+            if self.budget:
+                self.budget.release()
+            return None
+
+        self.scheduler.acquire(url)
+        self.tasks[self.shard(url)].put((url, self.urls.record(url).target))
+        return url
+
+    def crawl_shards(self) -> None:
+        """Check all the URLs with the workers."""
+        pending = set()
+
+        # We check while we have an URL unchecked and some budget,
+        # or an URL in checking
+        while (((self.frontier or self.scheduler.has_waiting())
+                and not self.exhausted()) or pending):
+            while len(pending) < self.concurrency and not self.exhausted():
+                url = self.dispatch()
+                if url is None:
+                    break
+                pending.add(url)
+
+            # We wait either the end of a checking, the turn
+            # of a host on hold or the time of an URL to check again
+            times = [
+                i for i in (self.scheduler.next_time(),
+                            self.frontier.next_time())
+                if i is not None
+            ]
+            timeout = min(times) if times else None
+            if not pending:
+                time.sleep(timeout or 0)
+                continue
+
+            try:
+                # NB: We verify regularly the workers are alive
+                message = self.results_queue.get(timeout=min(timeout or 1, 1))
+            except queue.Empty:
+                if not all(worker.is_alive() for worker in self.workers):
+                    raise RuntimeError('A worker stopped unexpectedly')
+                continue
+
+            url = self.merge(message)
+            pending.discard(url)
+            self.scheduler.release(url)
+            if self.budget:
+                self.budget.release()
+            self.task_done(url)
+
+    def run(self) -> None:
+        """Run the checker."""
+        self.start()
+        try:
+            self.crawl_shards()
+        finally:
+            self.stop()
+
+
+class Observed:
+    """
+    Represent the response observed by a worker.
+
+    :status_code represent the status code of the response
+    :retry_after represent the header Retry-After of the response
+    """
+
+    def __init__(self, status_code: int, retry_after: str):
+        """Init the response."""
+        self.status_code = status_code
+        self.headers = {'Retry-After': retry_after} if retry_after else {}
+
+
+class WorkerScheduler(Scheduler):
+    """Keep the last response observed, the scheduling is done outside."""
+
+    last = None
+
+    def observe(self, url: str, response) -> None:
+        """Keep the response observed."""
+        self.last = (response.status_code,
+                     response.headers.get('Retry-After'))
+
+
+class WorkerIndex(SimHashIndex):
+    """Keep the last fingerprint, the duplicates are removed outside."""
+
+    last = None
+
+    def seen_fingerprint(self, fingerprint: int) -> float:
+        """Keep the fingerprint, never seen for the worker."""
+        self.last = fingerprint
+        return None
+
+
+class Worker(Checker):
+    """
+    Check the URLs given by a ShardedChecker.
+
+    The URLs found are collected instead of being queued.
+    Each worker writes his own profile, suffixed by his pid.
+
+    :session represent the settings of the session of the coordinator
+    :dns_ttl represent the lifetime of the addresses resolved
+    """
+
+    def __init__(self, host: str, cache_dir: str = None, profile: str = None,
+                 session: dict = None, dns_ttl: float = None, **kwargs):
+        """Init the worker."""
+        # We resolve each host once, like the coordinator
+        if dns_ttl:
+            DNSCache(ttl=dns_ttl).install()
+
+        super().__init__(
+            host, delay=0,
+            conn=new_session(**session) if session else None,
+            cache=CrawlCache(cache_dir) if cache_dir else None,
+            profiler=(
+                Profiler('%s.%i' % (profile, os.getpid()))
+                if profile else None),
+            **kwargs)
+        self.scheduler = WorkerScheduler(delay=0)
+        self.fingerprints = WorkerIndex()
+        self.found = []
+        self.canonical_url = None
+        self.size = 0
+
+    def add_url(self, url: str, parent: str, origin_url: str) -> bool:
+        """Collect an URL found."""
+        self.found.append((url, parent, origin_url))
+        return True
+
+    def seen_canonical(self, url: str, canonical: str) -> bool:
+        """Keep the canonical URL, the duplicates are removed outside."""
+        self.canonical_url = canonical
+        return False
+
+    def count_bytes(self, size: int) -> None:
+        """Keep the size of the webpage, the budget is spent outside."""
+        self.size += size
+
+    def work(self, url: str, target: str = None) -> tuple:
+        """
+        Check an URL.
+
+        :url represent the URL to check, in his canonical form
+        :target represent the URL to request, if different
+        :return the message of the checking for the coordinator
+        """
+        # Each URL is checked once by a worker
+        self.urls = URLStore()
+        self.urls.add(url, target=target)
+        self.found = []
+        self.canonical_url = None
+        self.size = 0
+        self.scheduler.last = None
+        self.fingerprints.last = None
+
+        error = None
+        try:
+            self.visit(url)
+        except Exception as err:
+            error = repr(err)
+            self.logging.exception('Checking of %s failed' % url)
+
+        record = self.urls.record(url)
+        return (url, record.result, record.check_time, record.timings,
+                self.size, self.found, self.fingerprints.last,
+                self.canonical_url, self.scheduler.last, error)
+
+    def close(self) -> None:
+        """Free the resources of the worker."""
+        if self.cache:
+            self.cache.close()
+        if self.renderer:
+            self.renderer.close()
+        if self.profiler:
+            self.profiler.dump()
+
+
+def work(host: str, options: dict, tasks, results) -> None:
+    """
+    Run a worker until he receives None.
+
+    :host represent the website to check
+    :options represent the options of the checker
+    :tasks represent the queue of the URLs to check,
+        with the URL to request
+    :results represent the queue of the results
+    """
+    logging.disable(logging.CRITICAL)
+
+    worker = Worker(host, **options)
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                results.put(('stats', worker.conn.adapters['http://'].stats()))
+                break
+            results.put(worker.work(*task))
+    finally:
+        worker.close()
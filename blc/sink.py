@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Sink module."""
+
+import abc
+import collections
+import csv
+import io
+import json
+import sys
+import threading
+
+
+class Sink(abc.ABC):
+    """
+    Write the result of each URL as soon as it is checked.
+
+    The results of all the checkers are written in the same stream,
+    one record by line. Only the broken URLs are kept in memory
+    to build the final report, the URLs who succeeded after
+    transient errors are flaky. Each format is a subclass.
+
+    :path represent the file where write the records,
+        '-' for the standard output, nothing written by default
+    """
+
+    # Represent the extension and the type of the files of the sink
+    EXTENSION = None
+    MIMETYPE = None
+
+    FIELDS = ('target', 'url', 'real_url', 'aliases', 'parent', 'ok', 'status',
+              'reason', 'check_time', 'attempts', 'timings')
+
+    def __init__(self, path: str = None):
+        """Init the sink."""
+        self.path = path
+        if path == '-':
+            self.stream = sys.stdout
+        elif path:
+            self.stream = open(path, 'w', newline='')
+        else:
+            self.stream = None
+
+        # Will represent the broken URLs and the number of URLs by target
+        self.broken = collections.defaultdict(list)
+        self.counts = collections.Counter()
+        self.flaky = collections.Counter()
+
+        self.lock = threading.Lock()
+
+        if self.stream:
+            self.start()
+
+    def start(self) -> None:
+        """Write the header of the stream."""
+        pass
+
+    @abc.abstractmethod
+    def format(self, record: dict) -> None:
+        """Write a record inside the stream."""
+
+    def write(self, target: str, url: str, info: dict) -> None:
+        """
+        Save the result of an URL.
+
+        :target represent the website checked
+        :url represent the URL checked
+        :info represent the state of the URL
+        """
+        ok, status, reason = info['result'] or (False, None, 'Not checked')
+        record = {
+            'target': target,
+            'url': url,
+            'real_url': info['url'],
+            'aliases': info.get('aliases', []),
+            'parent': info['parent'],
+            'ok': ok,
+            'status': status,
+            'reason': reason,
+            'check_time': info['check_time'],
+            'attempts': info.get('attempts', 0),
+            'timings': info.get('timings'),
+        }
+
+        with self.lock:
+            self.counts[target] += 1
+            if record['attempts'] and ok:
+                self.flaky[target] += 1
+            if not ok:
+                self.broken[target].append(record)
+
+            if self.stream:
+                self.format(record)
+                # We flush to keep the results in case of crash
+                self.stream.flush()
+
+    @classmethod
+    def dumps(cls, records: list) -> str:
+        """
+        Represent some records in the format of the sink.
+
+        :records represent the records already written
+        """
+        sink = cls()
+        sink.stream = io.StringIO()
+        sink.start()
+        for record in records:
+            sink.format(record)
+        return sink.stream.getvalue()
+
+    def close(self) -> None:
+        """Close the stream."""
+        if self.stream and self.stream is not sys.stdout:
+            self.stream.close()
+
+
+class JSONLSink(Sink):
+    """Write the results as JSON Lines."""
+
+    EXTENSION = 'jsonl'
+    MIMETYPE = 'application/x-ndjson'
+
+    def format(self, record: dict) -> None:
+        """Write a record as a JSON object."""
+        self.stream.write(json.dumps(record) + '\n')
+
+
+class CSVSink(Sink):
+    """
+    Write the results as CSV.
+
+    The parents and the aliases are separated by a space,
+    the timings are a JSON object.
+    """
+
+    EXTENSION = 'csv'
+    MIMETYPE = 'text/csv'
+
+    def start(self) -> None:
+        """Write the names of the columns."""
+        self.writer = csv.writer(self.stream)
+        self.writer.writerow(self.FIELDS)
+
+    def format(self, record: dict) -> None:
+        """Write a record as a CSV row."""
+        record = dict(record, parent=' '.join(record['parent']),
+                      aliases=' '.join(record['aliases']),
+                      timings=json.dumps(record['timings']))
+        self.writer.writerow([record[i] for i in self.FIELDS])
+
+
+# Represent the sinks available by format
+SINKS = {
+    'jsonl': JSONLSink,
+    'csv': CSVSink,
+}
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Store module."""
+
+from array import array
+import collections.abc
+
+
+class Record:
+    """
+    Represent the state of an URL.
+
+    :parents represent the ids of the webpages who contain the URL,
+        an integer for one webpage, an array for a few, a set beyond
+    :url represent the URL as found in the webpage
+    :target represent the absolute URL requested, the first spelling
+        found, None if it is the canonical form
+    :aliases represent the other spellings of the URL found,
+        with the same canonical form
+    :result represent the result of the checking
+    :check_time represent the time of the checking
+    :attempts represent the number of retries of the checking
+    :timings represent the time of each phase of the checking
+    :depth represent the number of links followed from the website
+        to the URL, by the shortest way
+    """
+
+    __slots__ = ('parents', 'url', 'target', 'aliases', 'result',
+                 'check_time', 'attempts', 'timings', 'depth')
+
+    # Maximum number of parents kept inside an array,
+    # a set is faster beyond
+    ARRAY_SIZE = 16
+
+    def __init__(self, url: str = None, parent: int = None,
+                 depth: int = 0, target: str = None):
+        """Init the record."""
+        self.parents = parent
+        self.url = url
+        self.target = target
+        self.aliases = None
+        self.result = None
+        self.check_time = None
+        self.attempts = 0
+        self.timings = None
+        self.depth = depth
+
+    def add_parent(self, parent: int, max_parents: int = None) -> bool:
+        """
+        Add a webpage who contains the URL.
+
+        :parent represent the id of the webpage
+        :max_parents represent the maximum number of webpages kept
+        :return True if the webpage was added
+        """
+        parents = self.parents
+        if parents is None:
+            self.parents = parent
+        elif isinstance(parents, int):
+            if parents == parent or max_parents == 1:
+                return False
+            self.parents = array('l', (parents, parent))
+        elif max_parents is not None and len(parents) >= max_parents:
+            return False
+        elif isinstance(parents, set):
+            if parent in parents:
+                return False
+            parents.add(parent)
+        elif parent in parents:
+            return False
+        elif len(parents) < self.ARRAY_SIZE:
+            parents.append(parent)
+        else:
+            self.parents = set(parents)
+            self.parents.add(parent)
+        return True
+
+    def add_alias(self, alias: str) -> bool:
+        """
+        Add a spelling of the URL.
+
+        :alias represent the URL as found in a webpage
+        :return True if the spelling was new
+        """
+        if alias is None or alias == self.url:
+            return False
+        elif self.aliases is None:
+            self.aliases = {alias}
+        elif alias in self.aliases:
+            return False
+        else:
+            self.aliases.add(alias)
+        return True
+
+    def parent_count(self) -> int:
+        """Get the number of webpages who contain the URL."""
+        if self.parents is None:
+            return 0
+        elif isinstance(self.parents, int):
+            return 1
+        else:
+            return len(self.parents)
+
+    def parent_ids(self) -> list:
+        """Get the ids of the webpages who contain the URL."""
+        if self.parents is None:
+            return []
+        elif isinstance(self.parents, int):
+            return [self.parents]
+        else:
+            return sorted(self.parents)
+
+
+class URLStore(collections.abc.Mapping):
+    """
+    Represent the URLs found by a checker.
+
+    Each URL is interned once and identified by an integer,
+    the parents are kept as ids inside compact records.
+    Like a dict, the store gives for each URL a view with the keys
+    parent, url, aliases, result, check_time, attempts and timings,
+    built on demand.
+
+    The changes must be protected by the lock of the checker.
+
+    :max_parents represent the maximum number of parents kept by URL,
+        all by default
+    """
+
+    def __init__(self, max_parents: int = None):
+        """Init the store."""
+        self.max_parents = max_parents or None
+
+        # Will represent the id of each URL and the URL of each id
+        self.ids = {}
+        self.names = []
+
+        # Will represent the record of each id,
+        # None for the parents who are not in the store
+        self.records = []
+        self.size = 0
+
+    def intern(self, url: str) -> int:
+        """Get the id of an URL, a new id is given to an unknown URL."""
+        id = self.ids.get(url)
+        if id is None:
+            id = self.ids[url] = len(self.names)
+            self.names.append(url)
+            self.records.append(None)
+        return id
+
+    def add(self, url: str, origin_url: str = None,
+            parent: str = None, target: str = None) -> bool:
+        """
+        Add an URL.
+
+        :url represent the absolute URL, in his canonical form
+        :origin_url represent the URL as found in the webpage
+        :parent represent the URL of the webpage who contains this URL
+        :target represent the absolute URL to request,
+            if different of the canonical form
+        :return True if the URL was not yet in the store
+        """
+        id = self.intern(url)
+        if self.records[id] is not None:
+            return False
+
+        self.records[id] = Record(
+            origin_url, None if parent is None else self.intern(parent),
+            self.child_depth(parent), target)
+        self.size += 1
+        return True
+
+    def target(self, url: str) -> str:
+        """Get the absolute URL to request for an URL of the store."""
+        return self.record(url).target or url
+
+    def child_depth(self, parent: str) -> int:
+        """
+        Get the depth of an URL found in a webpage.
+
+        :parent represent the URL of the webpage,
+            None for the website itself
+        :return 1 if the webpage is not in the store, like a sitemap
+        """
+        if parent is None:
+            return 0
+        elif parent in self:
+            return self.record(parent).depth + 1
+        else:
+            return 1
+
+    def add_parent(self, url: str, parent: str) -> bool:
+        """
+        Add a webpage who contains an URL of the store.
+
+        :url represent the absolute URL
+        :parent represent the URL of the webpage
+        :return True if the webpage was added
+        """
+        record = self.record(url)
+        # The depth is the one of the shortest way
+        record.depth = min(record.depth, self.child_depth(parent))
+        return record.add_parent(self.intern(parent), self.max_parents)
+
+    def add_alias(self, url: str, alias: str) -> bool:
+        """
+        Add a spelling of an URL of the store.
+
+        :url represent the absolute URL
+        :alias represent the URL as found in a webpage
+        :return True if the spelling was new
+        """
+        return self.record(url).add_alias(alias)
+
+    def record(self, url: str) -> Record:
+        """Get the record of an URL."""
+        id = self.ids.get(url)
+        record = None if id is None else self.records[id]
+        if record is None:
+            raise KeyError(url)
+        return record
+
+    def parents(self, url: str) -> list:
+        """Get the URLs of the webpages who contain an URL."""
+        return [self.names[id] for id in self.record(url).parent_ids()]
+
+    def __getitem__(self, url: str) -> 'RecordView':
+        """Get the view of an URL."""
+        return RecordView(self, url, self.record(url))
+
+    def __contains__(self, url: str) -> bool:
+        """Verify if an URL is in the store."""
+        id = self.ids.get(url)
+        return id is not None and self.records[id] is not None
+
+    def __iter__(self):
+        """Iterate on the URLs in the order of addition."""
+        for url, record in zip(self.names, self.records):
+            if record is not None:
+                yield url
+
+    def __len__(self) -> int:
+        """Get the number of URLs."""
+        return self.size
+
+
+class RecordView(collections.abc.MutableMapping):
+    """
+    Represent the record of an URL as a dict.
+
+    :store represent the store of the URL
+    :url represent the URL
+    :record represent the record of the URL
+    """
+
+    KEYS = ('parent', 'url', 'aliases', 'result', 'check_time', 'attempts',
+            'timings')
+
+    def __init__(self, store: URLStore, url: str, record: Record):
+        """Init the view."""
+        self.store = store
+        self.name = url
+        self.record = record
+
+    def __getitem__(self, key: str):
+        """Get a value of the record."""
+        if key == 'parent':
+            return self.store.parents(self.name)
+        elif key == 'aliases':
+            return sorted(self.record.aliases or ())
+        elif key in self.KEYS:
+            return getattr(self.record, key)
+        else:
+            raise KeyError(key)
+
+    def __setitem__(self, key: str, value) -> None:
+        """Change a value of the record."""
+        if key == 'parent':
+            self.record.parents = None
+            for parent in value:
+                self.store.add_parent(self.name, parent)
+        elif key == 'aliases':
+            self.record.aliases = set(value) or None
+        elif key in self.KEYS:
+            setattr(self.record, key, value)
+        else:
+            raise KeyError(key)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a value of the record, forbidden."""
+        raise TypeError('The keys of a record can\'t be removed')
+
+    def __iter__(self):
+        """Iterate on the keys."""
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        """Get the number of keys."""
+        return len(self.KEYS)
+
+    def __repr__(self) -> str:
+        """Represent the record as a dict."""
+        return repr(dict(self))
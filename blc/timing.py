@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Timing module."""
+
+import bisect
+import cProfile
+import logging
+import pstats
+import threading
+import time
+
+# Phases of the checking of an URL, in their order
+PHASES = ('wait', 'dns', 'connect', 'tls', 'ttfb', 'download', 'extract',
+          'fingerprint', 'render')
+
+# Phases of the opening of a connection
+CONNECTION_PHASES = ('dns', 'connect', 'tls')
+
+# Represent the timings of the URL checked by the current thread
+_local = threading.local()
+
+
+def start() -> dict:
+    """Start to measure the phases of the checking of an URL."""
+    _local.timings = {}
+    return _local.timings
+
+
+def stop() -> dict:
+    """
+    Stop to measure the phases of the checking of an URL.
+
+    :return the time in seconds of each phase
+    """
+    timings = getattr(_local, 'timings', None)
+    _local.timings = None
+    return timings
+
+
+def add(phase: str, seconds: float) -> None:
+    """
+    Add the time of a phase to the URL checked by the current thread.
+
+    :phase represent the name of the phase
+    :seconds represent the time spent
+    """
+    timings = getattr(_local, 'timings', None)
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0) + seconds
+
+
+def spent(phases: tuple) -> float:
+    """
+    Get the time already spent in some phases by the current thread.
+
+    :phases represent the names of the phases
+    """
+    timings = getattr(_local, 'timings', None) or {}
+    return sum(timings.get(i, 0) for i in phases)
+
+
+class Measure:
+    """
+    Measure the time of a phase inside a with statement.
+
+    :phase represent the name of the phase
+    :exclude represent the phases measured inside this phase,
+        whose the time is not counted twice
+    """
+
+    def __init__(self, phase: str, exclude: tuple = ()):
+        """Init the measure."""
+        self.phase = phase
+        self.exclude = exclude
+
+    def __enter__(self):
+        """Start the measure."""
+        self.excluded = spent(self.exclude)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop the measure."""
+        seconds = time.perf_counter() - self.start
+        add(self.phase, seconds - (spent(self.exclude) - self.excluded))
+
+
+class Histogram:
+    """
+    Represent the distribution of the times of a phase.
+
+    The times are counted by bucket, so the memory used is fixed
+    whatever the number of URLs.
+    """
+
+    # Upper bounds of the buckets in seconds, the last is unbounded
+    BOUNDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+              1, 2.5, 5, 10)
+
+    def __init__(self):
+        """Init the histogram."""
+        self.buckets = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, seconds: float) -> None:
+        """
+        Count a time.
+
+        :seconds represent the time
+        """
+        self.buckets[bisect.bisect_left(self.BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, rank: float) -> float:
+        """
+        Estimate a percentile, interpolated inside his bucket.
+
+        :rank represent the percentile between 0 and 1
+        """
+        if not self.count:
+            return 0
+        threshold = rank * self.count
+        total = 0
+        lower = 0
+        for bound, count in zip(self.BOUNDS, self.buckets):
+            if count and total + count >= threshold:
+                value = lower + (bound - lower) * (threshold - total) / count
+                return min(value, self.max)
+            total += count
+            lower = bound
+        return self.max
+
+
+class Metrics:
+    """
+    Aggregate the timings of the URLs checked.
+
+    The timings of each URL are given to the hooks, to export them
+    to a monitoring. A hook is a function called with the website,
+    the URL and his timings; it must be fast, he is called
+    by the checkers.
+
+    :hooks represent the functions who receive the timings
+    """
+
+    def __init__(self, hooks: list = None):
+        """Init the metrics."""
+        self.logging = logging.getLogger('metrics')
+        self.logging.setLevel(logging.DEBUG)
+
+        self.hooks = list(hooks or [])
+        self.histograms = {phase: Histogram() for phase in PHASES}
+        self.lock = threading.Lock()
+
+    def subscribe(self, hook) -> None:
+        """
+        Add a function who receives the timings of each URL.
+
+        :hook represent the function
+        """
+        self.hooks.append(hook)
+
+    def add(self, target: str, url: str, timings: dict) -> None:
+        """
+        Count the timings of an URL checked.
+
+        :target represent the website checked
+        :url represent the URL checked
+        :timings represent the time of each phase
+        """
+        if not timings:
+            return
+
+        with self.lock:
+            for phase, seconds in timings.items():
+                self.histograms.setdefault(phase, Histogram()).add(seconds)
+
+        for hook in self.hooks:
+            try:
+                hook(target, url, timings)
+            except Exception:
+                self.logging.exception('The hook %r failed' % hook)
+
+    def report(self) -> str:
+        """Represent the histograms as a table."""
+        lines = ['%-12s %8s %10s %10s %10s %10s' % (
+            'Phase', 'Count', 'Mean', 'p50', 'p95', 'Max')]
+        with self.lock:
+            for phase, histogram in self.histograms.items():
+                if not histogram.count:
+                    continue
+                lines.append('%-12s %8i %9.1fms %9.1fms %9.1fms %9.1fms' % (
+                    phase, histogram.count,
+                    histogram.total / histogram.count * 1000,
+                    histogram.percentile(0.5) * 1000,
+                    histogram.percentile(0.95) * 1000,
+                    histogram.max * 1000))
+        return '\n'.join(lines)
+
+
+class Profiler:
+    """
+    Profile the checking of the URLs with cProfile.
+
+    Only one profile can be active at a time (since Python 3.12,
+    it follows all the threads), so one checking is profiled at once:
+    the checkings of the other threads meanwhile are not profiled,
+    like the checkings while another profiling tool is active.
+
+    :path represent the file where the statistics are written,
+        readable with the module pstats
+    """
+
+    def __init__(self, path: str):
+        """Init the profiler."""
+        self.logging = logging.getLogger('profiler')
+        self.logging.setLevel(logging.DEBUG)
+        self.path = path
+        self.profile = cProfile.Profile()
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+        # Will represent the number of checkings profiled and not
+        self.profiled = 0
+        self.skipped = 0
+
+    def __enter__(self):
+        """Profile the current thread, if no checking is profiled."""
+        self.local.active = self.lock.acquire(blocking=False)
+        if self.local.active:
+            try:
+                self.profile.enable()
+            except ValueError:
+                # Another profiling tool is active
+                self.local.active = False
+                self.lock.release()
+
+        if self.local.active:
+            self.profiled += 1
+        else:
+            self.skipped += 1
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop to profile the current thread."""
+        if self.local.active:
+            self.local.active = False
+            self.profile.disable()
+            self.lock.release()
+
+    def dump(self) -> None:
+        """Write the statistics of the checkings profiled."""
+        with self.lock:
+            if not self.profiled:
+                return
+            pstats.Stats(self.profile).dump_stats(self.path)
+        self.logging.debug(
+            '%i checkings profiled, %i not profiled'
+            % (self.profiled, self.skipped))
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Trap module."""
+
+from urllib.parse import unquote_plus, urlsplit
+import collections
+import logging
+import re
+
+
+class TrapDetector:
+    """
+    Detect the URLs of the crawler traps before they are queued.
+
+    A trap generates endless unique URLs: session ids, segments
+    repeated by relative links (/a/b/a/b/...), queries who grow,
+    calendars or faceted searches. Each URL is verified once,
+    from his text only, so the detection is cheap. The URLs suspected
+    are not checked, they are counted by pattern with an example.
+    Only the URLs of the website are verified: the foreign URLs
+    are requested, never crawled.
+
+    :max_length represent the maximum length of an URL
+    :max_repeats represent the maximum number of times a same segment
+        appears in a path
+    :max_queries represent the maximum number of queries of a same path
+    :max_template represent the maximum number of URLs of a same
+        template, the path whose the numbers are replaced,
+        disabled by default since a large website has many
+        legitimate URLs like /product/{n}
+    :session_params represent the names of the parameters of a session id,
+        case-insensitive
+    """
+
+    # Represent the description of each kind of trap
+    REASONS = {
+        'length': 'URL too long',
+        'session': 'session id',
+        'repeat': 'segment repeated in the path',
+        'query': 'too many queries for a same path',
+        'template': 'too many URLs for a same template',
+    }
+
+    SESSION_PARAMS = ('sid', 'sessionid', 'session_id', 'phpsessid',
+                      'jsessionid', 'aspsessionid', 'cfid', 'cftoken')
+
+    # Regex to find the numbers of a path
+    REGEX_NUMBER = re.compile(r'\d+')
+
+    # Regex to find the names of the parameters of a path (Eg: ;jsessionid=)
+    REGEX_PARAM = re.compile(r';([^;=/]+)=')
+
+    def __init__(self, max_length: int = 2048, max_repeats: int = 3,
+                 max_queries: int = 100, max_template: int = 0,
+                 session_params: list = None):
+        """Init the detector."""
+        self.logging = logging.getLogger('trap')
+        self.logging.setLevel(logging.DEBUG)
+
+        self.max_length = max_length
+        self.max_repeats = max_repeats
+        self.max_queries = max_queries
+        self.max_template = max_template
+        self.session_params = frozenset(
+            i.lower() for i in (session_params or self.SESSION_PARAMS))
+
+        # Will represent the number of URLs by path and by template
+        self.queries = collections.Counter()
+        self.templates = collections.Counter()
+
+        # Will represent the URLs suspected by pattern, as
+        # [number of URLs, first URL, his parent]
+        self.suspects = {}
+
+        # Will represent the trap of each URL suspected, an URL found
+        # in several webpages is counted once
+        self.rejected = {}
+
+    def detect(self, url: str, parent: str = None) -> str:
+        """
+        Verify if a new URL is in a trap, the URL is counted.
+
+        The changes must be protected by the lock of the checker.
+
+        :url represent the absolute URL to verify
+        :parent represent the URL of the webpage who contains this URL
+        :return the kind of trap, None if the URL can be checked
+        """
+        trap = self.rejected.get(url)
+        if trap is not None:
+            return trap[0]
+
+        trap = self.match(url)
+        if trap is None:
+            return None
+
+        self.rejected[url] = trap
+        reason, pattern = trap
+        suspect = self.suspects.get(trap)
+        if suspect is None:
+            self.suspects[trap] = [1, url, parent]
+            self.logging.warning(
+                '%s ignored because %s: %s'
+                % (url, self.REASONS[reason], pattern))
+        else:
+            suspect[0] += 1
+        return reason
+
+    def count(self, url: str) -> None:
+        """
+        Count an URL added before, like the URLs of a checking resumed.
+
+        :url represent the absolute URL
+        """
+        try:
+            _, netloc, path, query, _ = urlsplit(url)
+        except ValueError:
+            return
+
+        if query and self.max_queries:
+            self.queries[netloc + path] += 1
+        if self.max_template:
+            self.templates[netloc + self.REGEX_NUMBER.sub('{n}', path)] += 1
+
+    def match(self, url: str) -> tuple:
+        """
+        Find the trap of an URL.
+
+        :url represent the absolute URL to verify
+        :return the kind of trap and his pattern, None without trap
+        """
+        if self.max_length and len(url) > self.max_length:
+            return 'length', url[:64] + '...'
+
+        try:
+            _, netloc, path, query, _ = urlsplit(url)
+        except ValueError:
+            return None
+
+        # The session id is either a parameter of the path or of the query
+        for name in self.REGEX_PARAM.findall(path):
+            if name.lower() in self.session_params:
+                return 'session', netloc + ' ' + name
+        for param in query.split('&'):
+            name = unquote_plus(param.partition('=')[0])
+            if name.lower() in self.session_params:
+                return 'session', netloc + ' ' + name
+
+        if self.max_repeats:
+            segments = [i for i in path.split('/') if i]
+            if len(segments) > self.max_repeats:
+                segment, count = collections.Counter(
+                    segments).most_common(1)[0]
+                if count > self.max_repeats:
+                    return 'repeat', netloc + ' ' + segment
+
+        if query and self.max_queries:
+            key = netloc + path
+            if self.queries[key] >= self.max_queries:
+                return 'query', key
+            self.queries[key] += 1
+
+        if self.max_template:
+            key = netloc + self.REGEX_NUMBER.sub('{n}', path)
+            if self.templates[key] >= self.max_template:
+                return 'template', key
+            self.templates[key] += 1
+        return None
+
+    def report(self) -> str:
+        """Represent the URLs suspected by pattern."""
+        lines = []
+        for (reason, pattern), (count, url, parent) in self.suspects.items():
+            lines.append(
+                f"{self.REASONS[reason]}: {pattern}\n"
+                f"    {count} URLs ignored, Eg: {url}"
+                f" found in {parent}")
+        return '\n'.join(lines)
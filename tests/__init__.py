@@ -1 +1,20 @@
-from .checker_test import CheckerTest
\ No newline at end of file
+from .checker_test import CheckerTest
+from .async_checker_test import AsyncCheckerTest
+from .scheduler_test import SchedulerTest
+from .frontier_test import FrontierTest
+from .extractor_test import ExtractorTest
+from .fingerprint_test import FingerprintTest
+from .cache_test import CacheTest
+from .store_test import StoreTest
+from .sink_test import SinkTest
+from .checkpoint_test import CheckpointTest
+from .session_test import SessionTest
+from .retry_test import RetryTest
+from .sharded_checker_test import ShardedCheckerTest
+from .seeder_test import SeederTest
+from .timing_test import TimingTest
+from .canonical_test import CanonicalTest
+from .origin_test import OriginTest
+from .notifier_test import NotifierTest
+from .budget_test import BudgetTest
+from .trap_test import TrapTest
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module async_checker."""
+
+import unittest
+from blc.async_checker import AsyncChecker
+
+
+class AsyncCheckerTest(unittest.TestCase):
+    """Unit Test of the module async_checker."""
+
+    def test_run(self):
+        """Test for the method run."""
+        checker = AsyncChecker('http://localhost/', delay=0, concurrency=4)
+
+        def check(url):
+            # Each webpage links to the next one
+            checker.urls[url]['result'] = True, 200, 'OK'
+            if len(checker.urls) < 20:
+                checker.add_url(
+                    f'http://localhost/{len(checker.urls)}', url, None)
+
+        checker.check = check
+        checker.run()
+
+        self.assertEqual(len(checker.urls), 20)
+        self.assertTrue(all(i['result'] for i in checker.urls.values()))
+        self.assertEqual(checker.frontier.stats(), {
+            'queued': 0, 'in_flight': 0, 'done': 20})
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module budget."""
+
+import unittest
+from unittest import mock
+from blc.budget import CrawlBudget
+from blc.checker import Checker
+
+
+class BudgetTest(unittest.TestCase):
+    """Unit Test of the module budget."""
+
+    def test_admit(self):
+        """Test for the limits verified before the addition of an URL."""
+        budget = CrawlBudget(max_depth=1, max_pages=2)
+        checker = Checker('http://localhost/', crawl_budget=budget)
+
+        self.assertTrue(checker.add_url(
+            'http://localhost/a', 'http://localhost/', '/a'))
+        # The URL is too deep
+        self.assertFalse(checker.add_url(
+            'http://localhost/b', 'http://localhost/a', '/b'))
+        # The URL found again is counted once
+        self.assertFalse(checker.add_url(
+            'http://localhost/b', 'http://localhost/a', 'b'))
+        # The URL refused doesn't count in the traps
+        self.assertFalse(checker.add_url(
+            'http://localhost/b?q=1', 'http://localhost/a', '/b?q=1'))
+        self.assertFalse(checker.traps.queries)
+        # The host has already his pages
+        self.assertFalse(checker.add_url(
+            'http://localhost/c', 'http://localhost/', '/c'))
+        self.assertTrue(checker.add_url(
+            'http://example.com/', 'http://localhost/', '/'))
+
+        # The URL found at a smaller depth is no more refused
+        self.assertEqual(budget.refuse('http://example.com/d', 2), 'depth')
+        self.assertIsNone(budget.refuse('http://example.com/d', 1))
+
+        self.assertEqual(budget.skipped, {'depth': 2, 'pages': 1})
+        self.assertTrue(budget.partial)
+        self.assertEqual(
+            budget.report(),
+            'Partial report: 2 URLs ignored beyond the maximum depth;'
+            ' 1 URLs ignored beyond the maximum number of pages by host.')
+
+    def test_spent(self):
+        """Test for the limits who stop the crawling."""
+        budget = CrawlBudget(max_bytes=100, max_time=10)
+        with mock.patch('time.monotonic', return_value=0):
+            self.assertIsNone(budget.spent())
+        budget.add_bytes(50)
+        with mock.patch('time.monotonic', return_value=5):
+            self.assertIsNone(budget.spent())
+        with mock.patch('time.monotonic', return_value=10):
+            self.assertEqual(budget.spent(), 'time')
+
+        budget = CrawlBudget(max_bytes=100)
+        budget.add_bytes(100)
+        self.assertEqual(budget.spent(), 'bytes')
+        self.assertEqual(
+            budget.report(3),
+            'Partial report: crawling stopped at the maximum number of bytes'
+            ' downloaded, 3 URLs found not checked.')
+
+    def test_run(self):
+        """Test for the end of the crawling once the budget is spent."""
+        checker = Checker('http://localhost/', delay=0,
+                          crawl_budget=CrawlBudget(max_time=0))
+        checker.run()
+
+        # No URL is checked
+        self.assertEqual(checker.unchecked(), 1)
+        self.assertEqual(checker.crawl_budget.stopped, 'time')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module cache."""
+
+import io
+import tempfile
+import unittest
+from blc.cache import CrawlCache, ResultCache
+from blc.checker import Checker
+
+
+class CacheTest(unittest.TestCase):
+    """Unit Test of the module cache."""
+
+    def test_reuse(self):
+        """Test for the reuse of the URLs of a webpage not modified."""
+        data = b'<a href="/a">a</a><a href="https://example.com/">b</a>'
+        requests = []
+
+        class Response:
+            headers = {'Content-Type': 'text/html', 'ETag': '"v1"'}
+            url = 'http://localhost/'
+            status_code = 200
+            reason = 'OK'
+            ok = True
+            raw = io.BytesIO(data)
+
+            def close():
+                pass
+
+        class NotModified(Response):
+            status_code = 304
+            reason = 'Not Modified'
+
+        class Conn:
+            def get(url, headers, **kwargs):
+                requests.append(headers)
+                if headers.get('If-None-Match') == '"v1"':
+                    return NotModified
+                return Response
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = CrawlCache(directory)
+
+            # The first run downloads the webpage
+            checker = Checker('http://localhost/', cache=cache)
+            checker.conn = Conn
+            checker.visit('http://localhost/')
+            self.assertEqual(len(checker.urls), 2)
+
+            # The second run reuses the URLs found
+            checker = Checker('http://localhost/', cache=cache,
+                              deep_scan=True)
+            checker.conn = Conn
+            Response.raw = None
+            checker.visit('http://localhost/')
+
+            self.assertEqual(requests[-1], {'If-None-Match': '"v1"'})
+            self.assertEqual(len(checker.urls), 3)
+            self.assertEqual(
+                checker.urls['http://localhost/']['result'],
+                (True, 200, 'OK'))
+            cache.close()
+
+    def test_results(self):
+        """Test for the cache of the foreign URLs."""
+        results = ResultCache(ttl=60, max_size=2)
+        results.set('http://a.com/', (True, 200, 'OK'))
+        results.set('http://b.com/', (False, 404, 'Not Found'))
+        self.assertEqual(results.get('http://a.com/'), (True, 200, 'OK'))
+
+        # The least recently used result is removed
+        results.set('http://c.com/', (True, 200, 'OK'))
+        self.assertIsNone(results.get('http://b.com/'))
+        self.assertIsNotNone(results.get('http://a.com/'))
+
+        # The expired results are ignored
+        results.ttl = 0
+        self.assertIsNone(results.get('http://a.com/'))
+
+    def test_results_shared(self):
+        """Test for the sharing of the results between the runs."""
+        with tempfile.TemporaryDirectory() as directory:
+            results = ResultCache(directory=directory)
+            checker = Checker('http://localhost/', results=results)
+            checker.add_url('http://a.com/', 'http://localhost/', None)
+
+            class Response:
+                ok = False
+                status_code = 404
+                reason = 'Not Found'
+                headers = {}
+
+                def close():
+                    pass
+
+            class Conn:
+                def head(url, **kwargs):
+                    return Response
+
+            checker.conn = Conn
+            checker.visit('http://a.com/')
+            results.close()
+
+            # Another checker of another run reuses the result
+            results = ResultCache(directory=directory)
+            checker = Checker('http://localhost/', results=results)
+            checker.add_url('http://a.com/', 'http://localhost/', None)
+            self.assertTrue(checker.from_cache('http://a.com/'))
+            self.assertEqual(
+                checker.urls['http://a.com/']['result'],
+                (False, 404, 'Not Found'))
+            self.assertFalse(checker.from_cache('http://localhost/'))
+            results.close()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module canonical."""
+
+import io
+import threading
+import unittest
+from blc.canonical import Canonicalizer
+from blc.checker import Checker
+from blc.extractor import EXTRACTORS
+from tests.server import MyServer, ThreadingSimpleServer
+
+
+class CanonicalTest(unittest.TestCase):
+    """Unit Test of the module canonical."""
+
+    def test_canonicalize(self):
+        """Test for the canonical form by default."""
+        canonical = Canonicalizer().canonicalize
+
+        for url in ('HTTP://LocalHost:80/page#frag', 'http://localhost/page',
+                    'http://localhost:/page#'):
+            self.assertEqual(canonical(url), 'http://localhost/page')
+        self.assertEqual(canonical('https://localhost:443'),
+                         'https://localhost/')
+        self.assertEqual(canonical('https://User@[::1]:8443/Page/?b&a'),
+                         'https://User@[::1]:8443/Page/?b&a')
+
+        # The other URLs are unchanged
+        for url in ('/page#frag', 'mailto:a@localhost', 'http://[::1'):
+            self.assertEqual(canonical(url), url)
+
+    def test_options(self):
+        """Test for the optional changes of the canonical form."""
+        canonical = Canonicalizer(
+            deny_params=['utm_*', 'fbclid'], sort_params=True,
+            ignore_case=True, ignore_slash=True).canonicalize
+        self.assertEqual(
+            canonical('http://localhost/Page/?utm_source=x&b=2&a=%20&b=1'),
+            'http://localhost/page?a=%20&b=2&b=1')
+        self.assertEqual(canonical('http://localhost/?fbclid=1'),
+                         'http://localhost/')
+
+        canonical = Canonicalizer(allow_params=['id']).canonicalize
+        self.assertEqual(canonical('http://localhost/a?page=2&id=3&ID=4'),
+                         'http://localhost/a?id=3')
+
+    def test_checker(self):
+        """Test for the deduplication of the URLs by the checker."""
+        checker = Checker('http://localhost/', canonicalizer=Canonicalizer(
+            deny_params=['utm_*'], ignore_slash=True))
+        for url in ('/page', '/page/', '/page?utm_source=x', '/page#frag',
+                    'HTTP://LOCALHOST:80/page'):
+            checker.add_links([url], 'http://localhost/', 'http://localhost/')
+
+        self.assertEqual(list(checker.urls), [
+            'http://localhost/', 'http://localhost/page'])
+        self.assertEqual(checker.urls['http://localhost/page']['aliases'], [
+            '/page#frag', '/page/', '/page?utm_source=x',
+            'HTTP://LOCALHOST:80/page'])
+
+        # A webpage whose the canonical URL is already found is skipped
+        closed = []
+        for extractor in EXTRACTORS:
+            class Response:
+                headers = {'Content-Type': 'text/html'}
+                url = 'http://localhost/page?session=1'
+                raw = io.BytesIO(
+                    b'<link rel="canonical" href="/page">'
+                    b'<a href="/other">')
+
+                def close():
+                    closed.append(extractor)
+
+            checker = Checker('http://localhost/', extractor=extractor)
+            checker.add_url('http://localhost/page', 'http://localhost/',
+                            '/page')
+            checker.update_list(Response)
+            self.assertNotIn('http://localhost/other', checker.urls)
+
+        # The connection of a webpage skipped is released
+        self.assertEqual(closed, list(EXTRACTORS))
+
+    def test_target(self):
+        """Test for the URLs requested as found, not as canonical form."""
+        server = ThreadingSimpleServer(('localhost', 0), MyServer)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host = 'http://localhost:%i' % server.server_address[1]
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        checker = Checker(host, delay=0, timeout=0.5,
+                          canonicalizer=Canonicalizer(
+                              ignore_case=True, ignore_slash=True))
+        checker.add_links(['/Docs/API.html', '/docs/api.html',
+                           '/abc/', '/abc'], host + '/', host + '/')
+        self.assertEqual(list(checker.urls), [
+            host + '/', host + '/docs/api.html', host + '/abc'])
+
+        # The first spelling found is requested: /docs/api.html
+        # and /abc are not found on the server
+        for url in list(checker.urls)[1:]:
+            checker.visit(url)
+        info = checker.urls[host + '/docs/api.html']
+        self.assertEqual(info['result'], (True, 200, 'OK'))
+        self.assertEqual(info['aliases'], ['/docs/api.html'])
+        info = checker.urls[host + '/abc']
+        self.assertEqual(info['result'], (True, 200, 'OK'))
+        self.assertEqual(info['aliases'], ['/abc'])
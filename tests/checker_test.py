@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 """Unit Test of the module checker."""
 
+import io
+import threading
 import unittest
 from blc.checker import Checker
 
@@ -57,10 +59,7 @@ class CheckerTest(unittest.TestCase):
         class Response:
             headers = {'Content-Type': 'text/html'}
             url = 'http://localhost/'
-
-            class raw:
-                def read(x):
-                    return data
+            raw = io.BytesIO(data)
 
             def close():
                 pass
@@ -73,5 +72,138 @@ class CheckerTest(unittest.TestCase):
 
         # with deep mode
         checker = Checker('localhost', deep_scan=True)
+        checker.chunk_size = 100
+        Response.raw = io.BytesIO(data)
+        checker.update_list(Response)
+        # NB: Two pairs are the same URL, without the empty path:
+        # https://abc.example.com and https://abc.example.com/,
+        # https://www.w3schools.com and https://www.w3schools.com/
+        self.assertEqual(len(checker.urls), 34)
+        self.assertEqual(
+            checker.urls['https://abc.example.com/']['aliases'],
+            ['https://abc.example.com'])
+        self.assertEqual(
+            checker.urls['https://www.w3schools.com/']['aliases'],
+            ['https://www.w3schools.com'])
+
+    def test_budget(self):
+        """Test for the budget of requests shared between the checkers."""
+        budget = threading.BoundedSemaphore(1)
+        checker = Checker('http://localhost/', budget=budget)
+        acquired = []
+
+        def check(url):
+            # The budget is taken during the request
+            acquired.append(budget.acquire(blocking=False))
+            checker.urls[url]['result'] = True, 200, 'OK'
+
+        checker.check = check
+        checker.run()
+
+        self.assertEqual(acquired, [False])
+        self.assertTrue(budget.acquire(blocking=False))
+
+    def test_render(self):
+        """Test for the choice of the webpages to render."""
+        class Renderer:
+            rendered = []
+
+            def render(url):
+                Renderer.rendered.append(url)
+                return '<a href="/js">js</a>'
+
+        def response(url, data):
+            class Response:
+                headers = {'Content-Type': 'text/html'}
+                raw = io.BytesIO(data)
+
+                def close():
+                    pass
+            Response.url = url
+            return Response
+
+        checker = Checker('http://localhost/', renderer=Renderer,
+                          render_pattern='/app/', render_empty=True,
+                          similarity=1)
+
+        # A static webpage with URLs is not rendered
+        checker.update_list(response(
+            'http://localhost/static', b'<a href="/a">a</a>'))
+        # A webpage without URL or matching the pattern is rendered
+        checker.update_list(response('http://localhost/empty', b'<p>'))
+        checker.update_list(response(
+            'http://localhost/app/', b'<a href="/b">b</a>'))
+
+        self.assertEqual(Renderer.rendered, [
+            'http://localhost/empty', 'http://localhost/app/'])
+        self.assertIn('http://localhost/js', checker.urls)
+        self.assertNotIn('http://localhost/b', checker.urls)
+
+    def test_charset(self):
+        """Test for the decoding of the webpages."""
+        checker = Checker('http://localhost/', extractor='html')
+        data = '<meta charset="latin-1"><a href="/é">é</a>'.encode('latin-1')
+
+        class Response:
+            headers = {'Content-Type': 'text/html'}
+            url = 'http://localhost/'
+            raw = io.BytesIO(data)
+
+            def close():
+                pass
+
+        self.assertEqual(checker.get_charset('text/html', data), 'iso8859-1')
+        self.assertEqual(
+            checker.get_charset('text/html; charset=UTF-8', data), 'utf-8')
+        self.assertEqual(checker.get_charset('text/html', b''), 'utf-8')
+
+        # The size read is limited
+        checker.max_download_size = len(data) - 5
         checker.update_list(Response)
-        self.assertEqual(len(checker.urls), 36)
+        self.assertIn('http://localhost/é', checker.urls)
+
+    def test_probe(self):
+        """Test for the choice of the method used to check an URL."""
+        requests = []
+
+        def response(status_code, content_type='text/html'):
+            class Response:
+                ok = status_code < 400
+                headers = {'Content-Type': content_type}
+
+                def close():
+                    pass
+            Response.status_code = status_code
+            Response.reason = str(status_code)
+            return Response
+
+        class Conn:
+            def head(url, **kwargs):
+                requests.append(('HEAD', url))
+                return response(405 if 'a.com' in url else 200)
+
+            def get(url, headers={}, **kwargs):
+                requests.append(('GET', url, headers.get('Range')))
+                return response(206 if headers.get('Range') else 200,
+                                'application/pdf')
+
+        checker = Checker('http://localhost/', deep_scan=True)
+        checker.conn = Conn
+        for url in ['http://a.com/1', 'http://a.com/2',
+                    'http://localhost/a.png', 'http://localhost/b']:
+            checker.add_url(url, 'http://localhost/', None)
+            self.assertIsNone(checker.check(url))
+
+        self.assertEqual(requests, [
+            # The host who refuses HEAD is asked by range once known
+            ('HEAD', 'http://a.com/1'),
+            ('GET', 'http://a.com/1', 'bytes=0-0'),
+            ('GET', 'http://a.com/2', 'bytes=0-0'),
+            # The content of the same host without URL isn't downloaded
+            ('HEAD', 'http://localhost/a.png'),
+            ('GET', 'http://localhost/b', None),
+        ])
+        self.assertEqual(checker.methods, {'a.com': 'GET',
+                                           'localhost': 'HEAD'})
+        self.assertEqual(checker.urls['http://a.com/2']['result'],
+                         (True, 206, '206'))
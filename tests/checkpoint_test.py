@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module checkpoint."""
+
+import os
+import tempfile
+import unittest
+from blc.budget import CrawlBudget
+from blc.canonical import Canonicalizer
+from blc.checker import Checker
+from blc.checkpoint import Checkpoint
+from blc.trap import TrapDetector
+
+
+class CheckpointTest(unittest.TestCase):
+    """Unit Test of the module checkpoint."""
+
+    def test_resume(self):
+        """Test for the resumption of an interrupted checking."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'checkpoint.jsonl')
+
+            checker = Checker('http://localhost/',
+                              checkpoint=Checkpoint(path),
+                              canonicalizer=Canonicalizer(ignore_case=True))
+            url = checker.frontier.pop()
+            checker.add_url('http://localhost/a', url, '/a')
+            checker.add_url('http://localhost/B', url, '/B')
+            checker.urls[url]['result'] = True, 200, 'OK'
+            checker.urls[url]['check_time'] = 0.5
+            checker.task_done(url)
+            checker.checkpoint.close()
+
+            # We simulate an interruption during a writing
+            with open(path, 'a') as f:
+                f.write('["d", "http://localhost/a", fal')
+
+            checker = Checker('http://localhost/',
+                              checkpoint=Checkpoint(path, resume=True),
+                              canonicalizer=Canonicalizer(ignore_case=True))
+            checker.resume()
+
+            self.assertEqual(list(checker.urls), [
+                'http://localhost/', 'http://localhost/a',
+                'http://localhost/b'])
+            self.assertEqual(checker.urls['http://localhost/']['result'],
+                             (True, 200, 'OK'))
+            self.assertEqual(checker.urls['http://localhost/b']['parent'],
+                             ['http://localhost/'])
+            # The URL is requested as found
+            self.assertEqual(checker.urls.target('http://localhost/b'),
+                             'http://localhost/B')
+
+            # Only the URLs without result are checked again
+            self.assertEqual(checker.frontier.pop(), 'http://localhost/a')
+            self.assertEqual(checker.frontier.pop(), 'http://localhost/b')
+            self.assertIsNone(checker.frontier.pop())
+
+            # The incomplete line is removed before the new changes
+            checker.checkpoint.add('http://localhost/c',
+                                   'http://localhost/a', '/c')
+            checker.checkpoint.close()
+            self.assertEqual(len(list(checker.checkpoint.events())), 4)
+
+    def test_resume_budget(self):
+        """Test for the budget and the traps of a checking resumed."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'checkpoint.jsonl')
+
+            checker = Checker('http://localhost/',
+                              checkpoint=Checkpoint(path),
+                              crawl_budget=CrawlBudget(max_pages=3),
+                              trap_detector=TrapDetector(max_queries=1))
+            url = checker.frontier.pop()
+            checker.add_url('http://localhost/a', url, '/a')
+            checker.add_url('http://localhost/s?q=1', url, '/s?q=1')
+            fingerprint = checker.fingerprints.fingerprint('a b c d e f')
+            self.assertFalse(checker.seen_content(url, fingerprint))
+            checker.checkpoint.close()
+
+            checker = Checker('http://localhost/',
+                              checkpoint=Checkpoint(path, resume=True),
+                              crawl_budget=CrawlBudget(max_pages=3),
+                              trap_detector=TrapDetector(max_queries=1))
+            checker.resume()
+
+            # The pages of the previous run are counted
+            self.assertEqual(checker.crawl_budget.pages['localhost'], 3)
+            self.assertFalse(checker.add_url(
+                'http://localhost/b', url, '/b'))
+            self.assertEqual(checker.crawl_budget.skipped, {'pages': 1})
+
+            # Like the queries and the contents already seen
+            self.assertEqual(checker.traps.queries['localhost/s'], 1)
+            self.assertTrue(checker.seen_content(
+                'http://localhost/c', fingerprint))
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module extractor."""
+
+import unittest
+from blc.extractor import HTMLExtractor, LxmlExtractor, RegexExtractor
+
+
+class ExtractorTest(unittest.TestCase):
+    """Unit Test of the module extractor."""
+
+    def extract(self, extractor, *chunks):
+        """Extract the URLs of a source given by part."""
+        extractor = extractor()
+        for chunk in chunks:
+            extractor.feed(chunk)
+        extractor.close()
+        return extractor
+
+    def test_same_urls(self):
+        """Test that both extractors find the same URLs."""
+        for path in ['tests/data.html', 'tests/data2.html', 'tests/data.rss']:
+            with open(path, 'r') as f:
+                data = f.read()
+
+            urls = set(self.extract(RegexExtractor, data).urls)
+            self.assertEqual(set(self.extract(HTMLExtractor, data).urls), urls)
+            self.assertEqual(set(self.extract(LxmlExtractor, data).urls), urls)
+
+    def test_html_extractor(self):
+        """Test for the HTML extractors."""
+        for extractor in [HTMLExtractor, LxmlExtractor]:
+            self.check_html(extractor)
+
+    def test_base(self):
+        """Test for the tag <base> with each extractor."""
+        for extractor in [RegexExtractor, HTMLExtractor, LxmlExtractor]:
+            result = self.extract(
+                extractor,
+                '<html><head><base href="/sub/"></head>'
+                '<body><a href="x.html">X</a></body></html>')
+            self.assertEqual(result.base, '/sub/', extractor)
+            self.assertEqual(result.urls, ['x.html'], extractor)
+
+    def check_html(self, extractor):
+        """Test for a HTML extractor."""
+        extractor = self.extract(
+            extractor,
+            '<html><head><base href="/docs/">'
+            '<link rel=icon href=/favicon.ico></head><body>'
+            '<p>Not me: https://example.com/text</p>'
+            '<script>var url = "https://example.com/script";</script>'
+            '<img src="a.png" srcset="a-1x.png 1x, a-2x.png 2x">'
+            '<a href="page?a=1&amp;b=2">',
+            'Page</a></body></html>',
+        )
+
+        self.assertEqual(extractor.base, '/docs/')
+        self.assertEqual(extractor.urls, [
+            '/favicon.ico', 'a.png', 'a-1x.png', 'a-2x.png', 'page?a=1&b=2'])
+
+    def test_xml_extractor(self):
+        """Test for the sitemap and the RSS with the HTML extractors."""
+        for extractor in [HTMLExtractor, LxmlExtractor]:
+            sitemap = self.extract(
+                extractor,
+                '<?xml version="1.0" encoding="UTF-8"?>'
+                '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                '<url><loc>https://example.com/a</loc></url></urlset>',
+            )
+            self.assertEqual(sitemap.urls, ['https://example.com/a'])
+
+            rss = self.extract(
+                extractor,
+                '<rss><channel><link><![CDATA[https://example.com/b]]>'
+                '</link></channel></rss>',
+            )
+            self.assertEqual(rss.urls, ['https://example.com/b'])
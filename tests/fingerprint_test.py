@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module fingerprint."""
+
+import random
+import unittest
+from blc.fingerprint import SimHashIndex
+
+
+def simhash(words: list, shingle_size: int) -> int:
+    """Compute a SimHash with a vote by bit of each hash."""
+    size = min(shingle_size, len(words))
+    votes = [0] * SimHashIndex.BITS
+    hashes = [
+        hash(shingle) & ((1 << SimHashIndex.BITS) - 1)
+        for shingle in zip(*[words[i:] for i in range(size)])
+    ]
+    for value in hashes:
+        for bit in range(SimHashIndex.BITS):
+            if value >> bit & 1:
+                votes[bit] += 1
+    return sum(
+        1 << i for i, vote in enumerate(votes)
+        if vote * 2 > len(hashes))
+
+
+class FingerprintTest(unittest.TestCase):
+    """Unit Test of the module fingerprint."""
+
+    def test_seen(self):
+        """Test for the detection of the near-duplicate webpages."""
+        index = SimHashIndex(threshold=0.9)
+
+        with open('tests/data.html', 'r') as f:
+            data = f.read()
+        with open('tests/data2.html', 'r') as f:
+            data2 = f.read()
+
+        self.assertIsNone(index.seen(data))
+        self.assertIsNone(index.seen(data2))
+
+        # The identical and near-duplicate webpages are detected
+        self.assertEqual(index.seen(data), 1)
+        self.assertGreaterEqual(
+            index.seen(data2.replace('Home', 'Welcome')), 0.9)
+
+        # The webpages without words are never skipped
+        self.assertIsNone(index.seen(''))
+        self.assertIsNone(index.seen(''))
+
+    def test_votes(self):
+        """Test for the votes counted byte by byte in big integers."""
+        index = SimHashIndex()
+        rand = random.Random(0)
+        vocabulary = ['w%i' % i for i in range(50)]
+        for nb_words in (1, 3, 4, 5, 100, 3000):
+            words = [rand.choice(vocabulary) for _ in range(nb_words)]
+            self.assertEqual(index.fingerprint(' '.join(words)),
+                             simhash(words, index.shingle_size))
+
+    def test_threshold(self):
+        """Test for the number of different bits allowed."""
+        index = SimHashIndex(threshold=1)
+        self.assertEqual(index.distance, 0)
+
+        fingerprint = index.fingerprint('a b c d e f')
+        index.add(fingerprint)
+        self.assertEqual(index.find(fingerprint), fingerprint)
+        self.assertIsNone(index.find(fingerprint ^ 1))
+
+        index = SimHashIndex(threshold=0.9)
+        index.add(fingerprint)
+        self.assertEqual(index.find(fingerprint ^ 0b100101), fingerprint)
+        self.assertIsNone(index.find(fingerprint ^ 0b1111111))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module frontier."""
+
+import unittest
+from blc.checker import Checker
+from blc.frontier import Frontier
+
+
+class FrontierTest(unittest.TestCase):
+    """Unit Test of the module frontier."""
+
+    def test_push_pop(self):
+        """Test for the order and the deduplication of the URLs."""
+        frontier = Frontier()
+
+        self.assertTrue(frontier.push('http://localhost/a'))
+        self.assertTrue(frontier.push('http://localhost/b'))
+        self.assertFalse(frontier.push('http://localhost/a'))
+        self.assertEqual(len(frontier), 2)
+
+        self.assertEqual(frontier.pop(), 'http://localhost/a')
+        self.assertEqual(frontier.stats(), {
+            'queued': 1, 'in_flight': 1, 'done': 0})
+
+        frontier.task_done('http://localhost/a')
+        self.assertEqual(frontier.pop(), 'http://localhost/b')
+        self.assertIsNone(frontier.pop())
+
+        # The URLs checked are kept by the store of the checker only
+        self.assertNotIn('http://localhost/a', frontier)
+        self.assertEqual(frontier.waiting, {})
+
+    def test_priority(self):
+        """Test for the order of the URLs by priority."""
+        frontier = Frontier()
+
+        frontier.push('http://localhost/a', 2)
+        frontier.push('http://localhost/b', 1)
+        frontier.push('http://localhost/c', 2)
+        frontier.push('http://localhost/d', 2)
+
+        # The priority of an URL can only be raised
+        self.assertTrue(frontier.prioritize('http://localhost/d', 0))
+        self.assertFalse(frontier.prioritize('http://localhost/c', 3))
+        self.assertEqual(frontier.queued, 4)
+
+        self.assertEqual(
+            [frontier.pop() for _ in range(5)],
+            ['http://localhost/d', 'http://localhost/b', 'http://localhost/a',
+             'http://localhost/c', None])
+
+    def test_defer(self):
+        """Test for the URLs checked again at the end of the queue."""
+        frontier = Frontier()
+
+        frontier.push('http://localhost/a', 0)
+        frontier.push('http://localhost/b', 1)
+        frontier.push('http://localhost/c', 1)
+        self.assertEqual(frontier.pop(), 'http://localhost/a')
+
+        frontier.defer('http://localhost/a', 0)
+        self.assertEqual(len(frontier), 3)
+        self.assertEqual(
+            [frontier.pop() for _ in range(4)],
+            ['http://localhost/b', 'http://localhost/c', 'http://localhost/a',
+             None])
+
+    def test_checker(self):
+        """Test for the URLs already checked, found in the store."""
+        checker = Checker('http://localhost/')
+        url = checker.frontier.pop()
+        self.assertTrue(checker.add_url('http://localhost/a', url, '/a'))
+        checker.frontier.task_done(url)
+        checker.frontier.task_done(checker.frontier.pop())
+
+        # An URL already checked isn't queued again
+        self.assertFalse(checker.add_url('http://localhost/a', url, '/a'))
+        self.assertFalse(checker.add_url(url, url, '/'))
+        self.assertEqual(len(checker.frontier), 0)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module notifier."""
+
+from email import policy
+import email
+import socketserver
+import threading
+import unittest
+from blc.notifier import Notifier
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP server who keeps the messages received."""
+
+    def reply(self, line: str) -> None:
+        """Send a response to the client."""
+        self.wfile.write(line.encode() + b'\r\n')
+
+    def handle(self):
+        """Answer to the commands of a connection."""
+        self.server.connections += 1
+        self.reply('220 localhost ESMTP')
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                break
+            command = line.decode().strip().upper()
+            if command.startswith(('EHLO', 'HELO')):
+                self.reply('250 localhost')
+            elif command == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                data = []
+                for line in self.rfile:
+                    if line == b'.\r\n':
+                        break
+                    data.append(line)
+                self.server.messages.append(b''.join(data))
+                self.reply('250 OK')
+            elif command == 'QUIT':
+                self.reply('221 Bye')
+                break
+            else:
+                self.reply('250 OK')
+
+
+class NotifierTest(unittest.TestCase):
+    """Unit Test of the module notifier."""
+
+    def setUp(self):
+        """Start the test server."""
+        self.server = socketserver.ThreadingTCPServer(
+            ('localhost', 0), SMTPHandler)
+        self.server.daemon_threads = True
+        self.server.connections = 0
+        self.server.messages = []
+        threading.Thread(target=self.server.serve_forever,
+                         daemon=True).start()
+        self.notifier = Notifier(
+            'localhost:%i' % self.server.server_address[1],
+            'blc@localhost', None, pool_size=1, starttls=False)
+
+    def tearDown(self):
+        """Stop the test server."""
+        self.notifier.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_submit(self):
+        """Test for the sending of several messages."""
+        futures = [
+            self.notifier.submit('a@localhost', 'Report %i' % i, 'Hello')
+            for i in range(3)
+        ]
+        for future in futures:
+            future.result()
+
+        # The connection is kept between the messages
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(len(self.server.messages), 3)
+
+    def test_disconnected(self):
+        """Test for the connection closed by the server."""
+        self.notifier.send('a@localhost', 'Report 1', 'Hello')
+        connection = self.notifier.connections[0]
+
+        def send_message(msg):
+            raise ConnectionResetError()
+        connection.send_message = send_message
+
+        # The message is sent by a new connection, the old one is closed
+        self.notifier.send('a@localhost', 'Report 2', 'Hello')
+        self.assertIsNone(connection.sock)
+        self.assertEqual(len(self.notifier.connections), 1)
+        self.assertIsNot(self.notifier.connections[0], connection)
+        self.assertEqual(self.server.connections, 2)
+        self.assertEqual(len(self.server.messages), 2)
+
+    def test_attachments(self):
+        """Test for the files attached to a message."""
+        self.notifier.send(
+            'a@localhost', 'Report', 'Hello',
+            [('report.csv', 'url,status\r\nhttp://a/,404\r\n', 'text/csv'),
+             ('report.jsonl', '{"url": "http://a/"}\n',
+              'application/x-ndjson')])
+
+        msg = email.message_from_bytes(
+            self.server.messages[0], policy=policy.default)
+        files = {
+            part.get_filename(): part.get_payload(decode=True)
+            for part in msg.iter_attachments()
+        }
+        self.assertEqual(msg['Subject'], 'Report')
+        self.assertEqual(files, {
+            'report.csv': b'url,status\r\nhttp://a/,404\r\n',
+            'report.jsonl': b'{"url": "http://a/"}\n',
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module origin."""
+
+import unittest
+from blc.checker import Checker
+from blc.origin import OriginMatcher
+
+
+class OriginTest(unittest.TestCase):
+    """Unit Test of the module origin."""
+
+    def test_match(self):
+        """Test for the URLs of the website."""
+        origins = OriginMatcher('http://example.com:80/blog')
+
+        for url in ('/a', 'a?b', '#c', 'HTTP://EXAMPLE.COM/a',
+                    'https://example.com/a', 'http://www.example.com:80/',
+                    '//example.com/a'):
+            self.assertTrue(origins.match(url), url)
+        for url in ('http://example.com:8080/', 'http://cdn.example.com/',
+                    'ftp://example.com/', 'mailto:a@example.com',
+                    '//example.org/', 'http://[::1/'):
+            self.assertFalse(origins.match(url), url)
+
+        # The port is kept if it is not the default port
+        origins = OriginMatcher('localhost:8080')
+        self.assertTrue(origins.match('http://localhost:8080/a'))
+        self.assertFalse(origins.match('http://localhost/a'))
+
+    def test_internal(self):
+        """Test for the internal origins."""
+        origins = OriginMatcher('https://example.com', [
+            'cdn.example.org', 'http://[::1]:8080', '*.example.net'])
+
+        for url in ('https://cdn.example.org/a', 'http://[::1]:8080/',
+                    'https://a.b.example.net:8443/'):
+            self.assertTrue(origins.match(url), url)
+        for url in ('https://example.org/', 'https://example.net/',
+                    'http://[::1]/', 'https://badexample.net/'):
+            self.assertFalse(origins.match(url), url)
+
+    def test_checker(self):
+        """Test for the URLs of the internal origins checked as webpages."""
+        checker = Checker('http://localhost/',
+                          internal_origins=['docs.localhost'])
+        checker.add_links([
+            'https://www.localhost/a', 'http://docs.localhost/b',
+            '//docs.localhost/c', 'http://example.com/d',
+        ], 'http://localhost/', 'http://localhost/')
+
+        self.assertEqual(list(checker.urls), [
+            'http://localhost/', 'https://www.localhost/a',
+            'http://docs.localhost/b', 'http://docs.localhost/c'])
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module retry."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
+import unittest
+import requests
+from blc.checker import Checker
+from blc.retry import RetryPolicy
+
+
+class RetryTest(unittest.TestCase):
+    """Unit Test of the module retry."""
+
+    def test_policy(self):
+        """Test for the choice of the errors to retry."""
+        retry = RetryPolicy(max_retries=2, backoff=1, budget=3)
+
+        self.assertIsNone(retry.retry((True, 200, 'OK'), 0))
+        self.assertIsNone(retry.retry((False, 404, 'Not Found'), 0))
+        self.assertIsNone(
+            retry.retry((False, None, 'Too many redirection!'), 0))
+
+        # The delay is random but bounded by the backoff
+        self.assertLessEqual(retry.retry((False, 503, 'Busy'), 0), 1)
+        self.assertLessEqual(retry.retry((False, None, 'Timeout!'), 1), 2)
+        self.assertIsNone(retry.retry((False, None, 'Timeout!'), 2))
+
+        # The budget is shared by all the URLs
+        self.assertIsNotNone(retry.retry((False, 503, 'Busy'), 0))
+        self.assertIsNone(retry.retry((False, 503, 'Busy'), 0))
+
+    def test_requeue(self):
+        """Test for the retry of an URL after the others."""
+        requests_done = []
+
+        class Response:
+            ok = True
+            status_code = 200
+            reason = 'OK'
+            headers = {'Content-Type': 'image/png'}
+
+            def close():
+                pass
+
+        class Conn:
+            def get(url, **kwargs):
+                requests_done.append(url)
+                if requests_done.count(url) == 1 and url.endswith('/a'):
+                    raise requests.exceptions.ReadTimeout()
+                return Response
+
+        checker = Checker('http://localhost/', delay=0,
+                          retry=RetryPolicy(backoff=0))
+        checker.conn = Conn
+        checker.add_url('http://localhost/a', 'http://localhost/', '/a')
+        checker.add_url('http://localhost/b', 'http://localhost/', '/b')
+        checker.run()
+
+        self.assertEqual(requests_done, [
+            'http://localhost/', 'http://localhost/a',
+            'http://localhost/b', 'http://localhost/a'])
+        self.assertEqual(checker.urls['http://localhost/a']['result'],
+                         (True, 200, 'OK'))
+        self.assertEqual(checker.urls['http://localhost/a']['attempts'], 1)
+        self.assertEqual(checker.frontier.stats(), {
+            'queued': 0, 'in_flight': 0, 'done': 3})
+
+    def test_stalled_download(self):
+        """Test for the retry of a webpage whose the download stalls."""
+        requests_done = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requests_done.append(self.path)
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html')
+                self.send_header('Content-Length', '100000')
+                self.end_headers()
+                # The server stops to send in the middle of the content
+                self.wfile.write(b'<html><body><a href="/a">')
+                self.wfile.flush()
+                time.sleep(1)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('localhost', 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host = 'http://localhost:%i/' % server.server_address[1]
+        try:
+            checker = Checker(host, delay=0, timeout=0.2,
+                              retry=RetryPolicy(max_retries=1, backoff=0))
+            checker.run()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # The timeout is retried, then reported
+        self.assertEqual(requests_done, ['/', '/'])
+        self.assertEqual(checker.urls[host]['result'],
+                         (False, None, 'Timeout!'))
+        self.assertEqual(checker.urls[host]['attempts'], 1)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module scheduler."""
+
+import unittest
+from blc.scheduler import Scheduler
+
+
+class SchedulerTest(unittest.TestCase):
+    """Unit Test of the module scheduler."""
+
+    def test_delay_per_host(self):
+        """Test for the delay between the requests of a same host."""
+        scheduler = Scheduler(delay=10, max_per_host=2)
+
+        self.assertEqual(scheduler.wait_time('http://a.com/1'), 0)
+        scheduler.acquire('http://a.com/1')
+        scheduler.release('http://a.com/1')
+
+        # The same host must wait, but not the others
+        self.assertGreater(scheduler.wait_time('http://a.com/2'), 9)
+        self.assertEqual(scheduler.wait_time('http://b.com/1'), 0)
+
+    def test_max_per_host(self):
+        """Test for the limit of requests in flight of a same host."""
+        scheduler = Scheduler(delay=0, max_per_host=2)
+
+        scheduler.acquire('http://a.com/1')
+        scheduler.acquire('http://a.com/2')
+        self.assertIsNone(scheduler.wait_time('http://a.com/3'))
+
+        scheduler.park('http://a.com/3')
+        self.assertIsNone(scheduler.unpark())
+
+        scheduler.release('http://a.com/1')
+        self.assertEqual(scheduler.unpark(), 'http://a.com/3')
+        self.assertFalse(scheduler.has_waiting())
+
+    def test_backoff(self):
+        """Test for the backoff asked by the host."""
+        scheduler = Scheduler(delay=0, max_backoff=60)
+
+        class Response:
+            status_code = 429
+            headers = {'Retry-After': '30'}
+
+        scheduler.observe('http://a.com/1', Response)
+        self.assertGreater(scheduler.wait_time('http://a.com/2'), 29)
+
+        # Without the header, the backoff grows on each failure
+        Response.status_code = 503
+        Response.headers = {}
+        scheduler.observe('http://b.com/1', Response)
+        scheduler.observe('http://b.com/1', Response)
+        self.assertGreater(scheduler.wait_time('http://b.com/2'), 1)
+
+        self.assertEqual(
+            Scheduler.parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0)
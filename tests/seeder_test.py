@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module seeder."""
+
+import threading
+import unittest
+from blc.checker import Checker
+from blc.seeder import Robots
+from tests.server import MyServer, ThreadingSimpleServer
+
+
+class SeederTest(unittest.TestCase):
+    """Unit Test of the module seeder."""
+
+    def setUp(self):
+        """Start the test server."""
+        self.server = ThreadingSimpleServer(('localhost', 0), MyServer)
+        self.server.daemon_threads = True
+        self.server.block_on_close = False
+        threading.Thread(target=self.server.serve_forever,
+                         daemon=True).start()
+        self.host = 'http://localhost:%i' % self.server.server_address[1]
+
+    def tearDown(self):
+        """Stop the test server."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_robots(self):
+        """Test for the rules of a robots.txt."""
+        robots = Robots(
+            'User-agent: BrokenLinkChecker\n'
+            'Disallow: /private\n'
+            'Crawl-delay: 3\n'
+            '\n'
+            'User-agent: *\n'
+            'Disallow: /\n'
+            'Sitemap: http://localhost/sitemap.xml\n',
+            'BrokenLinkChecker/1.0')
+
+        self.assertTrue(robots.allowed('http://localhost/public'))
+        self.assertFalse(robots.allowed('http://localhost/private/a'))
+        self.assertEqual(robots.crawl_delay, 3)
+        self.assertEqual(robots.sitemaps, ['http://localhost/sitemap.xml'])
+
+        robots = Robots('', 'BrokenLinkChecker/1.0')
+        self.assertTrue(robots.allowed('http://localhost/private'))
+        self.assertIsNone(robots.crawl_delay)
+
+    def test_seed(self):
+        """Test for the URLs of the robots.txt and of the sitemaps."""
+        checker = Checker(self.host, delay=0, timeout=0.5)
+        checker.seed()
+
+        # The sitemap index file and the gzip sitemap are read,
+        # the URL disallowed is ignored
+        self.assertEqual([checker.frontier.pop() for _ in checker.urls], [
+            self.host + '/', self.host + '/html', self.host + '/rss',
+            self.host + '/unlisted',
+        ])
+        self.assertEqual(checker.urls[self.host + '/rss']['parent'],
+                         [self.host + '/sitemap.xml.gz'])
+
+        # The URLs disallowed and found by crawling are ignored too
+        self.assertFalse(checker.add_url(self.host + '/wait', self.host,
+                                         '/wait'))
+        self.assertTrue(checker.add_url(self.host + '/abc', self.host,
+                                        '/abc'))
+
+        # Without the rules of the robots.txt, all the URLs are checked
+        checker = Checker(self.host + '/html', delay=0, timeout=0.5)
+        checker.seed(robots=False)
+        self.assertTrue(checker.scheduler.allowed(self.host + '/wait'))
+        self.assertEqual(len(checker.frontier), 4)
@@ -2,19 +2,14 @@
 
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from socketserver import ThreadingMixIn
+import gzip
+import io
 import time
 import os
 import sys
 
 path = os.path.dirname(os.path.realpath(__file__))
 
-if len(sys.argv) < 2:
-    print("Host and Port required")
-else:
-    hostName = sys.argv[1]
-    serverPort = int(sys.argv[2])
-    print(sys.argv)
-
 
 class ThreadingSimpleServer(ThreadingMixIn, HTTPServer):
     """Threading server."""
@@ -31,8 +26,15 @@ class MyServer(BaseHTTPRequestHandler):
             self.path = self.path.split('?')[0]
 
         if self.path in ['/', '/home', '/abc/']:
+            # The home page supports the conditional requests
+            if self.headers.get('If-None-Match') == '"index"':
+                self.send_response(304)
+                self.end_headers()
+                return
+
             self.send_response(200)
             self.send_header("Content-type", "text/html")
+            self.send_header("ETag", '"index"')
             self.end_headers()
 
             with open(path+'/index.html', 'rb') as f:
@@ -40,6 +42,11 @@ class MyServer(BaseHTTPRequestHandler):
         elif self.path in ['/abc']:
             self.send_response(404)
             self.end_headers()
+        elif self.path == '/Docs/API.html':
+            # The path is case-sensitive
+            self.send_response(200)
+            self.send_header("Content-type", "text/plain")
+            self.end_headers()
         elif self.path == '/error':
             self.send_response(500)
             self.end_headers()
@@ -58,6 +65,38 @@ class MyServer(BaseHTTPRequestHandler):
 
             with open(path+'/data.rss', 'rb') as f:
                 self.wfile.write(f.read())
+        elif self.path == '/robots.txt':
+            self.send_response(200)
+            self.send_header("Content-type", "text/plain")
+            self.end_headers()
+            self.wfile.write(
+                b"User-agent: *\n"
+                b"Disallow: /wait\n"
+                b"Crawl-delay: 0\n"
+                b"Sitemap: http://%s/sitemap_index.xml\n"
+                % self.headers['Host'].encode())
+        elif self.path == '/sitemap_index.xml':
+            self.send_response(200)
+            self.send_header("Content-type", "application/xml")
+            self.end_headers()
+            self.wfile.write(
+                b'<?xml version="1.0" encoding="UTF-8"?>'
+                b'<sitemapindex'
+                b' xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                b'<sitemap><loc>http://%s/sitemap.xml.gz</loc></sitemap>'
+                b'</sitemapindex>' % self.headers['Host'].encode())
+        elif self.path == '/sitemap.xml.gz':
+            self.send_response(200)
+            self.send_header("Content-type", "application/gzip")
+            self.end_headers()
+            self.wfile.write(gzip.compress(
+                b'<?xml version="1.0" encoding="UTF-8"?>'
+                b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                + b''.join(
+                    b'<url><loc>http://%s%s</loc></url>'
+                    % (self.headers['Host'].encode(), i)
+                    for i in (b'/html', b'/rss', b'/wait', b'/unlisted'))
+                + b'</urlset>'))
         elif self.path == '/html':
             self.send_response(200)
             self.send_header("Content-type", "text/html")
@@ -109,12 +148,26 @@ class MyServer(BaseHTTPRequestHandler):
             self.end_headers()
 
     def do_HEAD(self):
-        """Permit to check the availability of the test server."""
-        self.send_response(200)
-        self.end_headers()
+        """Answer like GET, but without the content."""
+        self.head = True
+        self.do_GET()
+
+    def end_headers(self):
+        """Ignore the content of the answer to a HEAD request."""
+        super().end_headers()
+        if getattr(self, 'head', False):
+            self.wfile = io.BytesIO()
 
 
 if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Host and Port required")
+        sys.exit(1)
+
+    hostName = sys.argv[1]
+    serverPort = int(sys.argv[2])
+    print(sys.argv)
+
     server = ThreadingSimpleServer((hostName, serverPort), MyServer)
     print("Server started http://%s:%s" % (hostName, serverPort))
 
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module session."""
+
+import socket
+import unittest
+import urllib3.util.connection
+from blc.session import DNSCache, new_session
+
+
+class SessionTest(unittest.TestCase):
+    """Unit Test of the module session."""
+
+    def test_dns_cache(self):
+        """Test for the cache of the resolutions."""
+        cache = DNSCache(ttl=60, max_size=1)
+        cache.install()
+        try:
+            resolve = urllib3.util.connection.socket.getaddrinfo
+            addresses = resolve('localhost', 80, 0, socket.SOCK_STREAM)
+            self.assertIs(
+                resolve('localhost', 80, 0, socket.SOCK_STREAM), addresses)
+            self.assertEqual(cache.stats(),
+                             {'hosts': 1, 'hits': 1, 'misses': 1})
+
+            # The other attributes are these of the module socket
+            self.assertIs(urllib3.util.connection.socket.socket,
+                          socket.socket)
+
+            # The expired addresses are resolved again
+            cache = DNSCache(ttl=0)
+            cache.getaddrinfo('localhost', 80, 0, socket.SOCK_STREAM)
+            cache.getaddrinfo('localhost', 80, 0, socket.SOCK_STREAM)
+            self.assertEqual(cache.misses, 2)
+        finally:
+            cache.uninstall()
+        self.assertIs(urllib3.util.connection.socket, socket)
+
+    def test_pool(self):
+        """Test for the configuration of the pool of connections."""
+        session = new_session(pool_hosts=3, pool_size=5, pool_block=True)
+        adapter = session.adapters['https://']
+
+        self.assertIs(session.adapters['http://'], adapter)
+        self.assertEqual(adapter.poolmanager.connection_pool_kw['maxsize'], 5)
+        self.assertTrue(adapter.poolmanager.connection_pool_kw['block'])
+        self.assertEqual(adapter.stats(), {
+            'hosts': 0, 'connections': 0, 'requests': 0, 'idle': 0})
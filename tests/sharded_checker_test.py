@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module sharded_checker."""
+
+import pickle
+import threading
+import unittest
+from blc.canonical import Canonicalizer
+from blc.checker import Checker
+from blc.session import new_session
+from blc.sharded_checker import ShardedChecker, Worker
+from tests.server import MyServer, ThreadingSimpleServer
+
+
+class ShardedCheckerTest(unittest.TestCase):
+    """Unit Test of the module sharded_checker."""
+
+    def setUp(self):
+        """Start the test server."""
+        self.server = ThreadingSimpleServer(('localhost', 0), MyServer)
+        # NB: Some requests of the test server never end
+        self.server.daemon_threads = True
+        self.server.block_on_close = False
+        threading.Thread(target=self.server.serve_forever,
+                         daemon=True).start()
+        self.host = 'http://localhost:%i' % self.server.server_address[1]
+
+    def tearDown(self):
+        """Stop the test server."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    @staticmethod
+    def report(checker: Checker) -> dict:
+        """Get the results and the parents of each URL."""
+        return {
+            url: (info['result'], info['url'], set(info['parent']))
+            for url, info in checker.urls.items()
+        }
+
+    def test_same_report(self):
+        """Test for a checking identical to the checking of one process."""
+        checker = Checker(self.host, delay=0, timeout=0.5)
+        checker.run()
+
+        sharded = ShardedChecker(self.host, processes=2, delay=0,
+                                 timeout=0.5)
+        sharded.run()
+
+        # The circular URL /c/i/r/c/u/l/a/r/c/i/r/... is a trap
+        self.assertEqual(len(sharded.urls), 38)
+        self.assertEqual(len(sharded.traps.suspects), 1)
+        self.assertEqual(self.report(sharded), self.report(checker))
+        self.assertEqual(sharded.frontier.done, len(sharded.urls))
+        # The requests are done by the pools of the workers
+        self.assertEqual(sharded.conn.adapters['http://'].stats()['requests'],
+                         0)
+        self.assertGreaterEqual(sharded.pool_stats['requests'],
+                                len(sharded.urls))
+        # The timings measured by the workers are merged
+        self.assertIn('ttfb', sharded.urls[self.host + '/']['timings'])
+
+    def test_worker_session(self):
+        """Test for the session of the workers, like the coordinator."""
+        sharded = ShardedChecker(
+            self.host, processes=1,
+            conn=new_session(pool_size=3, pool_block=True,
+                             headers={'User-Agent': 'Test/1.0'}))
+
+        worker = Worker(self.host, **sharded.options)
+        adapter = worker.conn.adapters['http://']
+        self.assertEqual(adapter.settings, {
+            'pool_hosts': 10, 'pool_size': 3, 'pool_block': True})
+        self.assertEqual(worker.conn.headers['User-Agent'], 'Test/1.0')
+        worker.close()
+
+    def test_worker_canonicalizer(self):
+        """Test for the canonical form of the workers, like the coordinator."""
+        canonicalizer = Canonicalizer(deny_params=['eee'], ignore_case=True,
+                                      ignore_slash=True)
+        checker = Checker(self.host, delay=0, timeout=0.5,
+                          canonicalizer=canonicalizer)
+        checker.run()
+
+        sharded = ShardedChecker(self.host, processes=2, delay=0,
+                                 timeout=0.5, canonicalizer=canonicalizer)
+        # NB: The options are pickled to be given to the workers
+        worker = Worker(self.host, **pickle.loads(pickle.dumps(
+            sharded.options)))
+        self.assertEqual(worker.canonical(self.host + '/Home/?eee'),
+                         self.host + '/home')
+        worker.close()
+
+        sharded.run()
+        self.assertEqual(self.report(sharded), self.report(checker))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module sink."""
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+from blc.checker import Checker
+from blc.sink import CSVSink, JSONLSink, Sink
+
+
+class SinkTest(unittest.TestCase):
+    """Unit Test of the module sink."""
+
+    def test_stream(self):
+        """Test for the writing of the URLs at the end of their checking."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'report.jsonl')
+            sink = JSONLSink(path)
+            checker = Checker('http://localhost/', sink=sink)
+            checker.add_url('http://localhost/a', 'http://localhost/', '/a')
+            checker.urls['http://localhost/a']['result'] = (
+                False, 404, 'Not Found')
+            checker.urls['http://localhost/a']['check_time'] = 0.5
+
+            checker.frontier.pop()
+            checker.task_done('http://localhost/a')
+
+            # The record is readable before the end of the checking
+            with open(path) as f:
+                records = [json.loads(line) for line in f]
+            sink.close()
+
+        self.assertEqual(records, [{
+            'target': 'http://localhost/',
+            'url': 'http://localhost/a',
+            'real_url': '/a',
+            'aliases': [],
+            'parent': ['http://localhost/'],
+            'ok': False,
+            'status': 404,
+            'reason': 'Not Found',
+            'check_time': 0.5,
+            'attempts': 0,
+            'timings': None,
+        }])
+        self.assertEqual(sink.counts['http://localhost/'], 1)
+        self.assertEqual(sink.broken['http://localhost/'], records)
+
+        # The broken links of a website are attached to his report
+        self.assertEqual(
+            [json.loads(line) for line in JSONLSink.dumps(records)
+             .splitlines()], records)
+
+    def test_format(self):
+        """Test for the format required by each sink."""
+        with self.assertRaises(TypeError):
+            Sink()
+
+    def test_csv(self):
+        """Test for the CSV format."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'report.csv')
+            sink = CSVSink(path)
+            sink.write('http://localhost/', 'http://localhost/a', {
+                'parent': ['http://localhost/', 'http://localhost/b'],
+                'url': '/a',
+                'result': (True, 200, 'OK'),
+                'check_time': 0.5,
+            })
+            sink.close()
+
+            with open(path, newline='') as f:
+                rows = list(csv.DictReader(f))
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['parent'],
+                         'http://localhost/ http://localhost/b')
+        self.assertEqual(rows[0]['ok'], 'True')
+        self.assertFalse(sink.broken)
+
+    def test_flaky(self):
+        """Test for the URLs who succeeded after transient errors."""
+        sink = JSONLSink()
+        for url, result in (('/a', (True, 200, 'OK')),
+                            ('/b', (False, 503, 'Service Unavailable'))):
+            sink.write('http://localhost/', 'http://localhost' + url, {
+                'parent': ['http://localhost/'],
+                'url': url,
+                'result': result,
+                'check_time': 0.5,
+                'attempts': 2,
+            })
+
+        # The URL who failed at each attempt is broken, not flaky
+        self.assertEqual(sink.flaky['http://localhost/'], 1)
+        self.assertEqual(len(sink.broken['http://localhost/']), 1)
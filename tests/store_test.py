@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module store."""
+
+import unittest
+from blc.store import URLStore
+
+
+class StoreTest(unittest.TestCase):
+    """Unit Test of the module store."""
+
+    def test_store(self):
+        """Test for the interning of the URLs and their parents."""
+        store = URLStore()
+
+        self.assertTrue(store.add('http://localhost/'))
+        self.assertTrue(store.add('http://localhost/a', '/a',
+                                  'http://localhost/'))
+        self.assertFalse(store.add('http://localhost/a'))
+        store.add_parent('http://localhost/a', 'http://localhost/b')
+        store.add_parent('http://localhost/a', 'http://localhost/')
+
+        # A parent who is not checked is interned but not listed
+        self.assertEqual(list(store), ['http://localhost/',
+                                       'http://localhost/a'])
+        self.assertEqual(len(store), 2)
+        self.assertNotIn('http://localhost/b', store)
+        self.assertEqual(store.parents('http://localhost/a'),
+                         ['http://localhost/', 'http://localhost/b'])
+
+    def test_depth(self):
+        """Test for the depth of the URLs by the shortest way."""
+        store = URLStore()
+        store.add('http://localhost/')
+        store.add('http://localhost/a', '/a', 'http://localhost/')
+        store.add('http://localhost/b', '/b', 'http://localhost/a')
+        self.assertEqual(store.record('http://localhost/b').depth, 2)
+
+        store.add_parent('http://localhost/b', 'http://localhost/')
+        self.assertEqual(store.record('http://localhost/b').depth, 1)
+        self.assertEqual(store.record('http://localhost/b').parent_count(), 2)
+
+        # An URL found outside the website, like in a sitemap
+        store.add('http://localhost/c', '/c', 'http://localhost/sitemap.xml')
+        self.assertEqual(store.record('http://localhost/c').depth, 1)
+
+    def test_view(self):
+        """Test for the view of a record as a dict."""
+        store = URLStore()
+        store.add('http://localhost/a', '/a', 'http://localhost/')
+
+        store['http://localhost/a']['result'] = True, 200, 'OK'
+        self.assertEqual(dict(store['http://localhost/a']), {
+            'parent': ['http://localhost/'],
+            'url': '/a',
+            'aliases': [],
+            'result': (True, 200, 'OK'),
+            'check_time': None,
+            'attempts': 0,
+            'timings': None,
+        })
+        self.assertRaises(KeyError, store.__getitem__, 'http://localhost/')
+
+    def test_max_parents(self):
+        """Test for the limit of parents kept by URL."""
+        store = URLStore(max_parents=2)
+        store.add('http://localhost/a', '/a', 'http://localhost/0')
+        for i in range(1, 5):
+            store.add_parent('http://localhost/a', f'http://localhost/{i}')
+
+        self.assertEqual(store.parents('http://localhost/a'),
+                         ['http://localhost/0', 'http://localhost/1'])
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module timing."""
+
+import os
+import pstats
+import tempfile
+import threading
+import time
+import unittest
+from blc import timing
+from blc.timing import Histogram, Measure, Metrics, Profiler
+
+
+class TimingTest(unittest.TestCase):
+    """Unit Test of the module timing."""
+
+    def test_measure(self):
+        """Test for the time of the phases of an URL."""
+        timings = timing.start()
+        with Measure('ttfb', exclude=timing.CONNECTION_PHASES):
+            with Measure('connect'):
+                time.sleep(0.02)
+            time.sleep(0.01)
+        with Measure('connect'):
+            pass
+
+        self.assertIs(timing.stop(), timings)
+        self.assertEqual(list(timings), ['connect', 'ttfb'])
+        self.assertGreaterEqual(timings['connect'], 0.02)
+        # The opening of the connection is not counted twice
+        self.assertGreaterEqual(timings['ttfb'], 0.01)
+        self.assertLess(timings['ttfb'], 0.02)
+
+        # Nothing is measured outside the checking of an URL
+        with Measure('connect'):
+            pass
+        self.assertIsNone(timing.stop())
+
+    def test_histogram(self):
+        """Test for the distribution of the times."""
+        histogram = Histogram()
+        for i in range(100):
+            histogram.add(0.002 if i < 90 else 3)
+
+        self.assertEqual(histogram.count, 100)
+        self.assertEqual(histogram.max, 3)
+        self.assertTrue(0.001 < histogram.percentile(0.5) <= 0.0025)
+        self.assertTrue(2.5 < histogram.percentile(0.95) <= 3)
+
+    def test_metrics(self):
+        """Test for the aggregation and the hooks of the timings."""
+        calls = []
+        metrics = Metrics()
+        metrics.subscribe(lambda *args: calls.append(args))
+        metrics.subscribe(lambda *args: 1 / 0)
+
+        metrics.add('http://localhost/', 'http://localhost/a',
+                    {'ttfb': 0.01, 'download': 0.02})
+        metrics.add('http://localhost/', 'http://localhost/b', None)
+
+        # A hook who fails doesn't stop the checking
+        self.assertEqual(calls, [(
+            'http://localhost/', 'http://localhost/a',
+            {'ttfb': 0.01, 'download': 0.02})])
+        self.assertEqual(metrics.histograms['ttfb'].count, 1)
+        self.assertEqual(len(metrics.report().splitlines()), 3)
+
+    def test_profiler(self):
+        """Test for the profile of several threads."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'blc.prof')
+            profiler = Profiler(path)
+
+            # A checking profiled while another thread is profiled
+            # is not profiled, without error
+            entered = threading.Event()
+            leave = threading.Event()
+
+            def check():
+                with profiler:
+                    sorted(range(10))
+                    entered.set()
+                    leave.wait(5)
+            thread = threading.Thread(target=check)
+            thread.start()
+            entered.wait(5)
+            with profiler:
+                pass
+            leave.set()
+            thread.join()
+
+            with profiler:
+                pass
+            self.assertEqual((profiler.profiled, profiler.skipped), (2, 1))
+            profiler.dump()
+
+            stats = pstats.Stats(path)
+        self.assertTrue(any(
+            name == '<built-in method builtins.sorted>'
+            for _, _, name in stats.stats))
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit Test of the module trap."""
+
+import unittest
+from blc.checker import Checker
+from blc.trap import TrapDetector
+
+
+class TrapTest(unittest.TestCase):
+    """Unit Test of the module trap."""
+
+    def test_detect(self):
+        """Test for the kinds of trap."""
+        traps = TrapDetector(max_length=100, max_repeats=2, max_queries=2,
+                             max_template=3)
+
+        self.assertIsNone(traps.detect('http://localhost/a/b/a/b'))
+        self.assertEqual(traps.detect('http://localhost/a/b/a/b/a/b'),
+                         'repeat')
+        self.assertEqual(traps.detect('http://localhost/' + 'a' * 100),
+                         'length')
+        self.assertEqual(traps.detect('http://localhost/a?PHPSESSID=1'),
+                         'session')
+        self.assertEqual(traps.detect('http://localhost/a;jsessionid=1'),
+                         'session')
+
+        # The queries of a same path
+        self.assertIsNone(traps.detect('http://localhost/s?q=1'))
+        self.assertIsNone(traps.detect('http://localhost/s?q=1&p=2'))
+        self.assertEqual(traps.detect('http://localhost/s?p=2&q=1'),
+                         'query')
+
+        # The URLs of a same template
+        for day in range(1, 4):
+            self.assertIsNone(traps.detect(
+                'http://localhost/2026/10/%i' % day))
+        self.assertEqual(traps.detect('http://localhost/2026/10/4'),
+                         'template')
+        self.assertEqual(traps.detect('http://localhost/2026/10/5'),
+                         'template')
+
+        self.assertEqual(
+            traps.suspects[('template', 'localhost/{n}/{n}/{n}')],
+            [2, 'http://localhost/2026/10/4', None])
+
+        # The URLs of a same template are all checked by default
+        traps = TrapDetector()
+        for product in range(2000):
+            self.assertIsNone(traps.detect(
+                'http://localhost/product/%i' % product))
+
+    def test_add_url(self):
+        """Test for the URLs of a trap not checked."""
+        checker = Checker('http://localhost/',
+                          trap_detector=TrapDetector(max_repeats=1))
+
+        self.assertTrue(checker.add_url(
+            'http://localhost/a/b', 'http://localhost/', 'a/b'))
+        self.assertFalse(checker.add_url(
+            'http://localhost/a/b/a/b', 'http://localhost/a/b', 'a/b'))
+        # The URL found again is counted once
+        self.assertFalse(checker.add_url(
+            'http://localhost/a/b/a/b', 'http://localhost/', 'a/b/a/b'))
+
+        self.assertNotIn('http://localhost/a/b/a/b', checker.urls)
+        self.assertEqual(
+            checker.traps.report(),
+            'segment repeated in the path: localhost a\n'
+            '    1 URLs ignored, Eg: http://localhost/a/b/a/b'
+            ' found in http://localhost/a/b')
+
+    def test_foreign_url(self):
+        """Test for the foreign URLs, never in a trap."""
+        checker = Checker('http://localhost/', deep_scan=True)
+
+        self.assertTrue(checker.add_url(
+            'https://example.org/Foo?sid=1', 'http://localhost/',
+            'https://example.org/Foo?sid=1'))
+        self.assertIn('https://example.org/Foo?sid=1', checker.urls)
+        self.assertEqual(checker.traps.suspects, {})
+        self.assertEqual(len(checker.traps.queries), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()